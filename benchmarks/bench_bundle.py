@@ -0,0 +1,56 @@
+"""
+Compares loading the character templates and campaigns by parsing their files
+with loading them from a data bundle, as a freshly started process would.
+
+Run using `python -m benchmarks.bench_bundle`
+"""
+
+import os
+import tempfile
+import time
+from maelstrom.loaders.bundle import DataBundle
+from maelstrom.loaders.campaignloader import JsonFolderCampaignLoader
+from maelstrom.loaders.template_registry import ENEMIES_PATH, STARTERS_PATH, _parse_template_file
+
+LOADS = 2000
+
+class _ParsingBundle(DataBundle):
+    """
+    parses every time, like loading did before bundles
+    """
+
+    def __init__(self):
+        pass
+
+    def load(self, source: str, parse):
+        return parse(source)
+
+    def save(self):
+        pass
+
+def load_all(bundle: DataBundle):
+    bundle.load(STARTERS_PATH, _parse_template_file)
+    bundle.load(ENEMIES_PATH, _parse_template_file)
+    JsonFolderCampaignLoader(bundle).get_all()
+
+def time_loads(make_bundle) -> float:
+    start = time.perf_counter()
+    for _ in range(LOADS):
+        load_all(make_bundle())
+    return (time.perf_counter() - start) / LOADS
+
+def main():
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "data.bundle")
+        bundle = DataBundle(path)
+        load_all(bundle) # build it
+        bundle.save()
+
+        parsing = time_loads(_ParsingBundle)
+        bundled = time_loads(lambda: DataBundle(path))
+
+    print(f'parsing files:    {parsing * 1e6:.0f}us per start')
+    print(f'loading bundle:   {bundled * 1e6:.0f}us per start')
+
+if __name__ == "__main__":
+    main()
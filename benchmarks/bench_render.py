@@ -0,0 +1,107 @@
+"""
+Compares how many frames per second ConsoleUI can draw by clearing the screen
+with a subprocess, as it used to, against drawing with AnsiRenderer.
+
+Frames come from playing the first level of the default campaign, and are
+written to the null device so the terminal's speed doesn't matter. The
+renderer is timed through ConsoleUI with scripted input, so each frame is
+followed by a prompt and the player's typing, as when playing. How often that
+scrolls the terminal, forcing a full redraw, depends on the terminal's height,
+so two heights are timed.
+
+Run using `python -m benchmarks.bench_render`
+"""
+
+import asyncio
+import contextlib
+import dataclasses
+import os
+import subprocess
+import time
+from maelstrom.gameplay.combat import play_level
+from maelstrom.io import AsyncInputChannel, StandardOutputChannel
+from maelstrom.loaders.campaignloader import make_default_campaign_loader
+from maelstrom.loaders.character_loader import EnemyLoader
+from maelstrom.ui import Screen
+from maelstrom.ui_console import ConsoleUI
+from maelstrom.ui_scripted import ScriptedUI
+from maelstrom.util.config import Config
+from maelstrom.util.random import RandomStream
+from benchmarks.bench_stat_cache import make_team
+from maelstrom.util.user import User
+
+SUBPROCESS_FRAMES = 100 # clearing with a subprocess is slow, so draw fewer frames
+RENDERER_PLAYS = 50
+TERMINAL_HEIGHTS = (24, 50)
+
+class RecordingUI(ScriptedUI):
+    def __init__(self):
+        super().__init__(lambda screen: screen.choice.options[0])
+        self.screens = []
+
+    async def display_and_choose(self, screen: Screen) -> any:
+        # screens are changed after being displayed, so keep a copy
+        self.screens.append(dataclasses.replace(
+            screen,
+            left_scoreboard=list(screen.left_scoreboard),
+            right_scoreboard=list(screen.right_scoreboard),
+            body_rows=list(screen.body_rows)
+        ))
+        return await super().display_and_choose(screen)
+
+class TypingInputChannel(AsyncInputChannel):
+    """
+    Always types the first option, which also continues past pages
+    """
+
+    async def read(self) -> str:
+        return "1"
+
+def record_screens() -> list[Screen]:
+    level = make_default_campaign_loader().get_all()[0].get_area(0).levels[0]
+    user = User("Players", make_team("Players", ["lightning", "rain", "wind"], 5))
+    ui = RecordingUI()
+    asyncio.run(play_level(ui, level, user, EnemyLoader(), RandomStream(0)))
+    return ui.screens
+
+def format_frames(screens: list[Screen]) -> list[list[str]]:
+    console = ConsoleUI(Config(keep_output=True))
+    return [frame for screen in screens for frame in console._format_frames(screen)]
+
+def draw_with_subprocess(frames: list[list[str]]) -> float:
+    output = StandardOutputChannel()
+    start = time.perf_counter()
+    for frame in frames:
+        works = subprocess.call("cls", shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        if works != 0:
+            subprocess.call("clear", shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        for row in frame:
+            output.write(row)
+    return len(frames) / (time.perf_counter() - start)
+
+def draw_with_renderer(screens: list[Screen], num_frames: int, lines: int) -> float:
+    console = ConsoleUI(Config(keep_output=False), TypingInputChannel(), StandardOutputChannel())
+    console._renderer._get_terminal_size = lambda: os.terminal_size((80, lines))
+
+    async def play():
+        for _ in range(RENDERER_PLAYS):
+            for screen in screens:
+                await console.display_and_choose(screen)
+
+    start = time.perf_counter()
+    asyncio.run(play())
+    return num_frames * RENDERER_PLAYS / (time.perf_counter() - start)
+
+def main():
+    screens = record_screens()
+    frames = format_frames(screens)
+    with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+        subprocess_fps = draw_with_subprocess((frames * SUBPROCESS_FRAMES)[:SUBPROCESS_FRAMES])
+        renderer_fps = [draw_with_renderer(screens, len(frames), lines) for lines in TERMINAL_HEIGHTS]
+    print(f'{len(frames)} distinct frames')
+    print(f'subprocess clear: {subprocess_fps:.0f} frames/s')
+    for lines, fps in zip(TERMINAL_HEIGHTS, renderer_fps):
+        print(f'AnsiRenderer, {lines} rows: {fps:.0f} frames/s')
+
+if __name__ == "__main__":
+    main()
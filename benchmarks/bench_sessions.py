@@ -0,0 +1,73 @@
+"""
+Runs many scripted games at once on one event loop, and reports how long the
+host took to produce each screen.
+
+Each bot creates a new user, explores the first level of the first area, then
+exits. Run using `python -m benchmarks.bench_sessions [-n sessions]`
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from game import Game
+from maelstrom.loaders.campaignloader import make_default_campaign_loader
+from maelstrom.loaders.character_loader import EnemyLoader
+from maelstrom.loaders.user_repository import UserRepository
+from maelstrom.sessions import SessionHost
+from maelstrom.ui import Screen
+from maelstrom.ui_scripted import ScriptedUI
+
+def make_bot_chooser():
+    explored = False
+    def choose(screen: Screen):
+        nonlocal explored
+        options = screen.choice.options
+        if "New user" in options:
+            return "New user"
+        if "Explore" in options:
+            if explored:
+                return "Exit"
+            explored = True
+            return "Explore"
+        return options[0] # first starter, first level, or first attack
+    return choose
+
+def percentile(ordered: list[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+async def run_sessions(num_sessions: int, users_folder: str) -> tuple[list[ScriptedUI], float]:
+    host = SessionHost()
+    users = UserRepository(users_folder)
+    enemy_loader = EnemyLoader()
+    campaign_loader = make_default_campaign_loader()
+    uis = []
+
+    start = time.perf_counter()
+    for i in range(num_sessions):
+        ui = ScriptedUI(make_bot_chooser(), text=f'bot {i}')
+        uis.append(ui)
+        host.open_session(Game(ui=ui, users=users, enemy_loader=enemy_loader, campaign_loader=campaign_loader))
+    await host.wait_closed()
+    elapsed = time.perf_counter() - start
+
+    if len(host.failures) != 0:
+        raise Exception(f'{len(host.failures)} sessions failed')
+    return (uis, elapsed)
+
+def main():
+    parser = argparse.ArgumentParser(description="load test the session host")
+    parser.add_argument("-n", "--sessions", help="how many sessions to run at once", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as users_folder:
+        uis, elapsed = asyncio.run(run_sessions(args.sessions, users_folder))
+
+    latencies = sorted(latency for ui in uis for latency in ui.screen_latencies)
+    print(f'{args.sessions} sessions, {len(latencies)} screens in {elapsed:.2f}s ({len(latencies) / elapsed:.0f} screens/s)')
+    print(f'screen latency p50: {percentile(latencies, 0.5) * 1000:.3f}ms')
+    print(f'screen latency p99: {percentile(latencies, 0.99) * 1000:.3f}ms')
+    print(f'screen latency max: {latencies[-1] * 1000:.3f}ms')
+
+if __name__ == "__main__":
+    main()
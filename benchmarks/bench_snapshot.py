@@ -0,0 +1,57 @@
+"""
+Compares forking an encounter in progress using snapshots with forking it
+using copy.deepcopy.
+
+Run using `python -m benchmarks.bench_snapshot`
+"""
+
+import copy
+import time
+from maelstrom.dataClasses.team import Team
+from maelstrom.dataClasses.weather import WIND_WEATHER
+from maelstrom.gameplay.headless import begin_team_turn
+from maelstrom.gameplay.snapshot import restore_snapshot, take_snapshot
+from benchmarks.bench_stat_cache import make_team
+
+FORKS = 20000
+DEEPCOPY_FORKS = 1000 # deepcopy is much slower, so use fewer forks
+
+def make_battle() -> tuple[Team, Team]:
+    player_team = make_team("Players", ["lightning", "rain", "wind"], 5)
+    enemy_team = make_team("Enemies", ["hail", "wind", "rain"], 5)
+    player_team.enemyTeam = enemy_team
+    enemy_team.enemyTeam = player_team
+    player_team.init_for_battle()
+    enemy_team.init_for_battle()
+
+    # give everyone some boosts and damage, as they would have mid-battle
+    for team in (player_team, enemy_team):
+        begin_team_turn(team, WIND_WEATHER, [])
+        for member in team.members:
+            member.take_damage(30)
+    return (player_team, enemy_team)
+
+def time_snapshots(teams: tuple[Team, Team]) -> float:
+    start = time.perf_counter()
+    for _ in range(FORKS):
+        snapshot = take_snapshot(teams)
+        restore_snapshot(teams, snapshot)
+    return time.perf_counter() - start
+
+def time_deepcopy(teams: tuple[Team, Team]) -> float:
+    start = time.perf_counter()
+    for _ in range(DEEPCOPY_FORKS):
+        copy.deepcopy(teams)
+    return time.perf_counter() - start
+
+def main():
+    teams = make_battle()
+    snapshot_time = time_snapshots(teams) / FORKS
+    deepcopy_time = time_deepcopy(teams) / DEEPCOPY_FORKS
+    print("forking a 3 versus 3 encounter")
+    print(f'snapshot and restore: {snapshot_time * 1e6:.1f}us each')
+    print(f'copy.deepcopy:        {deepcopy_time * 1e6:.1f}us each')
+    print(f'speedup: {deepcopy_time / snapshot_time:.1f}x')
+
+if __name__ == "__main__":
+    main()
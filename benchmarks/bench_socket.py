@@ -0,0 +1,125 @@
+"""
+Measures how many players one host process can serve over sockets.
+
+The host runs in its own process, serving games through SocketUI on loopback,
+while this process opens many bot connections at once. Each bot creates a new
+user, plays the first level of the first area, then exits. Use --profile to
+see where the host spends its time: serializing screens, building
+scoreboards, or resolving combat.
+
+Run using `python -m benchmarks.bench_socket [-n connections] [--profile]`
+"""
+
+import argparse
+import asyncio
+import cProfile
+import multiprocessing
+import pstats
+import tempfile
+import time
+from game import Game
+from maelstrom.loaders.campaignloader import make_default_campaign_loader
+from maelstrom.loaders.character_loader import EnemyLoader
+from maelstrom.loaders.user_repository import UserRepository
+from maelstrom.ui_socket import encode_message, read_message, start_socket_server
+from benchmarks.bench_sessions import percentile
+
+HOST = "127.0.0.1"
+
+def raise_file_limit():
+    """
+    each connection needs a file descriptor on both ends. Windows has no
+    such limit to raise.
+    """
+    try:
+        import resource # only on POSIX
+    except ImportError:
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+def serve(users_folder: str, ports: multiprocessing.Queue, stop: multiprocessing.Event, profile: bool):
+    raise_file_limit()
+
+    async def run_server():
+        users = UserRepository(users_folder)
+        enemy_loader = EnemyLoader()
+        campaign_loader = make_default_campaign_loader()
+        server = await start_socket_server(
+            lambda ui: Game(ui=ui, users=users, enemy_loader=enemy_loader, campaign_loader=campaign_loader),
+            HOST,
+            backlog=4096
+        )
+        ports.put(server.sockets[0].getsockname()[1])
+        await asyncio.get_running_loop().run_in_executor(None, stop.wait)
+        server.close()
+
+    if profile:
+        profiler = cProfile.Profile()
+        profiler.runcall(asyncio.run, run_server())
+        stats = pstats.Stats(profiler).sort_stats("cumulative")
+        print("host time in serialization, scoreboards, and combat:")
+        stats.print_stats(r"encode_message|read_message|_get_scoreboard_for_team|_handle_choice|\(use\)|get_target_options|game.py:\d+\(__init__\)")
+    else:
+        asyncio.run(run_server())
+
+async def run_bot(port: int, name: str, latencies: list[float]):
+    reader, writer = await asyncio.open_connection(HOST, port)
+    explored = False
+    sent_at = None
+    try:
+        while True:
+            message = await read_message(reader)
+            if sent_at is not None:
+                latencies.append(time.perf_counter() - sent_at)
+
+            reply = dict()
+            if "ask" in message:
+                reply["s"] = name
+            elif "o" in message:
+                options = message["o"]
+                index = 0 # first starter, first level, or first attack
+                if "New user" in options:
+                    index = options.index("New user")
+                elif "Explore" in options:
+                    index = options.index("Exit" if explored else "Explore")
+                    explored = True
+                reply["c"] = index
+            writer.write(encode_message(reply))
+            sent_at = time.perf_counter()
+    except asyncio.IncompleteReadError:
+        pass # the host closes the connection once the game exits
+    finally:
+        writer.close()
+
+async def run_bots(port: int, connections: int) -> tuple[list[float], float]:
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*[run_bot(port, f'bot {i}', latencies) for i in range(connections)])
+    return (latencies, time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser(description="load test SocketUI with bot clients")
+    parser.add_argument("-n", "--connections", help="how many bots to connect at once", type=int, default=1000)
+    parser.add_argument("--profile", help="profile the host", action="store_true")
+    args = parser.parse_args()
+    raise_file_limit()
+
+    with tempfile.TemporaryDirectory() as users_folder:
+        ports = multiprocessing.Queue()
+        stop = multiprocessing.Event()
+        host = multiprocessing.Process(target=serve, args=(users_folder, ports, stop, args.profile))
+        host.start()
+        try:
+            latencies, elapsed = asyncio.run(run_bots(ports.get(), args.connections))
+        finally:
+            stop.set()
+            host.join()
+
+    latencies.sort()
+    print(f'{args.connections} connections, {len(latencies)} screens in {elapsed:.2f}s ({len(latencies) / elapsed:.0f} screens/s)')
+    print(f'round trip p50: {percentile(latencies, 0.5) * 1000:.2f}ms')
+    print(f'round trip p99: {percentile(latencies, 0.99) * 1000:.2f}ms')
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Measures how often Stat values are recomputed during headless encounters,
+compared with how often they are read. Before Stat.get was cached, every read
+was a recomputation.
+
+Run using `python -m benchmarks.bench_stat_cache`
+"""
+
+import random
+import time
+from maelstrom.dataClasses.stat_classes import Stat
+from maelstrom.dataClasses.team import Team
+from maelstrom.dataClasses.weather import WEATHERS
+from maelstrom.gameplay.headless import HeadlessEncounter
+from maelstrom.testing import make_character
+
+ENCOUNTERS = 2000
+
+def make_team(name: str, elements: list[str], level: int) -> Team:
+    return Team(name, [
+        make_character(f'{name} {i}', level, element, control=2, resistance=1, luck=3)
+        for i, element in enumerate(elements)
+    ])
+
+def run_encounters() -> float:
+    random.seed(0)
+    player_team = make_team("Players", ["lightning", "rain", "wind"], 5)
+    enemy_team = make_team("Enemies", ["hail", "wind", "rain"], 5)
+    start = time.perf_counter()
+    for i in range(ENCOUNTERS):
+        HeadlessEncounter(player_team, enemy_team, WEATHERS[i % len(WEATHERS)]).run()
+    return time.perf_counter() - start
+
+def main():
+    counts = {"get": 0, "recompute": 0}
+    cached_get = Stat.get
+    calc_effective = Stat._calc_effective
+
+    def counting_get(self):
+        counts["get"] += 1
+        return cached_get(self)
+
+    def counting_calc_effective(self):
+        counts["recompute"] += 1
+        return calc_effective(self)
+
+    Stat.get = counting_get
+    Stat._calc_effective = counting_calc_effective
+    run_encounters()
+    Stat.get = cached_get
+    Stat._calc_effective = calc_effective
+
+    print(f'{ENCOUNTERS} encounters')
+    print(f'stat reads:          {counts["get"] / ENCOUNTERS:10.1f} per encounter')
+    print(f'stat recomputations: {counts["recompute"] / ENCOUNTERS:10.1f} per encounter')
+    print(f'reads per recompute: {counts["get"] / counts["recompute"]:10.2f}')
+
+    cached_time = run_encounters()
+    Stat.get = calc_effective # every read recomputes, as before caching
+    uncached_time = run_encounters()
+    Stat.get = cached_get
+    print(f'with cache:    {ENCOUNTERS / cached_time:8.0f} encounters/s')
+    print(f'without cache: {ENCOUNTERS / uncached_time:8.0f} encounters/s')
+
+if __name__ == "__main__":
+    main()
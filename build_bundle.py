@@ -0,0 +1,25 @@
+"""
+Parses every character template and campaign file into the data bundle, so
+the game and simulation workers start without parsing them. The bundle is
+also rebuilt automatically whenever a file changes, so running this is
+optional.
+
+Run using `python build_bundle.py`.
+"""
+
+import os
+import time
+from maelstrom.loaders.bundle import DEFAULT_BUNDLE_PATH
+from maelstrom.loaders.campaignloader import JsonFolderCampaignLoader
+from maelstrom.loaders.template_registry import preload_template_registries
+
+def main():
+    start = time.perf_counter()
+    if os.path.exists(DEFAULT_BUNDLE_PATH):
+        os.remove(DEFAULT_BUNDLE_PATH)
+    preload_template_registries()
+    campaigns = JsonFolderCampaignLoader().get_all()
+    print(f'bundled templates and {len(campaigns)} campaigns into {DEFAULT_BUNDLE_PATH} in {time.perf_counter() - start:.3f}s')
+
+if __name__ == "__main__":
+    main()
@@ -3,13 +3,14 @@ from maelstrom.dataClasses.activeAbilities import createDefaultActives
 from maelstrom.dataClasses.character import Character
 from maelstrom.dataClasses.team import Team
 from maelstrom.gameplay.combat import play_level
-from maelstrom.loaders.campaignloader import make_default_campaign_loader
+from maelstrom.loaders.campaignloader import AbstractCampaignLoader, make_default_campaign_loader
 from maelstrom.loaders.character_loader import EnemyLoader
-from maelstrom.loaders.character_template_loader import CharacterTemplateLoader
-from maelstrom.loaders.user_repository import UserRepository
-from maelstrom.ui import Choice, Screen
+from maelstrom.loaders.template_registry import STARTERS_PATH, get_template_registry
+from maelstrom.loaders.user_repository import UserRepository, is_valid_user_name
+from maelstrom.ui import AbstractUserInterface, Choice, Screen
 from maelstrom.ui_console import ConsoleUI
 from maelstrom.util.collections import list_extend
+from maelstrom.util.config import Config
 from maelstrom.util.user import User
 
 """
@@ -17,16 +18,20 @@ The Game class is used to store data on the game the user is currently playing,
 so this way, there don't have to be any globals.
 """
 class Game:
-    def __init__(self):
+    def __init__(self, ui: AbstractUserInterface = None, users: UserRepository = None, config: Config = None, enemy_loader: EnemyLoader = None, campaign_loader: AbstractCampaignLoader = None):
+        """
+        ui defaults to a ConsoleUI using the given config, which defaults to
+        the global config. The other arguments are created if not given, but
+        can be shared between many games.
+        """
         self.user = None
         self.currentArea = None
         self._exit = False
-        self._users = UserRepository()
-        self._starters = CharacterTemplateLoader()
-        self._starters.load_character_template_file("data/character-templates/starters.csv")
-        self.enemy_loader = EnemyLoader()
-        self.campaign_loader = make_default_campaign_loader()
-        self._ui = ConsoleUI()
+        self._users = UserRepository() if users is None else users
+        self._starters = get_template_registry(STARTERS_PATH)
+        self.enemy_loader = EnemyLoader() if enemy_loader is None else enemy_loader
+        self.campaign_loader = make_default_campaign_loader() if campaign_loader is None else campaign_loader
+        self._ui = ConsoleUI(config) if ui is None else ui
 
     def test(self):
         print("nothing to test")
@@ -35,7 +40,7 @@ class Game:
         """
         Begins the program
         """
-        campaign = self.campaign_loader.get_all()[0] # todo current user's campaign
+        campaign = self.campaign_loader.get(self.campaign_loader.get_names()[0]) # todo current user's campaign
         self.currentArea = campaign.get_area(0) # todo player chooses
         while not self._exit:
             if self.user == None:
@@ -64,14 +69,18 @@ class Game:
                 self._handle_login(choice)
 
     async def _handle_new_user(self):
-        user_name = input("What is your name? ") # yuck, input()
-        while user_name in self._users.get_user_names():
+        user_name = await self._ui.read_text("What is your name?")
+        while not is_valid_user_name(user_name) or user_name in self._users.get_user_names():
+            if is_valid_user_name(user_name):
+                error = f'The username {user_name} is already taken.'
+            else:
+                error = "Usernames may only contain letters, numbers, spaces, underscores, and hyphens."
             screen = Screen(
                 title="Error Creating Account",
-                body_rows=[f'The username {user_name} is already taken.']
+                body_rows=[error]
             )
             await self._ui.display_and_choose(screen) 
-            user_name = input("What is your name? ") # yuck, input()
+            user_name = await self._ui.read_text("What is your name?")
         
         screen = Screen(
             title="New User",
@@ -52,9 +52,9 @@ async def main():
     options = get_global_config()
 
     if options.test:
-        Game().test()
+        Game(config=options).test()
     else:
-        await Game().run()
+        await Game(config=options).run()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
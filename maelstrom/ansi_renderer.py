@@ -0,0 +1,92 @@
+"""
+Draws whole frames of text to a terminal using ANSI escape codes, rather than
+clearing the screen by running another program.
+"""
+
+import os
+import shutil
+from typing import Callable
+from maelstrom.io import OutputChannel
+
+_CLEAR_SCREEN = "\x1b[2J"
+_CLEAR_TO_END_OF_LINE = "\x1b[K"
+_CLEAR_TO_END_OF_SCREEN = "\x1b[J"
+
+if os.name == "nt":
+    os.system("") # makes the Windows console understand escape codes
+
+def _move_to_row(row: int) -> str:
+    """
+    row starts at 0
+    """
+    return f'\x1b[{row + 1};1H'
+
+class AnsiRenderer:
+    """
+    Draws frames starting at the top of the terminal. Each frame is written
+    all at once, and only rows which differ from the previous frame are
+    redrawn. Anything written below the previous frame, such as prompts, is
+    cleared.
+
+    Frames must fit in the terminal, otherwise it scrolls and the rows drawn
+    no longer line up with those this remembers. Text below the frame, such
+    as prompts and what the player types, is passed to note_below, so the
+    next frame is redrawn entirely only if that may have scrolled it.
+    """
+
+    def __init__(self, output: OutputChannel, get_terminal_size: Callable[[], os.terminal_size] = shutil.get_terminal_size):
+        self._output = output
+        self._get_terminal_size = get_terminal_size
+        self._previous: list[str] = None
+        self._row = 0
+        """
+        the row the cursor is on, counting from the top of the terminal
+        """
+        self._column = 0
+
+    def render(self, rows: list[str]):
+        parts = []
+        previous = self._previous
+        if previous is None:
+            parts.append(_CLEAR_SCREEN)
+            previous = []
+
+        for i, row in enumerate(rows):
+            if i >= len(previous) or previous[i] != row:
+                parts.append(_move_to_row(i))
+                parts.append(row)
+                parts.append(_CLEAR_TO_END_OF_LINE)
+
+        # clear leftover rows and prompts, then leave the cursor below the frame
+        parts.append(_move_to_row(len(rows)))
+        parts.append(_CLEAR_TO_END_OF_SCREEN)
+
+        self._output.write("".join(parts), end="", flush=True)
+        self._previous = list(rows)
+        self._row = len(rows)
+        self._column = 0
+
+    def note_below(self, text: str):
+        """
+        Records that the given text was written or echoed below the frame.
+        If it moved the cursor past the bottom of the terminal, the terminal
+        scrolled, so the next frame redraws everything.
+        """
+        size = self._get_terminal_size()
+        for i, line in enumerate(text.split("\n")):
+            if i > 0:
+                self._row += 1
+                self._column = 0
+            self._column += len(line)
+            while self._column > size.columns: # wrapped onto the next row
+                self._row += 1
+                self._column -= size.columns
+        if self._row >= size.lines:
+            self.invalidate()
+
+    def invalidate(self):
+        """
+        Makes the next frame redraw everything, such as after something else
+        has written to the terminal
+        """
+        self._previous = None
@@ -11,15 +11,23 @@ active they wish to use.
 """
 
 from maelstrom.dataClasses.character import Character
+from maelstrom.dataClasses.stat_classes import CONTROL, LUCK, RESISTANCE
+from maelstrom.dataClasses.targeting import get_targeting_index
 from maelstrom.gameplay.events import OnHitEvent, HIT_GIVEN_EVENT, HIT_TAKEN_EVENT
 from maelstrom.util.random import rollPercentage
 from maelstrom.dataClasses.elements import ELEMENTS
 from abc import abstractmethod
 import functools
+import random
 
 """
 utility classes
 """
+_HIT_EVENT = OnHitEvent(None, None, None, None, 0)
+"""
+reused for every hit, as listeners may not keep a reference to it
+"""
+
 def dmgAtLv(lv)->int:
     return int(16.67 * (1 + lv * 0.05))
 
@@ -41,23 +49,50 @@ class TargetOption:
     Command design pattern
     """
 
-    def __init__(self, active: "AbstractActive", user: "Character", targets: list[Character]):
+    # options are created for every target each turn, yet most are never chosen
+    __slots__ = ("active", "user", "targets", "_matrix", "_msg", "_totalDamage")
+
+    def __init__(self, active: "AbstractActive", user: "Character", targets: list[Character], matrix: "DamageMatrix" = None):
+        """
+        if a DamageMatrix is given, damage is read from it instead of being
+        calculated for each target.
+
+        msg and totalDamage are not computed until they are first used.
+        """
         self.active = active
         self.user = user
         self.targets = targets
-        self.msg = f'{active.name}->{", ".join([target.name for target in targets])}'
-
+        self._matrix = matrix
+        self._msg = None
+        self._totalDamage = None
+
+    @property
+    def msg(self)->str:
+        if self._msg is None:
+            self._msg = f'{self.active.name}->{", ".join([target.name for target in self.targets])}'
+        return self._msg
+
+    @property
+    def totalDamage(self)->int:
         # this will change when non-damaging actives are introduced
-        self.totalDamage = functools.reduce(lambda total, next: total + next, [
-            active.calcDamageAgainst(user, target) for target in targets
-        ])
+        if self._totalDamage is None:
+            if self._matrix is None:
+                self._totalDamage = functools.reduce(lambda total, next: total + next, [
+                    self.active.calcDamageAgainst(self.user, target) for target in self.targets
+                ])
+            else:
+                self._totalDamage = self._matrix.calcTotalDamage(self.active, self.targets)
+        return self._totalDamage
 
     def __str__(self)->str:
         return self.msg
 
-    def use(self)->str:
+    def use(self, rng = random)->str:
+        """
+        rng is used for all random rolls, see maelstrom.util.random
+        """
         self.user.lose_energy(self.active.cost) # don't call this for each target
-        msgs = [self.active.resolveAgainst(self.user, target) for target in self.targets]
+        msgs = [self.active.resolveAgainst(self.user, target, rng) for target in self.targets]
         return "\n".join(msgs)
 
 """
@@ -65,32 +100,59 @@ data classes
 """
 
 class AbstractActive:
+    """
+    Actives are immutable flyweights shared by every character who has them,
+    so they must not hold any state about a particular use. Use getActive to
+    look them up by name.
+    """
+
+    __slots__ = ("name", "description", "cost")
+
     def __init__(self, name, description, cost):
         """
         name should be a unique identifier
         """
-        self.name = name
-        self.description = f'{name}: {description}'
-        self.cost = cost
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "description", f'{name}: {description}')
+        object.__setattr__(self, "cost", cost)
 
-    @abstractmethod
-    def copy(self):
-        pass
+    def __setattr__(self, name, value):
+        raise AttributeError(f'actives are immutable, so {name} cannot be set')
+
+    def __delattr__(self, name):
+        raise AttributeError(f'actives are immutable, so {name} cannot be deleted')
+
+    # copies and unpickled actives are the shared instance with the same name
+    def __reduce__(self):
+        return (getActive, (self.name,))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     @abstractmethod
-    def resolveAgainst(self, target: "Character")->str:
+    def resolveAgainst(self, user: "Character", target: "Character", rng = random)->str:
         pass
 
     def canUse(self, user: "Character")->bool:
-        return self.cost <= user.energy and len(self.getTargetOptions(user)) > 0
+        return self.cost <= user.energy and self.hasTargetOptions(user)
+
+    def hasTargetOptions(self, user: "Character")->bool:
+        """
+        returns whether getTargetOptions would return anything. Subclasses
+        should override this to check without building any options.
+        """
+        return len(user.team.enemyTeam.membersRemaining) > 0 and len(self.doGetTargetOptions(user)) > 0
 
-    def getTargetOptions(self, user: "Character")->list[TargetOption]:
+    def getTargetOptions(self, user: "Character", matrix: "DamageMatrix" = None)->list[TargetOption]:
         """
         don't override this one
         """
-        if len(user.team.enemyTeam.getMembersRemaining()) == 0:
+        if len(user.team.enemyTeam.membersRemaining) == 0:
             return []
-        return [TargetOption(self, user, targets) for targets in self.doGetTargetOptions(user)]
+        return [TargetOption(self, user, targets, matrix) for targets in self.doGetTargetOptions(user)]
 
     @abstractmethod
     def doGetTargetOptions(self, user: "Character")->list[list[Character]]:
@@ -102,27 +164,42 @@ class AbstractActive:
         """
         pass
 
+    def calcDamageRow(self, user: "Character", resistances: list[float])->list[int]:
+        """
+        returns how much damage this would deal to targets with each of the
+        given resistances. Subclasses which deal damage should override this.
+        """
+        return [0 for _ in resistances]
+
 class AbstractDamagingActive(AbstractActive):
+    __slots__ = ("damageMult", "missChance", "missMult", "critChance", "critMult", "_normalHit", "_missHit", "_critHit")
+
     # not sure if I like so many paramters
     def __init__(self, name, description, cost, damageMult, missChance, missMult, critChance, critMult):
         super().__init__(name, description, cost)
-        self.damageMult = damageMult
-        self.missChance = missChance
-        self.missMult = missMult
-        self.critChance = critChance
-        self.critMult = critMult
-
-    def resolveAgainst(self, user: "Character", target: "Character")->str:
+        object.__setattr__(self, "damageMult", damageMult)
+        object.__setattr__(self, "missChance", missChance)
+        object.__setattr__(self, "missMult", missMult)
+        object.__setattr__(self, "critChance", critChance)
+        object.__setattr__(self, "critMult", critMult)
+
+        # hit types never change, so share them rather than creating one per hit
+        object.__setattr__(self, "_normalHit", HitType(1.0, "")) # don't put a space at the end of the message
+        object.__setattr__(self, "_missHit", HitType(missMult, "A glancing blow! ")) # need space on end
+        object.__setattr__(self, "_critHit", HitType(critMult, "A critical hit! ")) # need space on end
+
+    def resolveAgainst(self, user: "Character", target: "Character", rng = random)->str:
         dmg = self.calcDamageAgainst(user, target)
-        hitType = self.randomHitType(user)
+        hitType = self.randomHitType(user, rng)
         dmg = int(dmg * hitType.multiplier)
 
-        event = OnHitEvent("Attack", user, target, self, dmg)
-
         target.take_damage(dmg)
 
-        target.fire_event_listeners(HIT_TAKEN_EVENT, event)
-        user.fire_event_listeners(HIT_GIVEN_EVENT, event)
+        # most characters have no passives or items, so skip creating an event for them
+        if target.has_event_listeners(HIT_TAKEN_EVENT) or user.has_event_listeners(HIT_GIVEN_EVENT):
+            event = _HIT_EVENT.set("Attack", user, target, self, dmg, rng)
+            target.fire_event_listeners(HIT_TAKEN_EVENT, event)
+            user.fire_event_listeners(HIT_GIVEN_EVENT, event)
 
         return f'{hitType.message}{user.name} struck {target.name} for {dmg} damage using {self.name}!'
 
@@ -132,53 +209,53 @@ class AbstractDamagingActive(AbstractActive):
         """
 
         return int(
-            dmgAtLv(user.level) * self.damageMult * user.get_stat_value("control") / target.get_stat_value("resistance")
+            dmgAtLv(user.level) * self.damageMult * user.get_stat(CONTROL) / target.get_stat(RESISTANCE)
         )
 
-    def randomHitType(self, user: "Character")->"HitType":
+    def calcDamageRow(self, user: "Character", resistances: list[float])->list[int]:
+        """
+        same as calcDamageAgainst, but for many targets at once
+        """
+        scaled = dmgAtLv(user.level) * self.damageMult * user.get_stat(CONTROL)
+        return [int(scaled / resistance) for resistance in resistances]
+
+    def randomHitType(self, user: "Character", rng = random)->"HitType":
         """
         randomly chooses a HitType based on this AbstractDamagingActive's crit
         chance, miss chance, and the user's luck
         """
-        hit = HitType(1.0, "") # don't put a space at the end of the message
-        rng = rollPercentage(user.get_stat_value("luck")) / 100
+        hit = self._normalHit
+        roll = rollPercentage(user.get_stat(LUCK), rng) / 100
 
-        if rng <= self.missChance:
-            hit = HitType(self.missMult, "A glancing blow! ") # need space on end
-        elif rng >= 1.0 - self.critChance:
-            hit = HitType(self.critMult, "A critical hit! ") # need space on end
+        if roll <= self.missChance:
+            hit = self._missHit
+        elif roll >= 1.0 - self.critChance:
+            hit = self._critHit
 
         return hit
 
 
 class MeleeActive(AbstractDamagingActive):
+    __slots__ = ()
+
     # not sure if I like so many paramters
     def __init__(self, name, description, damageMult, missChance, missMult, critChance, critMult):
         super().__init__(name, description, 0, damageMult, missChance, missMult, critChance, critMult)
-        self.damageMult = damageMult
-        self.missChance = missChance
-        self.missMult = missMult
-        self.critChance = critChance
-        self.critMult = critMult
-
-    def copy(self):
-        return MeleeActive(
-            self.name,
-            self.description,
-            self.damageMult,
-            self.missChance,
-            self.missMult,
-            self.critChance,
-            self.critMult
-        )
 
     def doGetTargetOptions(self, user: "Character")->list[list[Character]]:
         """
         MeleeActives can hit a single active target
         """
-        return [[option] for option in getActiveTargets(user.ordinal, user.team.enemyTeam.getMembersRemaining())]
+        enemies = user.team.enemyTeam
+        members = enemies.getMembersRemaining()
+        return [[members[i]] for i in enemies.targetingIndex.active_indices(user.ordinal)]
+
+    def hasTargetOptions(self, user: "Character")->bool:
+        return hasActiveTargets(user.ordinal, len(user.team.enemyTeam.membersRemaining))
 
 class ElementalActive(AbstractDamagingActive):
+    __slots__ = ()
+
     def __init__(self, name):
         super().__init__(
             name,
@@ -191,16 +268,68 @@ class ElementalActive(AbstractDamagingActive):
             1.0
         )
 
-    def copy(self):
-        return ElementalActive(self.name)
-
     def doGetTargetOptions(self, user: "Character")->list[list[Character]]:
         """
         ElementalActives can hit a single cleave target
         """
-        return [[option] for option in getCleaveTargets(user.ordinal, user.team.enemyTeam.getMembersRemaining())]
+        enemies = user.team.enemyTeam
+        members = enemies.getMembersRemaining()
+        return [[members[i]] for i in enemies.targetingIndex.cleave_indices(user.ordinal)]
+
+    def hasTargetOptions(self, user: "Character")->bool:
+        return hasCleaveTargets(user.ordinal, len(user.team.enemyTeam.membersRemaining))
+
 
 
+class DamageMatrix:
+    """
+    a DamageMatrix holds how much damage each of a user's actives would deal
+    to each remaining member of the enemy team, before misses and critical
+    hits. Each stat is read once per character rather than once per pair, and
+    an active's row is not computed until it is first needed.
+    """
+
+    def __init__(self, user: "Character", targets: list[Character]):
+        self.user = user
+        self.targets = targets
+        self._columns = {target: i for i, target in enumerate(targets)}
+        self._resistances = None
+        self._rows = dict()
+
+    def getRow(self, active: AbstractActive)->list[int]:
+        """
+        returns the damage the given active deals to each target, in the same
+        order as this' targets
+        """
+        row = self._rows.get(active)
+        if row is None:
+            if self._resistances is None:
+                self._resistances = [target.get_stat(RESISTANCE) for target in self.targets]
+            row = active.calcDamageRow(self.user, self._resistances)
+            self._rows[active] = row
+        return row
+
+    def getDamage(self, active: AbstractActive, target: Character)->int:
+        return self.getRow(active)[self._columns[target]]
+
+    def calcTotalDamage(self, active: AbstractActive, targets: list[Character])->int:
+        row = self.getRow(active)
+        columns = self._columns
+        return sum(row[columns[target]] for target in targets)
+
+def getTargetOptionsFor(user: "Character", actives: list[AbstractActive])->list[TargetOption]:
+    """
+    lists every TargetOption the given actives give the user, sharing one
+    DamageMatrix between them
+    """
+    targets = user.team.enemyTeam.getMembersRemaining()
+    if len(actives) == 0 or len(targets) == 0:
+        return []
+    matrix = DamageMatrix(user, targets)
+    choices = []
+    for active in actives:
+        choices.extend(active.getTargetOptions(user, matrix))
+    return choices
 
 """
 Use these to decide which enemies to target. Should only allow user to choose
@@ -217,12 +346,7 @@ def getActiveTargets(attackerOrdinal: int, targetTeam: list[Character])->list[Ch
     O X
       X
     """
-    options = []
-    if attackerOrdinal < len(targetTeam):
-        options.append(targetTeam[attackerOrdinal])
-    if attackerOrdinal + 1 < len(targetTeam):
-        options.append(targetTeam[attackerOrdinal + 1])
-    return options
+    return [targetTeam[i] for i in get_targeting_index(len(targetTeam)).active_indices(attackerOrdinal)]
 
 def getCleaveTargets(attackerOrdinal: int, targetTeam: list[Character])->list[Character]:
     """
@@ -232,29 +356,69 @@ def getCleaveTargets(attackerOrdinal: int, targetTeam: list[Character])->list[Ch
     O X
       X
     """
-    options = getActiveTargets(attackerOrdinal, targetTeam)
-    if attackerOrdinal - 1 >= 0 and attackerOrdinal - 1 < len(targetTeam):
-        m = targetTeam[attackerOrdinal - 1]
-        options.insert(0, m)
-    return options
+    return [targetTeam[i] for i in get_targeting_index(len(targetTeam)).cleave_indices(attackerOrdinal)]
+
+def hasActiveTargets(attackerOrdinal: int, numTargets: int)->bool:
+    """
+    same as checking whether getActiveTargets returns anything, but without
+    building a list
+    """
+    return attackerOrdinal < numTargets
+
+def hasCleaveTargets(attackerOrdinal: int, numTargets: int)->bool:
+    """
+    same as checking whether getCleaveTargets returns anything, but without
+    building a list
+    """
+    return attackerOrdinal - 1 < numTargets and numTargets > 0
 
 def getDistantTargets(attackerOrdinal: int, targetTeam: list[Character])->list[Character]:
     """
     the union of distant targets and cleave targets is all enemies, with no
     overlap
     """
-    notTargets = getCleaveTargets(attackerOrdinal, targetTeam)
-    return [member for member in targetTeam if member not in notTargets]
+    return [targetTeam[i] for i in get_targeting_index(len(targetTeam)).distant_indices(attackerOrdinal)]
+
+_ACTIVES_BY_NAME: dict[str, AbstractActive] = dict()
+"""
+every active, interned by name
+"""
+
+def _intern(active: AbstractActive)->AbstractActive:
+    """
+    returns the registered active with the same name as the given one,
+    registering it if there is none
+    """
+    return _ACTIVES_BY_NAME.setdefault(active.name, active)
+
+_UNIVERSAL_ACTIVES = tuple(_intern(active) for active in (
+    MeleeActive("slash", "strike a nearby enemy", 1.0, 0.2, 0.75, 0.2, 1.5),
+    MeleeActive("jab", "strike a nearby enemy, with a high chance for a critical hit", 0.8, 0.1, 0.5, 0.5, 3.0),
+    MeleeActive("slam", "strike recklessly at a nearby enemy", 1.5, 0.4, 0.5, 0.15, 2.0)
+))
+
+def getActive(name: str)->AbstractActive:
+    """
+    returns the shared active with the given name
+    """
+    active = _ACTIVES_BY_NAME.get(name)
+    if active is None:
+        raise Exception(f'no active defined with name "{name}"')
+    return active
 
 def getUniversalActives()->list[AbstractActive]:
-    return [
-        MeleeActive("slash", "strike a nearby enemy", 1.0, 0.2, 0.75, 0.2, 1.5),
-        MeleeActive("jab", "strike a nearby enemy, with a high chance for a critical hit", 0.8, 0.1, 0.5, 0.5, 3.0),
-        MeleeActive("slam", "strike recklessly at a nearby enemy", 1.5, 0.4, 0.5, 0.15, 2.0)
-    ]
+    return list(_UNIVERSAL_ACTIVES)
 
 def getActivesForElement(element)->list[AbstractActive]:
-    return [ElementalActive(f'{element} bolt')]
+    name = f'{element} bolt'
+    active = _ACTIVES_BY_NAME.get(name)
+    if active is None:
+        active = _intern(ElementalActive(name))
+    return [active]
+
+for element in ELEMENTS:
+    getActivesForElement(element)
+getActivesForElement("stone")
 
 def getActiveAbilityList()->list[AbstractActive]:
     options = getUniversalActives()
@@ -264,6 +428,10 @@ def getActiveAbilityList()->list[AbstractActive]:
     return options
 
 def createDefaultActives(element)->list[AbstractActive]:
+    """
+    returns the actives characters of the given element start with. These are
+    shared with every other character, not copied.
+    """
     options = getUniversalActives()
     options.extend(getActivesForElement(element))
-    return [option.copy() for option in options]
\ No newline at end of file
+    return options
@@ -1,18 +1,27 @@
 # TODO fix this in #12 
 # from maelstrom.dataClasses.activeAbilities import AbstractActive, TargetOption
+from collections.abc import Sequence
 from maelstrom.characters.specification import CharacterSpecification
 from maelstrom.characters.template import CharacterTemplate
 from maelstrom.gameplay.events import ActionRegister, UPDATE_EVENT
-from maelstrom.dataClasses.stat_classes import Stat
+from maelstrom.dataClasses.stat_classes import ENERGY, POTENCY, BoostSchedule, Stat, StatName, default_stat_formula, to_stat_name
 from maelstrom.util.stringUtil import entab, lengthOfLongest
 
-_STATS = ("control", "resistance", "potency", "luck", "energy")
+_STATS = tuple(stat.name.lower() for stat in StatName)
 
 class Character:
     """
     A Character is an entity within the game who has various stats and attributes.
     """
 
+    # simulations keep many characters alive at once, so avoid a dict per instance
+    __slots__ = ("name", "element", "_max_hp", "level", "xp", "actives", "stats", "remaining_hp", "energy", "team", "ordinal", "_event_listeners", "_boost_schedule")
+
+    BATTLE_STATE_SIZE = 3
+    """
+    how many values save_battle_state appends
+    """
+
     def __init__(self, template: CharacterTemplate, specification: CharacterSpecification, actives: 'list[AbstractActive]'):
         self.name = template.name
         self.element = template.element
@@ -26,20 +35,43 @@ class Character:
 
         self.actives = actives
         
-        self.stats = {}
-        def _set_stat(name, base):
-            self.stats[name.lower()] = Stat(name, lambda base: 20.0 + float(base), base)
-        _set_stat("control", template.control)
-        _set_stat("resistance", template.resistance)
-        _set_stat("energy", template.energy)
-        _set_stat("potency", template.potency)
-        _set_stat("luck", template.luck)
+        # indexed by StatName
+        bases = (template.control, template.resistance, template.potency, template.luck, template.energy)
+        self.stats = tuple(Stat(name, default_stat_formula, base) for name, base in zip(_STATS, bases))
+        self._boost_schedule = BoostSchedule()
 
         self._calc_stats()
         self.remaining_hp = self._max_hp
 
         self._event_listeners = ActionRegister()
 
+    def clone(self, into: "Character" = None) -> "Character":
+        """
+        Returns a copy of this as it was when constructed, which is much faster
+        than constructing a new Character. If into is given, it is overwritten
+        rather than creating a new Character, reusing its stats.
+        """
+        if into is None:
+            clone = Character.__new__(Character)
+            clone.stats = tuple(stat.clone() for stat in self.stats)
+            clone._boost_schedule = BoostSchedule()
+            clone._event_listeners = ActionRegister()
+        else:
+            clone = into
+            for stat, into_stat in zip(self.stats, clone.stats):
+                stat.clone(into_stat)
+            clone._boost_schedule.clear()
+            clone._event_listeners.clear()
+            clone.team = None # not part of any team until added to one
+        clone.name = self.name
+        clone.element = self.element
+        clone._max_hp = self._max_hp
+        clone.level = self.level
+        clone.xp = self.xp
+        clone.actives = list(self.actives)
+        clone.remaining_hp = self.remaining_hp
+        return clone
+
     def to_specification(self) -> CharacterSpecification:
         """
         Returns a specification from which this Character can be reconstructed.
@@ -63,22 +95,35 @@ class Character:
         # don't need to do anything with actives
 
         self.remaining_hp = self._max_hp
-        self.energy = int(self.get_stat_value("energy") / 2.0)
+        self.energy = int(self.get_stat(ENERGY) / 2.0)
 
     def _calc_stats(self):
         """
         Calculates all this' stats
         """
-        for stat in self.stats.values():
+        for stat in self.stats:
             stat.reset_boosts()
             stat.calc()
+        self._boost_schedule.clear()
+
+    def get_stat(self, stat: StatName) -> float:
+        """
+        Returns the value of the given stat with boosts applied
+        """
+        return self.stats[stat].get()
 
     def get_stat_value(self, statName: str) -> float:
-        return self.stats[statName.lower()].get()
+        """
+        Same as get_stat, but accepts case insensitive names like "control"
+        """
+        return self.stats[to_stat_name(statName)].get()
 
     def add_event_listener(self, enum_type, action):
         self._event_listeners.add_event_listener(enum_type, action)
 
+    def has_event_listeners(self, enum_type) -> bool:
+        return self._event_listeners.has_listeners(enum_type)
+
     def fire_event_listeners(self, enum_type, event=None):
         self._event_listeners.fire(enum_type, event)
 
@@ -116,11 +161,10 @@ class Character:
         use this to find out which enemies this Character can target and with
         which abilities
         """
+        # imported here until #12 is fixed, as activeAbilities imports this module
+        from maelstrom.dataClasses.activeAbilities import getTargetOptionsFor
         useable_actives = [active for active in self.actives if active.canUse(self)]
-        choices = []
-        for active in useable_actives:
-            choices.extend(active.getTargetOptions(self))
-        return choices
+        return getTargetOptionsFor(self, useable_actives)
 
     # TODO add ID checking to prevent doubling up
     def boost(self, boost):
@@ -128,10 +172,12 @@ class Character:
         Increase or lower stats in battle. Returns the boost this receives with its
         potency stat factored in
         """
-        mult = 1 + self.get_stat_value("potency") / 100
+        mult = 1 + self.get_stat(POTENCY) / 100
         boost = boost.copy()
         boost.amount *= mult
-        self.stats[boost.stat_name].boost(boost)
+        stat = self.stats[boost.stat]
+        stat.boost(boost)
+        self._boost_schedule.add(stat, boost)
         return boost
 
     def heal(self, percent):
@@ -139,7 +185,7 @@ class Character:
         Restores HP. Converts an INTEGER to a percentage. Returns the amount of HP
         healed.
         """
-        mult = 1 + self.get_stat_value("potency") / 100
+        mult = 1 + self.get_stat(POTENCY) / 100
         healing = self._max_hp * (float(percent) / 100) * mult
         self.remaining_hp = int(self.remaining_hp + healing)
 
@@ -152,7 +198,7 @@ class Character:
         """
         returns the actual amount of damage inflicted
         """
-        mult = 1 - self.get_stat_value("potency") / 100
+        mult = 1 - self.get_stat(POTENCY) / 100
         harming = self._max_hp * (float(percent) / 100)
         amount = int(harming * mult)
         self.take_damage(amount)
@@ -167,12 +213,12 @@ class Character:
         """
         Returns the amount of energy gained
         """
-        mult = 1 + self.get_stat_value("potency") / 100
+        mult = 1 + self.get_stat(POTENCY) / 100
         amount = int(amount * mult)
         self.energy += amount
 
-        if self.energy > self.get_stat_value("energy"):
-            self.energy = self.get_stat_value("energy")
+        if self.energy > self.get_stat(ENERGY):
+            self.energy = self.get_stat(ENERGY)
 
         self.energy = int(self.energy)
 
@@ -185,9 +231,32 @@ class Character:
 
     def update(self):
         self.fire_event_listeners(UPDATE_EVENT, self)
-        self.gain_energy(self.get_stat_value("energy") * 0.15)
-        for stat in self.stats.values():
-            stat.update()
+        self.gain_energy(self.get_stat(ENERGY) * 0.15)
+        self._boost_schedule.advance()
+
+    def save_battle_state(self, values: list[float]) -> tuple:
+        """
+        Appends this' in-battle state to the given flat list of values, and
+        returns a tuple of the boosts it refers to. Both are needed by
+        restore_battle_state.
+        """
+        values.append(self.remaining_hp)
+        values.append(self.energy)
+        values.append(self.ordinal)
+        return (tuple(tuple(stat.boosts) for stat in self.stats), self._boost_schedule.save())
+
+    def restore_battle_state(self, values: Sequence[float], offset: int, refs: tuple):
+        """
+        Restores the state saved by save_battle_state, whose values begin at the
+        given offset
+        """
+        self.remaining_hp = int(values[offset])
+        self.energy = int(values[offset + 1])
+        self.ordinal = int(values[offset + 2])
+        boosts, schedule = refs
+        for stat, stat_boosts in zip(self.stats, boosts):
+            stat.restore_boosts(stat_boosts)
+        self._boost_schedule.restore(schedule)
 
     def is_koed(self):
         return self.remaining_hp <= 0
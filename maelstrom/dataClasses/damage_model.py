@@ -0,0 +1,94 @@
+"""
+This module calculates exactly how much damage actives deal on average,
+including misses and critical hits, rather than estimating it by sampling.
+
+AbstractDamagingActive.randomHitType rolls a whole number between the user's
+luck and 100. Low enough rolls miss, high enough rolls critically hit, and the
+rest hit normally. As there are at most 101 rolls, the chance of each outcome
+is found by counting the rolls which produce it.
+"""
+
+from dataclasses import dataclass
+from maelstrom.dataClasses.activeAbilities import AbstractActive, AbstractDamagingActive
+from maelstrom.dataClasses.character import Character
+from maelstrom.dataClasses.stat_classes import LUCK
+
+@dataclass(frozen=True)
+class HitOutcome:
+    """
+    One way a hit can turn out
+    """
+
+    probability: float
+
+    multiplier: float
+    """
+    what the hit's damage is multiplied by
+    """
+
+    roll: int
+    """
+    one of the rolls which produces this outcome
+    """
+
+@dataclass(frozen=True)
+class DamageEstimate:
+    mean: float
+    variance: float
+
+_OUTCOMES: dict[tuple[AbstractDamagingActive, int], tuple[HitOutcome, ...]] = dict()
+
+def get_hit_outcomes(active: AbstractDamagingActive, luck: float) -> tuple[HitOutcome, ...]:
+    """
+    Returns the ways a hit using the given active can turn out for a user with
+    the given luck, in the order miss, normal, critical. Outcomes which cannot
+    happen are left out.
+
+    Results are cached for each active and whole number of luck, as the roll
+    ignores the fractional part of luck. Actives are shared, so there are only
+    a few of them.
+    """
+    luck = int(luck)
+    key = (active, luck)
+    outcomes = _OUTCOMES.get(key)
+    if outcomes is None:
+        outcomes = _calc_hit_outcomes(active, luck)
+        _OUTCOMES[key] = outcomes
+    return outcomes
+
+def _calc_hit_outcomes(active: AbstractDamagingActive, luck: int) -> tuple[HitOutcome, ...]:
+    misses = []
+    normals = []
+    crits = []
+    rolls = range(luck, 101)
+    for roll in rolls:
+        # same checks as randomHitType
+        if roll / 100 <= active.missChance:
+            misses.append(roll)
+        elif roll / 100 >= 1.0 - active.critChance:
+            crits.append(roll)
+        else:
+            normals.append(roll)
+
+    return tuple(
+        HitOutcome(len(outcome) / len(rolls), multiplier, outcome[0])
+        for outcome, multiplier in ((misses, active.missMult), (normals, 1.0), (crits, active.critMult))
+        if len(outcome) != 0
+    )
+
+def estimate_damage(active: AbstractActive, user: Character, target: Character) -> DamageEstimate:
+    """
+    Returns the exact mean and variance of the damage the given active deals
+    when the given user hits the given target
+    """
+    if not isinstance(active, AbstractDamagingActive):
+        return DamageEstimate(0.0, 0.0)
+
+    base = active.calcDamageAgainst(user, target)
+    mean = 0.0
+    mean_of_squares = 0.0
+    for outcome in get_hit_outcomes(active, user.get_stat(LUCK)):
+        damage = int(base * outcome.multiplier) # truncated like resolveAgainst
+        mean += outcome.probability * damage
+        mean_of_squares += outcome.probability * damage * damage
+    return DamageEstimate(mean, max(0.0, mean_of_squares - mean * mean))
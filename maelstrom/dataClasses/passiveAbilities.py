@@ -4,7 +4,7 @@ condition is met, such as when a character is hit or reaches a certain threshold
 of health
 """
 
-from maelstrom.dataClasses.stat_classes import Boost
+from maelstrom.dataClasses.stat_classes import Boost, LUCK
 from maelstrom.util.random import rollPercentage
 from maelstrom.dataClasses.elements import ELEMENTS
 from maelstrom.gameplay.events import HIT_GIVEN_EVENT, HIT_TAKEN_EVENT, UPDATE_EVENT
@@ -72,7 +72,7 @@ class OnHitGivenPassive(AbstractPassive):
         user.add_event_listener(HIT_GIVEN_EVENT, self.checkTrigger)
 
     def checkTrigger(self, onHitEvent):
-        if rollPercentage(onHitEvent.hitter.get_stat_value("luck")) > 100 - self.chance * 100:
+        if rollPercentage(onHitEvent.hitter.get_stat(LUCK), onHitEvent.rng) > 100 - self.chance * 100:
             if self.targetsUser:
                 onHitEvent.hitter.boost(self.boost.copy())
             else:
@@ -98,7 +98,7 @@ class OnHitTakenPassive(AbstractPassive):
         user.add_event_listener(HIT_TAKEN_EVENT, self.checkTrigger)
 
     def checkTrigger(self, onHitEvent):
-        if rollPercentage(onHitEvent.hitee.get_stat_value("luck")) > 100 - self.chance * 100:
+        if rollPercentage(onHitEvent.hitee.get_stat(LUCK), onHitEvent.rng) > 100 - self.chance * 100:
             if self.targetsUser:
                 onHitEvent.hitee.boost(self.boost.copy())
             else:
@@ -1,5 +1,49 @@
+from enum import IntEnum
+from heapq import heappop, heappush
 from maelstrom.dataClasses.elements import *
 
+class StatName(IntEnum):
+    """
+    Identifies one of a Character's stats.
+    Characters keep their stats in a tuple indexed by these.
+    """
+
+    CONTROL = 0
+    RESISTANCE = 1
+    POTENCY = 2
+    LUCK = 3
+    ENERGY = 4
+
+# module level aliases, as looking up members on an Enum class is slow
+CONTROL = StatName.CONTROL
+RESISTANCE = StatName.RESISTANCE
+POTENCY = StatName.POTENCY
+LUCK = StatName.LUCK
+ENERGY = StatName.ENERGY
+
+_STRING_TO_STAT_NAME = {stat.name.lower(): stat for stat in StatName}
+
+def to_stat_name(name: "str|StatName") -> StatName:
+    """
+    Converts a case insensitive stat name such as "control" to a StatName.
+    Raises a KeyError if no such stat exists.
+    """
+    if isinstance(name, StatName):
+        return name
+    stat = _STRING_TO_STAT_NAME.get(name)
+    if stat is None:
+        stat = _STRING_TO_STAT_NAME[name.lower()]
+    return stat
+
+def default_stat_formula(base: int) -> float:
+    """
+    The formula characters use to convert a stat's base to its value
+    """
+    return 20.0 + float(base)
+
+def _describe_base(base: int) -> str:
+    return f'base {base}'
+
 class Stat:
     """
     A class used to store
@@ -7,7 +51,10 @@ class Stat:
     making it easier to keep
     track of values
     """
-    def __init__(self, name, formula, base: int, min_base = -10, max_base = 10, description = lambda base: f'base {base}'):
+
+    __slots__ = ("name", "formula", "boosts", "max_base", "min_base", "description", "base", "value", "_effective")
+
+    def __init__(self, name, formula, base: int, min_base = -10, max_base = 10, description = _describe_base):
         """
         Creates a new stat.
         Forumula is a function that takes an integer as a parameter,
@@ -29,8 +76,9 @@ class Stat:
         self.min_base = min_base
         self.description = description
 
-        self.set_base(base)
         self.value = None
+        self._effective = None # cached result of get, None when stale
+        self.set_base(base)
 
     def calc(self):
         """
@@ -39,6 +87,7 @@ class Stat:
         Note that this does not return anything
         """
         self.value = self.formula(self.base)
+        self._effective = None
 
 
     def is_max(self) -> bool:
@@ -58,9 +107,24 @@ class Stat:
 
 
     def boost(self, boost):
+        """
+        Boosts must not have their amount changed after being added.
+        Note that boosts added here never expire unless they are also given to
+        a BoostSchedule.
+        """
         self.boosts.append(boost)
+        self._effective = None
 
     def get(self):
+        """
+        Returns this' value with all boosts applied. The result is cached until
+        this' base or boosts change.
+        """
+        if self._effective is None:
+            self._effective = self._calc_effective()
+        return self._effective
+
+    def _calc_effective(self) -> float:
         mult = 1.0
         if self.value is None:
             self.calc()
@@ -74,6 +138,7 @@ class Stat:
         Sets this' base to the given value
         """
         self.base = base
+        self._effective = None
 
     def get_base(self) -> int:
         """
@@ -84,42 +149,72 @@ class Stat:
 
     def reset_boosts(self):
         self.boosts = []
+        self._effective = None
 
-    def update(self):
-        new_boosts = []
-        for boost in self.boosts:
-            """
-            a stat boost with a duration
-            of 1 will be checked, then
-            down to 0, while a duration
-            of -1 will always fail the
-            check; thus, lasting forever
-            """
-            if boost.duration != 0:
-                new_boosts.append(boost)
-                boost.duration -= 1
-        self.boosts = new_boosts
+    def restore_boosts(self, boosts: tuple):
+        """
+        Replaces this' boosts with the given ones, such as those saved in a
+        snapshot
+        """
+        self.boosts = list(boosts)
+        self._effective = None
+
+    def clone(self, into: "Stat" = None) -> "Stat":
+        """
+        Returns a copy of this without any boosts. If into is given, it is
+        overwritten rather than creating a new Stat.
+        """
+        clone = Stat.__new__(Stat) if into is None else into
+        clone.name = self.name
+        clone.formula = self.formula
+        clone.boosts = []
+        clone.max_base = self.max_base
+        clone.min_base = self.min_base
+        clone.description = self.description
+        clone.base = self.base
+        clone.value = self.value
+        clone._effective = None
+        return clone
+
+    def remove_boost(self, boost):
+        """
+        Removes the given boost, if this has it
+        """
+        try:
+            self.boosts.remove(boost)
+            self._effective = None
+        except ValueError:
+            pass # already removed by reset_boosts
 
     def toString(self):
         return self.description(self.base)
 
 class Boost(object):
+    __slots__ = ("stat", "stat_name", "amount", "base_duration", "id")
+
     def __init__(self, stat_name, amount, duration, id = "NoIDSet"):
-        self.stat_name = stat_name
+        """
+        stat_name can be either a string or a StatName.
+        duration is how many turns this lasts once added, or negative to last
+        forever. BoostSchedule removes boosts once it runs out, so it is never
+        counted down.
+        """
+        self.stat = to_stat_name(stat_name)
+        self.stat_name = self.stat.name.lower()
         self.amount = amount
         if abs(self.amount) > 1.0:
             self.amount = float(self.amount) / 100
         self.base_duration = duration
-        self.duration = duration
         self.id = id
 
-    def reset(self):
-        self.duration = self.base_duration
-
     def getDisplayData(self)->str:
+        """
+        Describes this as it is when added, so its duration is the full one
+        rather than how many turns remain
+        """
         ret = f'+{int(self.amount * 100)}% {self.stat_name}'
-        if self.duration > 0:
-            ret += f' for {self.duration} turns'
+        if self.base_duration > 0:
+            ret += f' for {self.base_duration} turns'
         return ret
 
     """
@@ -127,3 +222,59 @@ class Boost(object):
     """
     def copy(self)->"Boost":
         return Boost(self.stat_name, self.amount, self.base_duration, self.id)
+
+class BoostSchedule:
+    """
+    Removes boosts from their stats once their duration runs out.
+
+    Each call to advance counts as one update. A boost with a duration of N
+    lasts for N more updates after the one in which it is added, while a boost
+    with a negative duration lasts forever. Boosts are kept in a heap ordered
+    by the update in which they expire, so each update only costs as much as
+    the boosts expiring during it.
+    """
+
+    __slots__ = ("tick", "_heap", "_added")
+
+    def __init__(self):
+        self.tick = 0
+        """
+        how many times this has advanced
+        """
+
+        self._heap = []
+        self._added = 0 # breaks ties between boosts expiring on the same tick
+
+    def add(self, stat: Stat, boost: Boost):
+        """
+        Schedules the given boost to be removed from the given stat
+        """
+        if boost.base_duration >= 0:
+            heappush(self._heap, (self.tick + boost.base_duration + 1, self._added, stat, boost))
+            self._added += 1
+
+    def advance(self):
+        """
+        Moves to the next update, removing every boost which expires
+        """
+        self.tick += 1
+        heap = self._heap
+        while len(heap) > 0 and heap[0][0] <= self.tick:
+            _, _, stat, boost = heappop(heap)
+            stat.remove_boost(boost)
+
+    def save(self) -> tuple:
+        """
+        Returns this' state, which restore can later return it to. Boosts are
+        never changed after being scheduled, so they are shared rather than
+        copied.
+        """
+        return (self.tick, self._added, tuple(self._heap))
+
+    def restore(self, state: tuple):
+        self.tick, self._added, heap = state
+        self._heap = list(heap)
+
+    def clear(self):
+        self.tick = 0
+        self._heap.clear()
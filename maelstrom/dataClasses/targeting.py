@@ -0,0 +1,66 @@
+"""
+This module precomputes which members of a team each attacker can target.
+
+Who an attacker can target depends only on their ordinal and how many members
+the targeted team has remaining, so the indices of those members are computed
+once per team size and shared by every team of that size. Teams look up a new
+TargetingIndex only when one of their members is removed.
+"""
+
+class TargetingIndex:
+    """
+    Holds, for every attacker ordinal, the indices of the 'active', 'cleave',
+    and 'distant' targets within a team of the given size.
+    See maelstrom.dataClasses.activeAbilities for what each of these mean.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+
+        # every attacker at or beyond this ordinal targets the same members
+        self._last_ordinal = size + 1
+        ordinals = range(0, self._last_ordinal + 1)
+        self._active = tuple(_calc_active_indices(ordinal, size) for ordinal in ordinals)
+        self._cleave = tuple(_calc_cleave_indices(ordinal, size) for ordinal in ordinals)
+        self._distant = tuple(
+            tuple(i for i in range(size) if i not in cleave) for cleave in self._cleave
+        )
+
+    def active_indices(self, attacker_ordinal: int) -> tuple[int, ...]:
+        return self._active[self._clamp(attacker_ordinal)]
+
+    def cleave_indices(self, attacker_ordinal: int) -> tuple[int, ...]:
+        return self._cleave[self._clamp(attacker_ordinal)]
+
+    def distant_indices(self, attacker_ordinal: int) -> tuple[int, ...]:
+        return self._distant[self._clamp(attacker_ordinal)]
+
+    def _clamp(self, attacker_ordinal: int) -> int:
+        return attacker_ordinal if attacker_ordinal < self._last_ordinal else self._last_ordinal
+
+_INDICES_BY_SIZE: dict[int, TargetingIndex] = dict()
+
+def get_targeting_index(size: int) -> TargetingIndex:
+    """
+    Returns the TargetingIndex for a team with the given number of members
+    remaining, building it the first time it is requested
+    """
+    index = _INDICES_BY_SIZE.get(size)
+    if index is None:
+        index = TargetingIndex(size)
+        _INDICES_BY_SIZE[size] = index
+    return index
+
+def _calc_active_indices(attacker_ordinal: int, size: int) -> tuple[int, ...]:
+    indices = []
+    if attacker_ordinal < size:
+        indices.append(attacker_ordinal)
+    if attacker_ordinal + 1 < size:
+        indices.append(attacker_ordinal + 1)
+    return tuple(indices)
+
+def _calc_cleave_indices(attacker_ordinal: int, size: int) -> tuple[int, ...]:
+    indices = list(_calc_active_indices(attacker_ordinal, size))
+    if attacker_ordinal - 1 >= 0 and attacker_ordinal - 1 < size:
+        indices.insert(0, attacker_ordinal - 1)
+    return tuple(indices)
@@ -4,6 +4,7 @@ This module handles teams - collections of Characters
 
 from typing import Callable
 from maelstrom.dataClasses.character import Character
+from maelstrom.dataClasses.targeting import TargetingIndex, get_targeting_index
 import functools
 
 class Team:
@@ -15,6 +16,11 @@ class Team:
         self.name = name
         self.members = []
         self.membersRemaining = []
+        self._membersRemainingView = tuple()
+        self.targetingIndex: TargetingIndex = get_targeting_index(0)
+        """
+        who attackers can target on this team, given how many members remain
+        """
         for member in members:
             self.addMember(member)
 
@@ -27,6 +33,7 @@ class Team:
         member.team = self
         self.members.append(member)
         self.membersRemaining.append(member)
+        self._membersRemainingChanged()
 
     def getXpGiven(self)->int:
         """
@@ -50,11 +57,12 @@ class Team:
         for member in self.membersRemaining:
             consumer(member)
 
-    def getMembersRemaining(self)->list[Character]:
+    def getMembersRemaining(self)->tuple[Character, ...]:
         """
-        returns a shallow copy of this Team's remaining members
+        returns this Team's remaining members as a tuple, which is only
+        rebuilt when a member is removed
         """
-        return [member for member in self.membersRemaining]
+        return self._membersRemainingView
 
     def init_for_battle(self):
         """
@@ -64,6 +72,7 @@ class Team:
         for member in self.members: # can't use lambda with "each" here
             member.init_for_battle()
             self.membersRemaining.append(member)
+        self._membersRemainingChanged()
         self.updateMembersRemaining() # updates ordinals
 
     def isDefeated(self)->bool:
@@ -82,6 +91,20 @@ class Team:
                 member.ordinal = nextOrdinal
                 nextOrdinal += 1
                 member.update()
-        self.membersRemaining = newList
+        if len(newList) != len(self.membersRemaining):
+            self.membersRemaining = newList
+            self._membersRemainingChanged()
 
         return msgs
+
+    def restoreMembersRemaining(self, membersRemaining: list[Character]):
+        """
+        sets which members remain, such as when restoring a snapshot
+        """
+        if membersRemaining != self.membersRemaining:
+            self.membersRemaining = membersRemaining
+            self._membersRemainingChanged()
+
+    def _membersRemainingChanged(self):
+        self._membersRemainingView = tuple(self.membersRemaining)
+        self.targetingIndex = get_targeting_index(len(self.membersRemaining))
@@ -1,4 +1,8 @@
-from maelstrom.dataClasses.activeAbilities import getActiveTargets, getCleaveTargets, getDistantTargets
+from maelstrom.dataClasses.activeAbilities import DamageMatrix, createDefaultActives, getActive, getActiveTargets, getCleaveTargets, getDistantTargets, hasActiveTargets, hasCleaveTargets
+from maelstrom.dataClasses.team import Team
+from maelstrom.testing import make_character
+import copy
+import pickle
 import unittest
 
 class TestTargettingSystem(unittest.TestCase): 
@@ -22,5 +26,60 @@ class TestTargettingSystem(unittest.TestCase):
         self.assertTrue(getDistantTargets(3, targetTeam) == [0, 1])
         self.assertTrue(getDistantTargets(4, targetTeam) == [0, 1, 2])
 
+    def test_has_targets(self):
+        for size in range(0, 5):
+            targetTeam = list(range(size))
+            for ordinal in range(0, 6):
+                self.assertEqual(len(getActiveTargets(ordinal, targetTeam)) > 0, hasActiveTargets(ordinal, size))
+                self.assertEqual(len(getCleaveTargets(ordinal, targetTeam)) > 0, hasCleaveTargets(ordinal, size))
+
+class TestDamageMatrix(unittest.TestCase):
+    def test_matches_calcDamageAgainst(self):
+        user = make_character("user", 5, "rain", control=7)
+        targets = [
+            make_character("a", 1, "wind", resistance=-10),
+            make_character("b", 3, "hail", resistance=4)
+        ]
+        Team("Users", [user])
+        Team("Targets", targets)
+
+        sut = DamageMatrix(user, targets)
+
+        for active in user.actives:
+            for target in targets:
+                self.assertEqual(active.calcDamageAgainst(user, target), sut.getDamage(active, target))
+            self.assertEqual(
+                active.calcDamageAgainst(user, targets[0]) + active.calcDamageAgainst(user, targets[1]),
+                sut.calcTotalDamage(active, targets)
+            )
+
+class TestSharedActives(unittest.TestCase):
+    def test_actives_are_shared(self):
+        wind = createDefaultActives("wind")
+        rain = createDefaultActives("rain")
+
+        for a, b in zip(wind[:3], rain[:3]):
+            self.assertIs(a, b)
+        self.assertIs(getActive("wind bolt"), wind[3])
+
+    def test_actives_are_immutable(self):
+        slash = getActive("slash")
+
+        with self.assertRaises(AttributeError):
+            slash.damageMult = 100
+
+    def test_description_named_once(self):
+        self.assertEqual("slash: strike a nearby enemy", getActive("slash").description)
+
+    def test_copies_share_actives(self):
+        character = make_character("foo")
+
+        copies = [copy.deepcopy(character), pickle.loads(pickle.dumps(character))]
+
+        for copied in copies:
+            self.assertIsNot(character, copied)
+            for original, active in zip(character.actives, copied.actives):
+                self.assertIs(original, active)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,24 @@
+import unittest
+from maelstrom.dataClasses.stat_classes import StatName
+from maelstrom.testing import make_character
+
+class TestCharacter(unittest.TestCase):
+    def setUp(self):
+        self.sut = make_character("foo", control=3, luck=-2)
+
+    def test_stat_names_agree(self):
+        for stat in StatName:
+            self.assertEqual(self.sut.get_stat(stat), self.sut.get_stat_value(stat.name.lower()))
+        self.assertEqual(23.0, self.sut.get_stat_value("Control"))
+        self.assertEqual(self.sut.get_stat_value(StatName.CONTROL), self.sut.get_stat_value("control"))
+
+    def test_unknown_stat(self):
+        with self.assertRaises(KeyError):
+            self.sut.get_stat_value("charisma")
+
+    def test_no_new_attributes(self):
+        with self.assertRaises(AttributeError):
+            self.sut.mana = 10
+
+if __name__ == "__main__":
+    unittest.main()
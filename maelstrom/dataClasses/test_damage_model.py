@@ -0,0 +1,54 @@
+import unittest
+from maelstrom.dataClasses.activeAbilities import createDefaultActives
+from maelstrom.dataClasses.damage_model import estimate_damage, get_hit_outcomes
+from maelstrom.dataClasses.stat_classes import LUCK
+from maelstrom.dataClasses.team import Team
+from maelstrom.testing import make_character
+
+class FixedRoll:
+    def __init__(self, roll: int):
+        self.roll = roll
+
+    def randint(self, a: int, b: int) -> int:
+        return self.roll
+
+class TestDamageModel(unittest.TestCase):
+    def test_hit_outcomes(self):
+        slash = createDefaultActives("wind")[0] # 20% miss, 20% crit
+
+        actual = get_hit_outcomes(slash, 20.9)
+
+        self.assertEqual([1 / 81, 59 / 81, 21 / 81], [outcome.probability for outcome in actual])
+        self.assertEqual([0.75, 1.0, 1.5], [outcome.multiplier for outcome in actual])
+        self.assertIs(actual, get_hit_outcomes(slash, 20))
+
+    def test_leaves_out_impossible_outcomes(self):
+        bolt = createDefaultActives("wind")[3] # never misses, and only "crits" for 1.0x on a 100
+
+        actual = get_hit_outcomes(bolt, 20)
+
+        self.assertEqual([80 / 81, 1 / 81], [outcome.probability for outcome in actual])
+        self.assertEqual([1.0, 1.0], [outcome.multiplier for outcome in actual])
+
+    def test_matches_every_roll(self):
+        user = make_character("user", 4, control=3, luck=5)
+        target = make_character("target", 4, control=3)
+        Team("a", [user]).enemyTeam = Team("b", [target])
+        luck = int(user.get_stat(LUCK))
+
+        for active in user.actives:
+            damages = []
+            for roll in range(luck, 101):
+                target.remaining_hp = 100
+                active.resolveAgainst(user, target, FixedRoll(roll))
+                damages.append(100 - target.remaining_hp)
+            expected_mean = sum(damages) / len(damages)
+            expected_variance = sum((d - expected_mean) ** 2 for d in damages) / len(damages)
+
+            actual = estimate_damage(active, user, target)
+
+            self.assertAlmostEqual(expected_mean, actual.mean)
+            self.assertAlmostEqual(expected_variance, actual.variance)
+
+if __name__ == "__main__":
+    unittest.main()
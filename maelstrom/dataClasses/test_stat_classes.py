@@ -0,0 +1,81 @@
+import unittest
+from maelstrom.dataClasses.stat_classes import CONTROL, Boost, BoostSchedule, Stat, default_stat_formula
+from maelstrom.testing import make_character
+
+class TestBoostSchedule(unittest.TestCase):
+    def test_boosts_expire_after_their_duration(self):
+        stat = Stat("control", default_stat_formula, 0)
+        sut = BoostSchedule()
+        short = Boost("control", 0.5, 0)
+        long = Boost("control", 0.25, 2)
+        forever = Boost("control", 0.1, -1)
+        for boost in (short, long, forever):
+            stat.boost(boost)
+            sut.add(stat, boost)
+
+        expected = [
+            [long, forever],
+            [long, forever],
+            [forever],
+            [forever]
+        ]
+        for boosts in expected:
+            sut.advance()
+            self.assertEqual(boosts, stat.boosts)
+
+    def test_value_reflects_expired_boosts(self):
+        stat = Stat("control", default_stat_formula, 0)
+        sut = BoostSchedule()
+        boost = Boost("control", 0.5, 0)
+        stat.boost(boost)
+        sut.add(stat, boost)
+        self.assertEqual(30.0, stat.get())
+
+        sut.advance()
+
+        self.assertEqual(20.0, stat.get())
+
+class TestBoost(unittest.TestCase):
+    def test_display_shows_full_duration(self):
+        stat = Stat("control", default_stat_formula, 0)
+        schedule = BoostSchedule()
+        sut = Boost("control", 0.25, 3)
+        stat.boost(sut)
+        schedule.add(stat, sut)
+
+        schedule.advance()
+
+        self.assertEqual("+25% control for 3 turns", sut.getDisplayData())
+        self.assertEqual("+25% control", Boost("control", 0.25, -1).getDisplayData())
+
+class TestStatCache(unittest.TestCase):
+    def test_updates_after_boost(self):
+        sut = Stat("control", default_stat_formula, 0)
+        self.assertEqual(20.0, sut.get())
+
+        sut.boost(Boost("control", 0.5, -1))
+
+        self.assertEqual(30.0, sut.get())
+
+    def test_updates_after_base_change(self):
+        sut = Stat("control", default_stat_formula, 0)
+        self.assertEqual(20.0, sut.get())
+
+        sut.set_base(5)
+        sut.calc()
+
+        self.assertEqual(25.0, sut.get())
+
+    def test_updates_after_level_up(self):
+        character = make_character("foo")
+        character.boost(Boost("control", 0.5, -1))
+        boosted = character.get_stat(CONTROL)
+
+        character.gain_xp(character.level * 10)
+
+        self.assertEqual(2, character.level)
+        self.assertLess(character.get_stat(CONTROL), boosted)
+        self.assertEqual(20.0, character.get_stat(CONTROL))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,12 +3,15 @@ This module handles combat gameplay. This separates the data classes from the
 functions that act on their data, preventing classes from become cumbersome
 """
 
-from functools import reduce
 from maelstrom.campaign.level import Level
 from maelstrom.dataClasses.character import Character
 from maelstrom.dataClasses.activeAbilities import TargetOption
 from maelstrom.dataClasses.team import Team
 from maelstrom.dataClasses.weather import WEATHERS, Weather
+from maelstrom.gameplay.headless import begin_team_turn
+from maelstrom.gameplay.policies import AbstractPolicy, GreedyPolicy
+from maelstrom.gameplay.replay import ReplayRecorder
+from maelstrom.gameplay.snapshot import Snapshot, restore_snapshot, take_snapshot
 from maelstrom.loaders.character_loader import EnemyLoader
 from maelstrom.ui import AbstractUserInterface, Choice, Screen
 from maelstrom.util.stringUtil import lengthOfLongest
@@ -16,21 +19,27 @@ from maelstrom.util.user import User
 
 import random
 
-async def play_level(ui: AbstractUserInterface, level: Level, user: User, enemyLoader: EnemyLoader):
+async def play_level(ui: AbstractUserInterface, level: Level, user: User, enemyLoader: EnemyLoader, rng = random, recorder: ReplayRecorder = None):
     """
-    used to start and run a Level
+    used to start and run a Level.
+    rng is used for all random rolls, see maelstrom.util.random
+    recorder, if given, records the encounter, see maelstrom.gameplay.replay
     """
 
-    enemies = [enemyLoader.load(enemyName) for enemyName in level.enemy_names]
-    for enemy in enemies:
-        enemy.level = level.enemy_level
+    enemies = [enemyLoader.load(enemyName, level.enemy_level) for enemyName in level.enemy_names]
+    try:
+        await _play_level_with(ui, level, user, enemies, rng, recorder)
+    finally:
+        enemyLoader.release(enemies)
+
+async def _play_level_with(ui: AbstractUserInterface, level: Level, user: User, enemies: list[Character], rng, recorder: ReplayRecorder):
     enemy_team = Team("Enemy Team", enemies)
     enemy_team.init_for_battle()
 
     player_team = user.team
     player_team.init_for_battle()
 
-    weather = random.choice(WEATHERS)
+    weather = rng.choice(WEATHERS)
     
     # display start of encounter
     body_messages = []
@@ -47,19 +56,27 @@ async def play_level(ui: AbstractUserInterface, level: Level, user: User, enemyL
     )
     await ui.display_and_choose(screen) 
 
-    await Encounter(ui, level, player_team, enemy_team, weather).run()
+    await Encounter(ui, level, player_team, enemy_team, weather, rng=rng, recorder=recorder).run()
 
 class Encounter:
     """
     An encounter handles team versus team conflict.
     """
 
-    def __init__(self, ui: AbstractUserInterface, level: Level, player_team: Team, enemy_team: Team, weather: Weather):
+    def __init__(self, ui: AbstractUserInterface, level: Level, player_team: Team, enemy_team: Team, weather: Weather, enemy_policy: AbstractPolicy = None, rng = random, recorder: ReplayRecorder = None):
+        """
+        enemy_policy decides what the enemy team does, and defaults to GreedyPolicy.
+        rng is used for all random rolls, see maelstrom.util.random
+        recorder, if given, records the encounter, see maelstrom.gameplay.replay
+        """
         self._ui = ui
         self._level = level
         self._player_team = player_team
         self._enemy_team = enemy_team
         self._weather = weather
+        self._enemy_policy = GreedyPolicy() if enemy_policy is None else enemy_policy
+        self._rng = rng
+        self._recorder = recorder
 
     async def run(self):
         """
@@ -70,25 +87,53 @@ class Encounter:
         self._enemy_team.enemyTeam = self._player_team
         self._player_team.init_for_battle()
         self._enemy_team.init_for_battle()
+        self._enemy_policy.begin_encounter(self._weather)
+        if self._recorder is not None:
+            self._recorder.begin(self._player_team, self._enemy_team, self._weather, self._rng)
         
+        winner = None
+        turns = 0
         while not self._is_over():
-            await self._team_turn(self._enemy_team, self._player_team)
-            await self._team_turn(self._player_team, self._enemy_team)
+            if await self._team_turn(self._enemy_team, self._player_team):
+                winner = self._enemy_team
+            elif await self._team_turn(self._player_team, self._enemy_team):
+                winner = self._player_team
+            turns += 1
+
+        # record the final state before XP is given, as leveling up heals
+        if self._recorder is not None:
+            self._recorder.finish(turns)
+        if winner is not None:
+            await self._handle_team_win(winner)
 
         self._player_team.enemyTeam = None
         self._enemy_team.enemyTeam = None
 
+    def snapshot(self) -> Snapshot:
+        """
+        Saves the state of both teams, so it can be restored later
+        """
+        return take_snapshot((self._player_team, self._enemy_team))
+
+    def restore(self, snapshot: Snapshot):
+        """
+        Returns both teams to the state they were in when the given snapshot
+        was taken by this encounter
+        """
+        restore_snapshot((self._player_team, self._enemy_team), snapshot)
+
     def _is_over(self) -> bool:
         return self._player_team.isDefeated() or self._enemy_team.isDefeated()
 
-    async def _team_turn(self, attacking_team: Team, defending_team: Team):
+    async def _team_turn(self, attacking_team: Team, defending_team: Team) -> bool:
+        """
+        Returns whether the attacking team won during their turn
+        """
         if attacking_team.isDefeated():
-            return
+            return False
 
         messages = []
-        messages.extend(attacking_team.updateMembersRemaining())
-        self._weather.applyEffect(attacking_team.membersRemaining, messages)
-        messages.extend(attacking_team.updateMembersRemaining())
+        begin_team_turn(attacking_team, self._weather, messages)
 
         for member in attacking_team.membersRemaining:
             options = member.get_target_options()
@@ -110,17 +155,19 @@ class Encounter:
                     choice = await self._ui.display_and_choose(screen)
                 else:
                     screen.choice = None
-                    choice = reduce(lambda i, j: i if i.totalDamage > j.totalDamage else j, options)
+                    choice = self._enemy_policy.choose(member, options)
+                if self._recorder is not None:
+                    self._recorder.record_choice(member, choice)
                 await self._handle_choice(screen, attacking_team, defending_team, choice)
         
             if attacking_team.enemyTeam.isDefeated():
-                await self._handle_team_win(attacking_team)
-                return # stop, stop, stop, he's already dead!
+                return True # stop, stop, stop, he's already dead!
+        return False
 
     async def _handle_choice(self, screen: Screen, attacking_team: Team, defending_team: Team, choice: TargetOption):
         screen.choice = None
         
-        choice_message = choice.use()
+        choice_message = choice.use(self._rng)
         screen.body_rows.append(choice_message)
         member_messages = defending_team.updateMembersRemaining()
         screen.body_rows.extend(member_messages)
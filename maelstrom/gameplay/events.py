@@ -1,4 +1,5 @@
 from maelstrom.dataClasses.elements import *
+import random
 
 HIT_GIVEN_EVENT = 0
 HIT_TAKEN_EVENT = 1
@@ -6,6 +7,10 @@ UPDATE_EVENT = 2 # should accept an Character as an argument
 
 EVENT_TYPES = (HIT_GIVEN_EVENT, HIT_TAKEN_EVENT, UPDATE_EVENT)
 
+_ALL_EVENTS_MASK = 0
+for _enum_type in EVENT_TYPES:
+    _ALL_EVENTS_MASK |= 1 << _enum_type
+
 """
 Action registers are used to
 hold functions which should be
@@ -16,26 +21,37 @@ extention of AbstractEvent as
 a paramter
 """
 class ActionRegister:
+    __slots__ = ("actions", "mask")
+
     def __init__(self):
-        self.actions = {enum_type : [] for enum_type in EVENT_TYPES}
+        # indexed by event type
+        self.actions = tuple([] for _ in EVENT_TYPES)
+        # bit N is set when event type N has listeners, so firing an event
+        # nobody listens for costs a single check
+        self.mask = 0
 
     # no more duration nonsense
     def add_event_listener(self, enum_type, action):
         if enum_type in EVENT_TYPES:
             self.actions[enum_type].append(action)
+            self.mask |= 1 << enum_type
         else:
             raise Exception("Unsupported event type: {0}. Must be one of {1}".format(enum_type, EVENT_TYPES))
 
+    def has_listeners(self, enum_type) -> bool:
+        return self.mask & (1 << enum_type) != 0
+
     def fire(self, enum_type, event=None):
-        if enum_type in EVENT_TYPES:
+        if self.mask & (1 << enum_type):
             for action in self.actions[enum_type]:
                 action(event)
-        else:
+        elif not _ALL_EVENTS_MASK & (1 << enum_type):
             raise Exception("Unsupported event type: {0}. Must be one of {1}".format(enum_type, EVENT_TYPES))
 
     def clear(self):
-        for value in self.actions.values():
+        for value in self.actions:
             value.clear()
+        self.mask = 0
 
 
 """
@@ -44,12 +60,28 @@ battle whenever one character
 hits another. The event is then
 passed in to all of the hitter's
 onHitGiven functions and all of
-the hitee's onHitTaken functions
+the hitee's onHitTaken functions.
+Listeners should use the event's
+rng for any random rolls.
+
+The same OnHitEvent may be reused
+for many hits, so listeners must
+not keep a reference to it.
 """
 class OnHitEvent:
-    def __init__(self, id, hitter, hitee, hit_by, damage):
+    __slots__ = ("id", "hitter", "hitee", "hit_by", "damage", "rng")
+
+    def __init__(self, id, hitter, hitee, hit_by, damage, rng = random):
+        self.set(id, hitter, hitee, hit_by, damage, rng)
+
+    def set(self, id, hitter, hitee, hit_by, damage, rng = random) -> "OnHitEvent":
+        """
+        Overwrites this event with the details of a new hit, then returns it
+        """
         self.id = id
         self.hitter = hitter
         self.hitee = hitee
         self.hit_by = hit_by
         self.damage = damage
+        self.rng = rng
+        return self
@@ -0,0 +1,163 @@
+"""
+This module resolves encounters without a user interface, so batch jobs such
+as balance testing can run many battles quickly. Both teams are driven by
+policies, and the encounter follows the same rules as
+maelstrom.gameplay.combat.Encounter.
+"""
+
+from dataclasses import dataclass
+import random
+from typing import Optional
+from maelstrom.dataClasses.team import Team
+from maelstrom.dataClasses.weather import Weather
+from maelstrom.gameplay.policies import AbstractPolicy, GreedyPolicy
+from maelstrom.gameplay.snapshot import Snapshot, restore_snapshot, take_snapshot
+
+MAX_TURNS = 1000
+"""
+The default number of turns after which a headless encounter gives up, as
+some match-ups, such as weak attackers in the rain, never end.
+"""
+
+@dataclass(frozen=True)
+class EncounterResult:
+    """
+    A compact summary of how a headless encounter played out
+    """
+
+    winner: Optional[str]
+    """
+    The name of the winning team, or None if the encounter ran out of turns
+    """
+
+    player_won: bool
+
+    turns: int
+    """
+    How many rounds were played. Each round gives both teams a turn.
+    """
+
+    player_hp_remaining: int
+
+    enemy_hp_remaining: int
+
+    player_damage_dealt: int
+    """
+    Total HP the player team took from their targets
+    """
+
+    enemy_damage_dealt: int
+    """
+    Total HP the enemy team took from their targets
+    """
+
+def begin_team_turn(attacking_team: Team, weather: Weather, messages: list[str]):
+    """
+    Applies everything that happens at the start of a team's turn, before its
+    members act. Appends messages describing what happened.
+    """
+    messages.extend(attacking_team.updateMembersRemaining())
+    weather.applyEffect(attacking_team.membersRemaining, messages)
+    messages.extend(attacking_team.updateMembersRemaining())
+
+class HeadlessEncounter:
+    """
+    Handles team versus team conflict without displaying anything
+    """
+
+    def __init__(self, player_team: Team, enemy_team: Team, weather: Weather, player_policy: AbstractPolicy = None, enemy_policy: AbstractPolicy = None, max_turns: int = MAX_TURNS, rng = random, recorder: 'ReplayRecorder' = None):
+        """
+        Both policies default to GreedyPolicy.
+        rng is used for all random rolls, see maelstrom.util.random
+        recorder, if given, records the encounter, see maelstrom.gameplay.replay
+        """
+        self._player_team = player_team
+        self._enemy_team = enemy_team
+        self._weather = weather
+        self._player_policy = GreedyPolicy() if player_policy is None else player_policy
+        self._enemy_policy = GreedyPolicy() if enemy_policy is None else enemy_policy
+        self._max_turns = max_turns
+        self._rng = rng
+        self._recorder = recorder
+
+    def run(self) -> EncounterResult:
+        """
+        Runs the encounter until one team wins or the turn limit is reached
+        """
+
+        self._player_team.enemyTeam = self._enemy_team
+        self._enemy_team.enemyTeam = self._player_team
+        self._player_team.init_for_battle()
+        self._enemy_team.init_for_battle()
+        self._player_policy.begin_encounter(self._weather)
+        self._enemy_policy.begin_encounter(self._weather)
+        if self._recorder is not None:
+            self._recorder.begin(self._player_team, self._enemy_team, self._weather, self._rng, self._max_turns)
+
+        damage_dealt = {id(self._player_team): 0, id(self._enemy_team): 0}
+        turns = 0
+        while not self._is_over() and turns < self._max_turns:
+            self._team_turn(self._enemy_team, self._enemy_policy, damage_dealt)
+            self._team_turn(self._player_team, self._player_policy, damage_dealt)
+            turns += 1
+
+        if self._recorder is not None:
+            self._recorder.finish(turns)
+        self._player_team.enemyTeam = None
+        self._enemy_team.enemyTeam = None
+
+        winner = None
+        if self._enemy_team.isDefeated():
+            winner = self._player_team.name
+        elif self._player_team.isDefeated():
+            winner = self._enemy_team.name
+
+        return EncounterResult(
+            winner=winner,
+            player_won=self._enemy_team.isDefeated(),
+            turns=turns,
+            player_hp_remaining=_hp_remaining(self._player_team),
+            enemy_hp_remaining=_hp_remaining(self._enemy_team),
+            player_damage_dealt=damage_dealt[id(self._player_team)],
+            enemy_damage_dealt=damage_dealt[id(self._enemy_team)]
+        )
+
+    def snapshot(self) -> Snapshot:
+        """
+        Saves the state of both teams, so it can be restored later
+        """
+        return take_snapshot((self._player_team, self._enemy_team))
+
+    def restore(self, snapshot: Snapshot):
+        """
+        Returns both teams to the state they were in when the given snapshot
+        was taken by this encounter
+        """
+        restore_snapshot((self._player_team, self._enemy_team), snapshot)
+
+    def _is_over(self) -> bool:
+        return self._player_team.isDefeated() or self._enemy_team.isDefeated()
+
+    def _team_turn(self, attacking_team: Team, policy: AbstractPolicy, damage_dealt: dict[int, int]):
+        if attacking_team.isDefeated():
+            return
+
+        defending_team = attacking_team.enemyTeam
+        begin_team_turn(attacking_team, self._weather, [])
+
+        for member in attacking_team.membersRemaining:
+            options = member.get_target_options()
+            if len(options) != 0:
+                choice = policy.choose(member, options)
+                if self._recorder is not None:
+                    self._recorder.record_choice(member, choice)
+                hp_before = sum(target.remaining_hp for target in choice.targets)
+                choice.use(self._rng)
+                damage_dealt[id(attacking_team)] += hp_before - sum(target.remaining_hp for target in choice.targets)
+                defending_team.updateMembersRemaining()
+
+            if defending_team.isDefeated():
+                return
+
+def _hp_remaining(team: Team) -> int:
+    return sum(member.remaining_hp for member in team.membersRemaining)
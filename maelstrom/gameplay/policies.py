@@ -0,0 +1,40 @@
+"""
+Policies decide which TargetOption a Character uses on their turn when no
+player is choosing for them, such as for enemy teams or simulated battles.
+"""
+
+from abc import ABC, abstractmethod
+from functools import reduce
+from maelstrom.dataClasses.activeAbilities import TargetOption
+from maelstrom.dataClasses.character import Character
+from maelstrom.dataClasses.weather import Weather
+
+class AbstractPolicy(ABC):
+    """
+    Chooses one of a Character's TargetOptions.
+    Subclasses must override the `choose` method.
+    """
+
+    def begin_encounter(self, weather: Weather):
+        """
+        Called when an encounter using this policy begins.
+        Subclasses can override this to learn about the encounter.
+        """
+        pass
+
+    @abstractmethod
+    def choose(self, member: Character, options: list[TargetOption]) -> TargetOption:
+        """
+        Returns the option the given member should use.
+        options is never empty.
+        """
+        pass
+
+class GreedyPolicy(AbstractPolicy):
+    """
+    Chooses whichever option deals the most damage, ignoring misses and
+    critical hits.
+    """
+
+    def choose(self, member: Character, options: list[TargetOption]) -> TargetOption:
+        return reduce(lambda i, j: i if i.totalDamage > j.totalDamage else j, options)
@@ -0,0 +1,384 @@
+"""
+This module records encounters as compact binary replays, and replays them
+headlessly to check they end the same way.
+
+A replay holds the key of the RandomStream the encounter used and how far
+into it the encounter began, such as after the weather was chosen from it, the
+weather,
+both teams as they were when the encounter started, and every choice made as
+small integers. Since the random stream can be recreated from its key, that
+is all it takes to play the encounter again.
+
+Binary format, all little-endian:
+* header: b"MRPL", version (u8)
+* RandomStream key: length (u8), then each part (i64)
+* RandomStream block size (u32) and position at the start (u64)
+* weather index (u8), turn limit (u32, 0 for none)
+* each team: name, member count (u8), then for each member:
+  name, element, level (u16), stat bases (5 x i16), active count (u8),
+  active names
+* choice count (u32), then for each choice:
+  actor (u8: high bit set for the enemy team, the rest is their ordinal),
+  active index (u8), target count (u8), target ordinals (u8 each)
+* turns played (u32), then remaining HP of every member (i16 each), player
+  team first
+Strings are stored as their UTF-8 length (u8) followed by the UTF-8 bytes.
+"""
+
+from dataclasses import dataclass
+import struct
+from maelstrom.characters.specification import CharacterSpecification
+from maelstrom.characters.template import CharacterTemplate
+from maelstrom.dataClasses.activeAbilities import TargetOption
+from maelstrom.dataClasses.character import Character
+from maelstrom.dataClasses.team import Team
+from maelstrom.dataClasses.weather import WEATHERS, Weather
+from maelstrom.gameplay.headless import EncounterResult, HeadlessEncounter
+from maelstrom.gameplay.policies import AbstractPolicy
+from maelstrom.loaders.character_loader import load_active
+from maelstrom.util.random import RandomStream
+
+MAGIC = b"MRPL"
+VERSION = 2
+_ENEMY_BIT = 0x80
+
+@dataclass(frozen=True)
+class MemberRecord:
+    """
+    Everything needed to rebuild a Character as they were at the start of an
+    encounter
+    """
+
+    name: str
+    element: str
+    level: int
+
+    bases: tuple[int, ...]
+    """
+    stat bases, in StatName order
+    """
+
+    active_names: tuple[str, ...]
+
+@dataclass(frozen=True)
+class TeamRecord:
+    name: str
+    members: tuple[MemberRecord, ...]
+
+@dataclass(frozen=True)
+class ChoiceRecord:
+    """
+    A choice one member made on their turn
+    """
+
+    is_enemy: bool
+    ordinal: int
+
+    active_index: int
+    """
+    index of the chosen active in the member's actives
+    """
+
+    target_ordinals: tuple[int, ...]
+
+@dataclass(frozen=True)
+class Replay:
+    rng_key: tuple[int, ...]
+    rng_block_size: int
+
+    rng_position: int
+    """
+    how many numbers had been drawn from the RandomStream when the encounter
+    began
+    """
+
+    weather_index: int
+
+    max_turns: int
+    """
+    the encounter's turn limit, or 0 if it had none
+    """
+
+    player_team: TeamRecord
+    enemy_team: TeamRecord
+    choices: tuple[ChoiceRecord, ...]
+    turns: int
+
+    final_hp: tuple[int, ...]
+    """
+    remaining HP of each player team member, followed by each enemy team member
+    """
+
+class ReplayMismatchError(Exception):
+    """
+    Raised when replaying an encounter does not end the way it was recorded
+    """
+    pass
+
+class ReplayRecorder:
+    """
+    Pass one of these to an Encounter or HeadlessEncounter to record it.
+    Recording requires the encounter to use a RandomStream.
+    """
+
+    def __init__(self):
+        self._rng_key = None
+        self._rng_block_size = 0
+        self._rng_position = 0
+        self._weather_index = 0
+        self._max_turns = 0
+        self._player_team = None
+        self._enemy_team = None
+        self._player_record = None
+        self._enemy_record = None
+        self._choices = []
+        self._replay = None
+
+    def begin(self, player_team: Team, enemy_team: Team, weather: Weather, rng: RandomStream, max_turns: int = 0):
+        """
+        Called once both teams are ready for battle
+        """
+        if not isinstance(rng, RandomStream):
+            raise ValueError("encounters must use a RandomStream to be recorded")
+        self._rng_key = rng.key
+        self._rng_block_size = rng.block_size
+        self._rng_position = rng.position
+        self._weather_index = WEATHERS.index(weather)
+        self._max_turns = max_turns
+        self._player_team = player_team
+        self._enemy_team = enemy_team
+        self._player_record = _record_team(player_team)
+        self._enemy_record = _record_team(enemy_team)
+        self._choices = []
+        self._replay = None
+
+    def record_choice(self, member: Character, choice: TargetOption):
+        self._choices.append(ChoiceRecord(
+            is_enemy=member.team is self._enemy_team,
+            ordinal=member.ordinal,
+            active_index=member.actives.index(choice.active),
+            target_ordinals=tuple(target.ordinal for target in choice.targets)
+        ))
+
+    def finish(self, turns: int):
+        """
+        Called once the encounter is over
+        """
+        self._replay = Replay(
+            rng_key=self._rng_key,
+            rng_block_size=self._rng_block_size,
+            rng_position=self._rng_position,
+            weather_index=self._weather_index,
+            max_turns=self._max_turns,
+            player_team=self._player_record,
+            enemy_team=self._enemy_record,
+            choices=tuple(self._choices),
+            turns=turns,
+            final_hp=_final_hp(self._player_team, self._enemy_team)
+        )
+
+    def get_replay(self) -> Replay:
+        if self._replay is None:
+            raise Exception("cannot get a replay before the encounter has finished")
+        return self._replay
+
+def encode_replay(replay: Replay) -> bytes:
+    parts = [
+        struct.pack("<4sBB", MAGIC, VERSION, len(replay.rng_key)),
+        struct.pack(f'<{len(replay.rng_key)}q', *replay.rng_key),
+        struct.pack("<IQ", replay.rng_block_size, replay.rng_position),
+        struct.pack("<BI", replay.weather_index, replay.max_turns)
+    ]
+    for team in (replay.player_team, replay.enemy_team):
+        _pack_team(team, parts)
+
+    parts.append(struct.pack("<I", len(replay.choices)))
+    for choice in replay.choices:
+        actor = (_ENEMY_BIT if choice.is_enemy else 0) | choice.ordinal
+        parts.append(struct.pack(
+            f'<BBB{len(choice.target_ordinals)}B',
+            actor,
+            choice.active_index,
+            len(choice.target_ordinals),
+            *choice.target_ordinals
+        ))
+
+    parts.append(struct.pack(f'<I{len(replay.final_hp)}h', replay.turns, *replay.final_hp))
+    return b"".join(parts)
+
+def decode_replay(data: bytes) -> Replay:
+    reader = _Reader(data)
+    magic, version, key_length = reader.read("<4sBB")
+    if magic != MAGIC:
+        raise ValueError("not a Maelstrom replay")
+    if version != VERSION:
+        raise ValueError(f'unsupported replay version: {version}')
+    rng_key = reader.read(f'<{key_length}q')
+    rng_block_size, rng_position = reader.read("<IQ")
+    weather_index, max_turns = reader.read("<BI")
+    player_team = _unpack_team(reader)
+    enemy_team = _unpack_team(reader)
+
+    (num_choices,) = reader.read("<I")
+    choices = []
+    for _ in range(num_choices):
+        actor, active_index, num_targets = reader.read("<BBB")
+        choices.append(ChoiceRecord(
+            is_enemy=(actor & _ENEMY_BIT) != 0,
+            ordinal=actor & ~_ENEMY_BIT,
+            active_index=active_index,
+            target_ordinals=reader.read(f'<{num_targets}B')
+        ))
+
+    num_members = len(player_team.members) + len(enemy_team.members)
+    (turns,) = reader.read("<I")
+    final_hp = reader.read(f'<{num_members}h')
+
+    return Replay(
+        rng_key=rng_key,
+        rng_block_size=rng_block_size,
+        rng_position=rng_position,
+        weather_index=weather_index,
+        max_turns=max_turns,
+        player_team=player_team,
+        enemy_team=enemy_team,
+        choices=tuple(choices),
+        turns=turns,
+        final_hp=final_hp
+    )
+
+def write_replay(path: str, replay: Replay):
+    with open(path, "wb") as file:
+        file.write(encode_replay(replay))
+
+def read_replay(path: str) -> Replay:
+    with open(path, "rb") as file:
+        return decode_replay(file.read())
+
+def replay(recorded: Replay) -> EncounterResult:
+    """
+    Plays the recorded encounter again without a user interface, then raises
+    a ReplayMismatchError if it did not end the way it was recorded
+    """
+    player_team = _rebuild_team(recorded.player_team)
+    enemy_team = _rebuild_team(recorded.enemy_team)
+    choices = iter(recorded.choices)
+    max_turns = recorded.max_turns if recorded.max_turns != 0 else recorded.turns + 1
+    rng = RandomStream(*recorded.rng_key, block_size=recorded.rng_block_size)
+    rng.seek(recorded.rng_position)
+
+    result = HeadlessEncounter(
+        player_team,
+        enemy_team,
+        WEATHERS[recorded.weather_index],
+        player_policy=_ScriptedPolicy(choices, False),
+        enemy_policy=_ScriptedPolicy(choices, True),
+        max_turns=max_turns,
+        rng=rng
+    ).run()
+
+    leftover = next(choices, None)
+    if leftover is not None:
+        raise ReplayMismatchError(f'encounter ended before choice {leftover} was made')
+    if result.turns != recorded.turns:
+        raise ReplayMismatchError(f'expected {recorded.turns} turns, but took {result.turns}')
+    final_hp = _final_hp(player_team, enemy_team)
+    if final_hp != recorded.final_hp:
+        raise ReplayMismatchError(f'expected final HP {recorded.final_hp}, but got {final_hp}')
+    return result
+
+class _ScriptedPolicy(AbstractPolicy):
+    """
+    Makes the choices one side made in a replay
+    """
+
+    def __init__(self, choices, is_enemy: bool):
+        self._choices = choices
+        self._is_enemy = is_enemy
+
+    def choose(self, member: Character, options: list[TargetOption]) -> TargetOption:
+        choice = next(self._choices, None)
+        if choice is None:
+            raise ReplayMismatchError(f'{member.name} needed to choose, but the replay has no choices left')
+        if choice.is_enemy != self._is_enemy or choice.ordinal != member.ordinal:
+            raise ReplayMismatchError(f'expected {choice} to be made, but it was {member.name}\'s turn')
+        targets = member.team.enemyTeam.getMembersRemaining()
+        if choice.active_index >= len(member.actives) or any(ordinal >= len(targets) for ordinal in choice.target_ordinals):
+            raise ReplayMismatchError(f'{member.name} cannot make {choice}')
+        return TargetOption(
+            member.actives[choice.active_index],
+            member,
+            [targets[ordinal] for ordinal in choice.target_ordinals]
+        )
+
+class _Reader:
+    def __init__(self, data: bytes):
+        self._data = data
+        self._offset = 0
+
+    def read(self, format: str) -> tuple:
+        values = struct.unpack_from(format, self._data, self._offset)
+        self._offset += struct.calcsize(format)
+        return values
+
+    def read_str(self) -> str:
+        (length,) = self.read("<B")
+        (encoded,) = self.read(f'<{length}s')
+        return encoded.decode("utf-8")
+
+def _pack_str(value: str, parts: list[bytes]):
+    encoded = value.encode("utf-8")
+    parts.append(struct.pack(f'<B{len(encoded)}s', len(encoded), encoded))
+
+def _pack_team(team: TeamRecord, parts: list[bytes]):
+    _pack_str(team.name, parts)
+    parts.append(struct.pack("<B", len(team.members)))
+    for member in team.members:
+        _pack_str(member.name, parts)
+        _pack_str(member.element, parts)
+        parts.append(struct.pack("<H5hB", member.level, *member.bases, len(member.active_names)))
+        for active_name in member.active_names:
+            _pack_str(active_name, parts)
+
+def _unpack_team(reader: _Reader) -> TeamRecord:
+    name = reader.read_str()
+    (num_members,) = reader.read("<B")
+    members = []
+    for _ in range(num_members):
+        member_name = reader.read_str()
+        element = reader.read_str()
+        level, *bases, num_actives = reader.read("<H5hB")
+        members.append(MemberRecord(
+            name=member_name,
+            element=element,
+            level=level,
+            bases=tuple(bases),
+            active_names=tuple(reader.read_str() for _ in range(num_actives))
+        ))
+    return TeamRecord(name, tuple(members))
+
+def _record_team(team: Team) -> TeamRecord:
+    return TeamRecord(team.name, tuple(
+        MemberRecord(
+            name=member.name,
+            element=member.element,
+            level=member.level,
+            bases=tuple(stat.get_base() for stat in member.stats),
+            active_names=tuple(active.name for active in member.actives)
+        )
+        for member in team.members
+    ))
+
+def _rebuild_team(record: TeamRecord) -> Team:
+    members = []
+    for member in record.members:
+        control, resistance, potency, luck, energy = member.bases
+        members.append(Character(
+            template=CharacterTemplate(member.name, member.element, control, resistance, potency, luck, energy),
+            specification=CharacterSpecification(name=member.name, level=member.level),
+            actives=[load_active(name) for name in member.active_names]
+        ))
+    return Team(record.name, members)
+
+def _final_hp(player_team: Team, enemy_team: Team) -> tuple[int, ...]:
+    return tuple(member.remaining_hp for member in player_team.members + enemy_team.members)
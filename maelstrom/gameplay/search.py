@@ -0,0 +1,221 @@
+"""
+This module contains a policy which looks ahead before choosing, by searching
+the turns to come from a snapshot of the encounter.
+
+The search is an expectiminimax: the searching team picks whichever option
+gives it the best outcome, its opponents are assumed to pick whatever is worst
+for it, and every hit is averaged over whether it misses, hits normally, or
+critically hits. Rolls are forced to each of these outcomes in turn, so the
+encounter's own random numbers are never used by the search.
+"""
+
+from itertools import product
+import time
+from typing import Callable
+from maelstrom.dataClasses.activeAbilities import AbstractDamagingActive, TargetOption
+from maelstrom.dataClasses.character import Character
+from maelstrom.dataClasses.damage_model import HitOutcome, get_hit_outcomes
+from maelstrom.dataClasses.stat_classes import LUCK
+from maelstrom.dataClasses.team import Team
+from maelstrom.dataClasses.weather import NO_WEATHER, Weather
+from maelstrom.gameplay.headless import begin_team_turn
+from maelstrom.gameplay.policies import AbstractPolicy, GreedyPolicy
+from maelstrom.gameplay.snapshot import Snapshot, restore_snapshot, take_snapshot
+from maelstrom.util.random import RandomStream
+
+WIN_VALUE = 100000.0
+"""
+how much winning is worth, compared to each point of HP
+"""
+
+MEMBER_VALUE = 50.0
+"""
+how much each member remaining is worth, compared to each point of HP. This
+makes the search prefer finishing off targets over spreading damage out.
+"""
+
+_NO_ROLL = (HitOutcome(1.0, 1.0, 50),)
+"""
+used for actives which do not roll for their hit type
+"""
+
+class _OutOfTime(Exception):
+    pass
+
+class _FixedRolls:
+    """
+    Stands in for an rng, returning the given rolls in order so the outcome of
+    each hit is known in advance. Any rolls after those, such as by passives
+    triggered by the hit, come from a RandomStream with the given key, so the
+    same state is always searched the same way.
+    """
+
+    def __init__(self, rolls: tuple[int, ...], *key: int):
+        self._rolls = rolls
+        self._next = 0
+        self._key = key
+        self._fallback: RandomStream = None
+
+    def randint(self, a: int, b: int) -> int:
+        if self._next < len(self._rolls):
+            roll = self._rolls[self._next]
+            self._next += 1
+            return roll
+        if self._fallback is None:
+            self._fallback = RandomStream(*self._key)
+        return self._fallback.randint(a, b)
+
+    def random(self) -> float:
+        return 0.5
+
+    def choice(self, options):
+        return options[len(options) // 2]
+
+class SearchPolicy(AbstractPolicy):
+    """
+    Searches deeper and deeper until its time for each decision runs out, then
+    chooses the best option found by the deepest search which finished. Falls
+    back to GreedyPolicy if not even one turn could be searched in time.
+
+    Values of states already searched are kept in a transposition table keyed
+    on the snapshot of that state, which is shared between decisions.
+    """
+
+    def __init__(self, budget: float = 0.05, max_depth: int = 8, table_size: int = 200000, clock: Callable[[], float] = time.perf_counter):
+        """
+        budget is how many seconds each decision may take.
+        max_depth is how many choices ahead to search at most, counting both
+        teams' choices.
+        table_size is how many states to remember before forgetting them all.
+        """
+        self._budget = budget
+        self._max_depth = max_depth
+        self._table_size = table_size
+        self._clock = clock
+        self._weather = NO_WEATHER
+        self._table: dict[tuple, float] = dict()
+        self._fallback = GreedyPolicy()
+        self._teams: tuple[Team, Team] = None
+        self._deadline = 0.0
+
+    def begin_encounter(self, weather: Weather):
+        self._weather = weather
+        self._table.clear()
+
+    def choose(self, member: Character, options: list[TargetOption]) -> TargetOption:
+        if len(options) == 1:
+            return options[0]
+
+        self._deadline = self._clock() + self._budget
+        self._teams = (member.team, member.team.enemyTeam)
+        root = take_snapshot(self._teams)
+        best = None
+        try:
+            for depth in range(1, self._max_depth + 1):
+                best = self._search_root(member, options, depth, root)
+        except _OutOfTime:
+            pass # use the best option from the deepest search which finished
+        finally:
+            restore_snapshot(self._teams, root)
+            self._teams = None
+
+        if best is None: # not even one turn was searched
+            best = self._fallback.choose(member, options)
+        return best
+
+    def _search_root(self, member: Character, options: list[TargetOption], depth: int, root: Snapshot) -> TargetOption:
+        best = options[0]
+        best_value = None
+        for option in options:
+            if self._clock() > self._deadline:
+                raise _OutOfTime()
+            value = self._expected_value(member, option.active, option.targets, depth, root)
+            if best_value is None or value > best_value:
+                best = option
+                best_value = value
+        return best
+
+    def _expected_value(self, member: Character, active, targets: list[Character], depth: int, before: Snapshot) -> float:
+        """
+        Averages the value of the given member using the given active against
+        the given targets over every way their hits can turn out
+        """
+        if isinstance(active, AbstractDamagingActive):
+            outcomes = get_hit_outcomes(active, member.get_stat(LUCK))
+        else:
+            outcomes = _NO_ROLL
+
+        value = 0.0
+        for combination in product(outcomes, repeat=len(targets)):
+            probability = 1.0
+            for outcome in combination:
+                probability *= outcome.probability
+            restore_snapshot(self._teams, before)
+            member.lose_energy(active.cost) # as TargetOption.use does
+            for i, (target, outcome) in enumerate(zip(targets, combination)):
+                # each hit has its own rolls, so a passive rolling during one hit cannot take the next hit's roll
+                active.resolveAgainst(member, target, _FixedRolls((outcome.roll,), i, outcome.roll))
+            member.team.enemyTeam.updateMembersRemaining()
+            value += probability * self._value_after(member, depth - 1)
+        return value
+
+    def _value_after(self, actor: Character, depth: int) -> float:
+        """
+        Returns the value of the state after the given actor has acted
+        """
+        team = actor.team
+        if team.enemyTeam.isDefeated():
+            return self._evaluate()
+
+        # the rest of the actor's team act in order, then the other team begins their turn
+        next_ordinal = actor.ordinal + 1
+        if next_ordinal < len(team.membersRemaining):
+            return self._value_of_turn(team.membersRemaining[next_ordinal], depth)
+
+        next_team = team.enemyTeam
+        begin_team_turn(next_team, self._weather, [])
+        if next_team.isDefeated():
+            return self._evaluate()
+        return self._value_of_turn(next_team.membersRemaining[0], depth)
+
+    def _value_of_turn(self, actor: Character, depth: int) -> float:
+        """
+        Returns the value of the state where it is the given actor's turn
+        """
+        if depth == 0:
+            return self._evaluate()
+        if self._clock() > self._deadline:
+            raise _OutOfTime()
+
+        options = actor.get_target_options()
+        if len(options) == 0:
+            return self._value_after(actor, depth)
+
+        before = take_snapshot(self._teams)
+        is_ally = actor.team is self._teams[0]
+        key = (before.key(), is_ally, actor.ordinal, depth)
+        value = self._table.get(key)
+        if value is not None:
+            return value
+
+        values = [self._expected_value(actor, option.active, option.targets, depth, before) for option in options]
+        value = max(values) if is_ally else min(values)
+
+        if len(self._table) >= self._table_size:
+            self._table.clear()
+        self._table[key] = value
+        return value
+
+    def _evaluate(self) -> float:
+        """
+        Scores the current state from the searching team's point of view
+        """
+        allies, enemies = self._teams
+        if enemies.isDefeated():
+            return WIN_VALUE + _team_value(allies)
+        if allies.isDefeated():
+            return -WIN_VALUE - _team_value(enemies)
+        return _team_value(allies) - _team_value(enemies)
+
+def _team_value(team: Team) -> float:
+    return sum(max(member.remaining_hp, 0) + MEMBER_VALUE for member in team.membersRemaining)
@@ -0,0 +1,200 @@
+"""
+This module estimates how likely a user's team is to beat a level by playing
+many headless encounters across several processes. It is used to tune the
+enemy levels of campaigns.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import math
+import os
+import random
+from maelstrom.campaign.level import Level
+from maelstrom.dataClasses.team import Team
+from maelstrom.dataClasses.weather import WEATHERS
+from maelstrom.gameplay.headless import HeadlessEncounter
+from maelstrom.loaders.campaignloader import AbstractCampaignLoader, JsonFolderCampaignLoader
+from maelstrom.loaders.character_loader import EnemyLoader
+from maelstrom.loaders.template_registry import preload_template_registries
+from maelstrom.loaders.user_repository import UserRepository
+from maelstrom.util.random import RandomStream
+
+Z_95 = 1.959964
+"""
+z-score used for 95% confidence intervals
+"""
+
+@dataclass(frozen=True)
+class SimulationSummary:
+    """
+    Aggregated results of many simulated encounters
+    """
+
+    seed: int
+    """
+    Encounter N of this simulation used RandomStream(seed, N)
+    """
+
+    encounters: int
+
+    wins: int
+
+    unfinished: int
+    """
+    How many encounters hit the turn limit without a winner
+    """
+
+    win_rate: float
+
+    win_rate_interval: tuple[float, float]
+    """
+    95% Wilson score interval for the win rate
+    """
+
+    mean_turns: float
+
+    mean_turns_interval: tuple[float, float]
+    """
+    95% confidence interval for the mean number of turns
+    """
+
+@dataclass(frozen=True)
+class _ChunkTotals:
+    encounters: int
+    wins: int
+    unfinished: int
+    turns: int
+    turns_squared: int
+
+def simulate(user_name: str, campaign_name: str, level_name: str, encounters: int, workers: int = None, chunk_size: int = None, seed: int = None, users: UserRepository = None, campaign_loader: AbstractCampaignLoader = None) -> SimulationSummary:
+    """
+    Plays the given user's team against the named level the given number of
+    times, split into chunks across a pool of worker processes.
+
+    workers defaults to the number of CPUs, and chunk_size defaults to
+    splitting the work into four chunks per worker. Each encounter draws from
+    its own RandomStream derived from the seed and its index, so the same seed
+    gives the same results no matter how the work is split. seed is random if
+    not given.
+
+    Raises a ValueError if the user or level does not exist.
+    """
+    if encounters <= 0:
+        raise ValueError(f'encounters must be positive, so {encounters} is not allowed')
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, math.ceil(encounters / (workers * 4)))
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(63)
+    if users is None:
+        users = UserRepository()
+    if campaign_loader is None:
+        campaign_loader = JsonFolderCampaignLoader()
+
+    # resolved here so mistakes are reported once, rather than by every worker
+    if user_name not in users.get_user_names():
+        raise ValueError(f'no user named "{user_name}"')
+    player_team = users.load_user(user_name).team
+    level = find_level(campaign_loader, campaign_name, level_name)
+
+    preload_template_registries() # so forked workers inherit them
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(player_team, level)
+    ) as executor:
+        totals = list(executor.map(_run_chunk, _split_into_chunks(seed, encounters, chunk_size)))
+
+    return _summarize(seed, totals)
+
+def _split_into_chunks(seed: int, encounters: int, chunk_size: int) -> list[tuple[int, int, int]]:
+    """
+    Returns (seed, first encounter index, number of encounters) for each chunk
+    """
+    return [
+        (seed, start, min(chunk_size, encounters - start))
+        for start in range(0, encounters, chunk_size)
+    ]
+
+def _summarize(seed: int, totals: list[_ChunkTotals]) -> SimulationSummary:
+    """
+    Combines the totals from each chunk into a single summary
+    """
+    n = sum(t.encounters for t in totals)
+    wins = sum(t.wins for t in totals)
+    turns = sum(t.turns for t in totals)
+    turns_squared = sum(t.turns_squared for t in totals)
+
+    win_rate = wins / n
+    mean_turns = turns / n
+    variance = max(0.0, turns_squared / n - mean_turns ** 2)
+    if n > 1:
+        variance *= n / (n - 1) # sample variance
+    margin = Z_95 * math.sqrt(variance / n)
+
+    return SimulationSummary(
+        seed=seed,
+        encounters=n,
+        wins=wins,
+        unfinished=sum(t.unfinished for t in totals),
+        win_rate=win_rate,
+        win_rate_interval=_wilson_interval(wins, n),
+        mean_turns=mean_turns,
+        mean_turns_interval=(mean_turns - margin, mean_turns + margin)
+    )
+
+def _wilson_interval(successes: int, n: int) -> tuple[float, float]:
+    p = successes / n
+    denominator = 1 + Z_95 ** 2 / n
+    center = (p + Z_95 ** 2 / (2 * n)) / denominator
+    margin = Z_95 * math.sqrt(p * (1 - p) / n + Z_95 ** 2 / (4 * n ** 2)) / denominator
+    return (max(0.0, center - margin), min(1.0, center + margin))
+
+def find_level(campaign_loader: AbstractCampaignLoader, campaign_name: str, level_name: str) -> Level:
+    """
+    Returns the level with the given name from the named campaign
+    """
+    campaign = campaign_loader.get(campaign_name)
+    if campaign is not None:
+        for area in campaign.areas:
+            for level in area.levels:
+                if level.name == level_name:
+                    return level
+    raise ValueError(f'no level named "{level_name}" in campaign "{campaign_name}"')
+
+"""
+Worker process state:
+each worker is given the user's team and the level once, then reuses the same
+teams for every encounter in every chunk it is given. Templates are loaded by
+the parent process, so workers forked from it share them.
+"""
+
+_player_team: Team = None
+_enemy_team: Team = None
+
+def _init_worker(player_team: Team, level: Level):
+    global _player_team, _enemy_team
+
+    enemy_loader = EnemyLoader()
+    enemies = [enemy_loader.load(enemy_name, level.enemy_level) for enemy_name in level.enemy_names]
+
+    _player_team = player_team
+    _enemy_team = Team("Enemy Team", enemies)
+
+def _run_chunk(chunk: tuple[int, int, int]) -> _ChunkTotals:
+    seed, start, encounters = chunk
+    wins = 0
+    unfinished = 0
+    turns = 0
+    turns_squared = 0
+    for index in range(start, start + encounters):
+        rng = RandomStream(seed, index)
+        result = HeadlessEncounter(_player_team, _enemy_team, rng.choice(WEATHERS), rng=rng).run()
+        if result.player_won:
+            wins += 1
+        elif result.winner is None:
+            unfinished += 1
+        turns += result.turns
+        turns_squared += result.turns ** 2
+    return _ChunkTotals(encounters, wins, unfinished, turns, turns_squared)
@@ -0,0 +1,74 @@
+"""
+This module saves and restores the state of an encounter in progress, so
+lookahead policies can try out choices and then undo them.
+
+Rather than copying the whole object graph, a snapshot holds a flat array of
+numbers, such as each member's HP and energy, alongside a tuple of references
+to the boosts they had. Boosts are never changed once added, so they can be
+shared between snapshots. Event listeners are not saved, as they are only
+registered before battle begins.
+"""
+
+from array import array
+from maelstrom.dataClasses.character import Character
+from maelstrom.dataClasses.team import Team
+
+_MEMBER_SIZE = 1 + Character.BATTLE_STATE_SIZE # whether they remain, then their state
+
+class Snapshot:
+    """
+    The state of every member of some teams at one point in an encounter
+    """
+
+    __slots__ = ("values", "refs")
+
+    def __init__(self, values: array, refs: tuple):
+        self.values = values
+        self.refs = refs
+
+    def key(self) -> int:
+        """
+        Returns a hash which is the same for snapshots of the same state, even
+        if they hold different boost objects with the same amounts and expiry
+        """
+        boosts = tuple(
+            (
+                tuple(tuple(boost.amount for boost in stat_boosts) for stat_boosts in stats_boosts),
+                tick,
+                tuple((expires, boost.amount) for expires, _, _, boost in heap)
+            )
+            for stats_boosts, (tick, _, heap) in self.refs
+        )
+        return hash((self.values.tobytes(), boosts))
+
+def take_snapshot(teams: tuple[Team, ...]) -> Snapshot:
+    """
+    Saves the state of every member of the given teams
+    """
+    values = []
+    refs = []
+    for team in teams:
+        remaining = team.membersRemaining
+        for member in team.members:
+            values.append(1.0 if member in remaining else 0.0)
+            refs.append(member.save_battle_state(values))
+    return Snapshot(array("d", values), tuple(refs))
+
+def restore_snapshot(teams: tuple[Team, ...], snapshot: Snapshot):
+    """
+    Returns the given teams to the state they were in when the snapshot was
+    taken. The teams must be the same ones, in the same order.
+    """
+    values = snapshot.values
+    refs = snapshot.refs
+    offset = 0
+    i = 0
+    for team in teams:
+        remaining = []
+        for member in team.members:
+            if values[offset] != 0.0:
+                remaining.append(member)
+            member.restore_battle_state(values, offset + 1, refs[i])
+            offset += _MEMBER_SIZE
+            i += 1
+        team.restoreMembersRemaining(remaining)
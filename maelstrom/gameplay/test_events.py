@@ -0,0 +1,36 @@
+import unittest
+from maelstrom.gameplay.events import ActionRegister, HIT_GIVEN_EVENT, HIT_TAKEN_EVENT, UPDATE_EVENT
+
+class TestActionRegister(unittest.TestCase):
+    def test_fire_only_calls_listeners_for_that_type(self):
+        sut = ActionRegister()
+        fired = []
+        sut.add_event_listener(HIT_TAKEN_EVENT, fired.append)
+
+        sut.fire(HIT_GIVEN_EVENT, "given")
+        sut.fire(HIT_TAKEN_EVENT, "taken")
+
+        self.assertEqual(["taken"], fired)
+        self.assertTrue(sut.has_listeners(HIT_TAKEN_EVENT))
+        self.assertFalse(sut.has_listeners(HIT_GIVEN_EVENT))
+
+    def test_clear(self):
+        sut = ActionRegister()
+        fired = []
+        sut.add_event_listener(UPDATE_EVENT, fired.append)
+
+        sut.clear()
+        sut.fire(UPDATE_EVENT, "update")
+
+        self.assertEqual([], fired)
+        self.assertFalse(sut.has_listeners(UPDATE_EVENT))
+
+    def test_unsupported_event_type(self):
+        sut = ActionRegister()
+        with self.assertRaises(Exception):
+            sut.add_event_listener(7, print)
+        with self.assertRaises(Exception):
+            sut.fire(7)
+
+if __name__ == "__main__":
+    unittest.main()
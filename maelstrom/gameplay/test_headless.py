@@ -0,0 +1,40 @@
+import unittest
+from maelstrom.dataClasses.team import Team
+from maelstrom.dataClasses.weather import NO_WEATHER
+from maelstrom.gameplay.headless import HeadlessEncounter
+from maelstrom.testing import make_character
+
+class TestHeadlessEncounter(unittest.TestCase):
+    def test_stronger_team_wins(self):
+        player_team = Team("Players", [make_character("a", 20), make_character("b", 20)])
+        enemy_team = Team("Enemies", [make_character("c")])
+
+        actual = HeadlessEncounter(player_team, enemy_team, NO_WEATHER).run()
+
+        self.assertEqual("Players", actual.winner)
+        self.assertTrue(actual.player_won)
+        self.assertEqual(0, actual.enemy_hp_remaining)
+        self.assertGreater(actual.turns, 0)
+        self.assertGreaterEqual(actual.player_damage_dealt, 100)
+
+    def test_teams_reset_afterwards(self):
+        player_team = Team("Players", [make_character("a")])
+        enemy_team = Team("Enemies", [make_character("b")])
+
+        HeadlessEncounter(player_team, enemy_team, NO_WEATHER).run()
+
+        self.assertIsNone(player_team.enemyTeam)
+        self.assertIsNone(enemy_team.enemyTeam)
+
+    def test_turn_limit(self):
+        player_team = Team("Players", [make_character("a")])
+        enemy_team = Team("Enemies", [make_character("b")])
+
+        actual = HeadlessEncounter(player_team, enemy_team, NO_WEATHER, max_turns=1).run()
+
+        self.assertIsNone(actual.winner)
+        self.assertFalse(actual.player_won)
+        self.assertEqual(1, actual.turns)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import asyncio
+import dataclasses
+import unittest
+from maelstrom.campaign.level import Level
+from maelstrom.dataClasses.team import Team
+from maelstrom.dataClasses.weather import WEATHERS
+from maelstrom.gameplay.combat import play_level
+from maelstrom.gameplay.headless import HeadlessEncounter
+from maelstrom.gameplay.replay import ReplayMismatchError, ReplayRecorder, decode_replay, encode_replay, replay
+from maelstrom.loaders.character_loader import EnemyLoader
+from maelstrom.testing import make_character
+from maelstrom.ui_scripted import ScriptedUI
+from maelstrom.util.random import RandomStream
+from maelstrom.util.user import User
+
+def record(seed: int) -> ReplayRecorder:
+    player_team = Team("Players", [make_character("a", 5), make_character("b", 5)])
+    enemy_team = Team("Enemies", [make_character("c", 4), make_character("d", 4), make_character("e", 4)])
+    recorder = ReplayRecorder()
+    HeadlessEncounter(player_team, enemy_team, WEATHERS[1], rng=RandomStream(seed), recorder=recorder).run()
+    return recorder
+
+class TestReplay(unittest.TestCase):
+    def test_encode_decode(self):
+        expected = record(1).get_replay()
+
+        actual = decode_replay(encode_replay(expected))
+
+        self.assertEqual(expected, actual)
+
+    def test_replay_matches(self):
+        for seed in range(10):
+            recorded = decode_replay(encode_replay(record(seed).get_replay()))
+
+            actual = replay(recorded)
+
+            self.assertEqual(recorded.turns, actual.turns)
+
+    def test_replays_played_level(self):
+        enemy_loader = EnemyLoader()
+        level = Level(name="Level", description="", prescript="", postscript="", enemy_names=enemy_loader.get_options()[:2], enemy_level=3)
+        for seed in range(20):
+            user = User("Players", Team("Players", [make_character("a", 4), make_character("b", 4)]))
+            recorder = ReplayRecorder()
+            ui = ScriptedUI(lambda screen: screen.choice.options[seed % len(screen.choice.options)])
+            asyncio.run(play_level(ui, level, user, enemy_loader, RandomStream(seed), recorder))
+            recorded = decode_replay(encode_replay(recorder.get_replay()))
+
+            actual = replay(recorded)
+
+            self.assertGreater(recorded.rng_position, 0) # the weather was chosen first
+            self.assertEqual(recorded.turns, actual.turns)
+
+    def test_replay_detects_mismatch(self):
+        recorded = record(2).get_replay()
+        tampered = dataclasses.replace(recorded, final_hp=(1,) + recorded.final_hp[1:])
+
+        with self.assertRaises(ReplayMismatchError):
+            replay(tampered)
+
+    def test_requires_random_stream(self):
+        with self.assertRaises(ValueError):
+            ReplayRecorder().begin(Team("a", []), Team("b", []), WEATHERS[0], rng=None)
+
+if __name__ == "__main__":
+    unittest.main()
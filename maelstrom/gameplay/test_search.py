@@ -0,0 +1,79 @@
+import unittest
+from maelstrom.dataClasses.team import Team
+from maelstrom.dataClasses.weather import HAIL_WEATHER
+from maelstrom.gameplay.events import HIT_TAKEN_EVENT
+from maelstrom.gameplay.headless import HeadlessEncounter
+from maelstrom.gameplay.policies import GreedyPolicy
+from maelstrom.gameplay.search import SearchPolicy
+from maelstrom.testing import make_character
+from maelstrom.util.random import RandomStream
+
+def make_battle() -> tuple[Team, Team]:
+    frail = make_character("frail")
+    soft = make_character("soft", resistance=-5)
+    player_team = Team("Players", [make_character("a")])
+    enemy_team = Team("Enemies", [frail, soft])
+    player_team.enemyTeam = enemy_team
+    enemy_team.enemyTeam = player_team
+    player_team.init_for_battle()
+    enemy_team.init_for_battle()
+    frail.remaining_hp = 5
+    return (player_team, enemy_team)
+
+class TestSearchPolicy(unittest.TestCase):
+    def test_finishes_off_target(self):
+        player_team, _ = make_battle()
+        member = player_team.members[0]
+        options = member.get_target_options()
+        greedy = GreedyPolicy().choose(member, options)
+
+        actual = SearchPolicy(budget=10.0, max_depth=1).choose(member, options)
+
+        self.assertEqual("soft", greedy.targets[0].name)
+        self.assertEqual("frail", actual.targets[0].name)
+
+    def test_falls_back_to_greedy_without_time(self):
+        player_team, _ = make_battle()
+        member = player_team.members[0]
+        options = member.get_target_options()
+        ticks = iter(range(1000))
+
+        actual = SearchPolicy(budget=0.0, clock=lambda: next(ticks)).choose(member, options)
+
+        self.assertIs(GreedyPolicy().choose(member, options).active, actual.active)
+        self.assertEqual("soft", actual.targets[0].name)
+
+    def test_leaves_state_unchanged(self):
+        teams = make_battle()
+        member = teams[0].members[0]
+        expected = [(m.remaining_hp, m.energy, m.ordinal) for team in teams for m in team.membersRemaining]
+
+        SearchPolicy(budget=10.0, max_depth=3).choose(member, member.get_target_options())
+
+        actual = [(m.remaining_hp, m.energy, m.ordinal) for team in teams for m in team.membersRemaining]
+        self.assertEqual(expected, actual)
+
+    def test_listeners_can_roll(self):
+        teams = make_battle()
+        member = teams[0].members[0]
+        rolls = []
+        for enemy in teams[1].members:
+            enemy.add_event_listener(HIT_TAKEN_EVENT, lambda event: rolls.append(event.rng.randint(1, 100)))
+
+        first = SearchPolicy(budget=10.0, max_depth=2).choose(member, member.get_target_options())
+        second = SearchPolicy(budget=10.0, max_depth=2).choose(member, member.get_target_options())
+
+        self.assertGreater(len(rolls), 0)
+        self.assertTrue(all(1 <= roll <= 100 for roll in rolls))
+        self.assertEqual(first.msg, second.msg)
+
+    def test_plays_encounter(self):
+        player_team = Team("Players", [make_character("a", 3), make_character("b", 3)])
+        enemy_team = Team("Enemies", [make_character("c", 3), make_character("d", 3)])
+
+        actual = HeadlessEncounter(player_team, enemy_team, HAIL_WEATHER, enemy_policy=SearchPolicy(budget=0.01), rng=RandomStream(1)).run()
+
+        self.assertIsNotNone(actual.winner)
+
+if __name__ == "__main__":
+    unittest.main()
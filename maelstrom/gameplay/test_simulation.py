@@ -0,0 +1,67 @@
+import tempfile
+import unittest
+from maelstrom.campaign.area import Area
+from maelstrom.campaign.campaign import Campaign
+from maelstrom.campaign.level import Level
+from maelstrom.dataClasses.team import Team
+from maelstrom.gameplay.simulation import _ChunkTotals, _split_into_chunks, _summarize, _wilson_interval, find_level, simulate
+from maelstrom.loaders.campaignloader import InMemoryCampaignLoader
+from maelstrom.loaders.template_registry import STARTERS_PATH, get_template_registry
+from maelstrom.loaders.user_repository import UserRepository
+from maelstrom.testing import character_from_template
+from maelstrom.util.user import User
+
+LEVEL = Level(name="Level", description="", prescript="", postscript="", enemy_names=["rain entity", "wind entity"], enemy_level=2)
+CAMPAIGNS = InMemoryCampaignLoader([Campaign(name="Campaign", areas=[Area(name="Area", description="", levels=[LEVEL])])])
+
+class TestSimulation(unittest.TestCase):
+    def test_wilson_interval(self):
+        low, high = _wilson_interval(50, 100)
+        self.assertAlmostEqual(0.5, (low + high) / 2)
+        self.assertAlmostEqual(0.4038, low, places=3)
+        self.assertEqual(0.0, _wilson_interval(0, 10)[0])
+        self.assertAlmostEqual(1.0, _wilson_interval(10, 10)[1])
+
+    def test_summarize(self):
+        totals = [_ChunkTotals(2, 1, 0, 6, 20), _ChunkTotals(2, 2, 1, 10, 52)] # turns 2, 4, 4, 6
+
+        actual = _summarize(7, totals)
+
+        self.assertEqual(7, actual.seed)
+        self.assertEqual(4, actual.encounters)
+        self.assertEqual(3, actual.wins)
+        self.assertEqual(1, actual.unfinished)
+        self.assertEqual(0.75, actual.win_rate)
+        self.assertEqual(4.0, actual.mean_turns)
+        margin = 1.959964 * (8 / 3 / 4) ** 0.5 # sample variance of 8 / 3
+        self.assertAlmostEqual(4.0 - margin, actual.mean_turns_interval[0])
+
+    def test_split_into_chunks(self):
+        actual = _split_into_chunks(9, 10, 4)
+        self.assertEqual([(9, 0, 4), (9, 4, 4), (9, 8, 2)], actual)
+
+    def test_find_level(self):
+        self.assertIs(LEVEL, find_level(CAMPAIGNS, "Campaign", "Level"))
+        with self.assertRaises(ValueError):
+            find_level(CAMPAIGNS, "Campaign", "Nope")
+        with self.assertRaises(ValueError):
+            find_level(CAMPAIGNS, "Nope", "Level")
+
+    def test_same_results_for_any_workers(self):
+        with tempfile.TemporaryDirectory() as folder:
+            users = UserRepository(folder)
+            users.save_user(User("Tester", _make_team()))
+
+            one = simulate("Tester", "Campaign", "Level", 20, workers=1, seed=3, users=users, campaign_loader=CAMPAIGNS)
+            two = simulate("Tester", "Campaign", "Level", 20, workers=2, seed=3, users=users, campaign_loader=CAMPAIGNS)
+
+            self.assertEqual(one, two)
+            with self.assertRaises(ValueError):
+                simulate("Nobody", "Campaign", "Level", 20, users=users, campaign_loader=CAMPAIGNS)
+
+def _make_team() -> Team:
+    templates = get_template_registry(STARTERS_PATH).get_all_character_templates()[:2]
+    return Team("Tester", [character_from_template(template, 2) for template in templates])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from maelstrom.dataClasses.stat_classes import CONTROL, Boost
+from maelstrom.dataClasses.team import Team
+from maelstrom.dataClasses.weather import HAIL_WEATHER
+from maelstrom.gameplay.headless import begin_team_turn
+from maelstrom.gameplay.snapshot import restore_snapshot, take_snapshot
+from maelstrom.testing import make_character
+from maelstrom.util.random import RandomStream
+
+def make_teams() -> tuple[Team, Team]:
+    player_team = Team("Players", [make_character("a"), make_character("b")])
+    enemy_team = Team("Enemies", [make_character("c"), make_character("d"), make_character("e")])
+    player_team.enemyTeam = enemy_team
+    enemy_team.enemyTeam = player_team
+    player_team.init_for_battle()
+    enemy_team.init_for_battle()
+    return (player_team, enemy_team)
+
+def get_state(teams: tuple[Team, ...]) -> list:
+    return [
+        (m.name, m.remaining_hp, m.energy, m.ordinal, m.get_stat(CONTROL), m in team.membersRemaining)
+        for team in teams
+        for m in team.members
+    ]
+
+class TestSnapshot(unittest.TestCase):
+    def test_restore(self):
+        teams = make_teams()
+        player_team, enemy_team = teams
+        player_team.members[0].boost(Boost("control", 0.2, 2))
+        expected = get_state(teams)
+        snapshot = take_snapshot(teams)
+
+        player_team.members[0].boost(Boost("control", 0.5, 1))
+        enemy_team.members[1].take_damage(1000)
+        enemy_team.updateMembersRemaining()
+        begin_team_turn(player_team, HAIL_WEATHER, [])
+        self.assertNotEqual(expected, get_state(teams))
+
+        restore_snapshot(teams, snapshot)
+
+        self.assertEqual(expected, get_state(teams))
+        self.assertEqual(3, len(enemy_team.getMembersRemaining()))
+
+    def test_restore_replays_same(self):
+        teams = make_teams()
+        snapshot = take_snapshot(teams)
+        results = []
+        for _ in range(2):
+            restore_snapshot(teams, snapshot)
+            rng = RandomStream(4)
+            for _ in range(3):
+                member = teams[0].membersRemaining[0]
+                member.get_target_options()[0].use(rng)
+                member.update()
+                teams[1].updateMembersRemaining()
+            results.append(get_state(teams))
+
+        self.assertEqual(results[0], results[1])
+
+if __name__ == "__main__":
+    unittest.main()
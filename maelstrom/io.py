@@ -1,11 +1,20 @@
 """
 Input-output utilities
 * StandardInputChannel
+* StandardAsyncInputChannel
 * StandardOutputChannel
+* BufferedOutputChannel
+* RingBufferOutputChannel
 * Chooser
+* AsyncChooser
 """
 
 from abc import ABC, abstractmethod
+import asyncio
+from collections import deque
+import sys
+import threading
+from typing import TextIO
 
 
 class InputChannel(ABC):
@@ -42,6 +51,87 @@ class StandardInputChannel(InputChannel):
     def read(self) -> str:
         return input()
 
+class AsyncInputChannel(ABC):
+    """
+    Requests input without blocking the event loop while waiting for it.
+    Subclasses must override the `read` method.
+    """
+
+    @abstractmethod
+    async def read(self) -> str:
+        pass
+
+    async def read_int(self) -> int:
+        return int(float(await self.read()))
+
+class StandardAsyncInputChannel(AsyncInputChannel):
+    """
+    Consumes input from stdin. A reader thread, started by the first read,
+    waits on the stream and hands each line to whichever read is waiting, so
+    other tasks on the event loop keep running meanwhile.
+
+    Only one of these should read each stream, as the thread reads ahead.
+    """
+
+    def __init__(self, stream: TextIO = None):
+        """
+        stream defaults to stdin
+        """
+        super().__init__()
+        self._stream = sys.stdin if stream is None else stream
+        self._lock = threading.Lock()
+        self._lines: deque[str] = deque()
+        self._closed = False
+        self._waiter: asyncio.Future = None
+        self._thread: threading.Thread = None
+
+    async def read(self) -> str:
+        """
+        Raises EOFError once the stream has no more lines, like input()
+        """
+        self._start()
+        while True:
+            with self._lock:
+                if len(self._lines) != 0:
+                    return self._lines.popleft()
+                if self._closed:
+                    raise EOFError("no more input")
+                waiter = asyncio.get_running_loop().create_future()
+                self._waiter = waiter
+            try:
+                await waiter
+            finally:
+                self._waiter = None
+
+    def _start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._read_lines, name="stdin reader", daemon=True)
+            self._thread.start()
+
+    def _read_lines(self):
+        """
+        runs on the reader thread
+        """
+        while True:
+            line = self._stream.readline()
+            with self._lock:
+                if line == "":
+                    self._closed = True
+                else:
+                    self._lines.append(line.removesuffix("\n"))
+                waiter = self._waiter
+            if waiter is not None:
+                try:
+                    waiter.get_loop().call_soon_threadsafe(_wake, waiter)
+                except RuntimeError:
+                    pass # the loop closed while waiting
+            if line == "":
+                return
+
+def _wake(waiter: asyncio.Future):
+    if not waiter.done():
+        waiter.set_result(None)
+
 
 class OutputChannel(ABC):
     """
@@ -53,6 +143,13 @@ class OutputChannel(ABC):
     def write(self, *args, **kwargs):
         pass
 
+    def flush(self):
+        """
+        Makes sure everything written so far has been output. Does nothing
+        unless this buffers output.
+        """
+        pass
+
 class DevNullOutputChannel(OutputChannel):
     """
     Does not write output anywhere
@@ -63,15 +160,40 @@ class DevNullOutputChannel(OutputChannel):
 
 class ListOutputChannel(OutputChannel):
     """
-    Saves messages it receives
+    Saves messages it receives, each as the text print would have written
     """
 
     def __init__(self):
         super().__init__()
-        self._messages = []
-    
-    def write(self, *args, **kwargs):
-        self._messages.append([arg for arg in args])
+        self._messages = self._make_messages()
+
+    def _make_messages(self):
+        return []
+
+    def write(self, *args, sep: str = " ", end: str = "\n", **kwargs):
+        self._messages.append(_format_message(args, sep, end))
+
+    @property
+    def messages(self) -> list[str]:
+        return list(self._messages)
+
+    def clear(self):
+        self._messages.clear()
+
+class RingBufferOutputChannel(ListOutputChannel):
+    """
+    Saves only the most recent messages it receives, so capturing the output of
+    long headless runs uses a bounded amount of memory
+    """
+
+    def __init__(self, capacity: int = 1000):
+        if capacity <= 0:
+            raise ValueError(f'capacity must be positive, not {capacity}')
+        self._capacity = capacity
+        super().__init__()
+
+    def _make_messages(self):
+        return deque(maxlen=self._capacity)
 
 class StandardOutputChannel(OutputChannel):
     """
@@ -81,6 +203,33 @@ class StandardOutputChannel(OutputChannel):
     def write(self, *args, **kwargs):
         return print(*args, **kwargs)
 
+class BufferedOutputChannel(OutputChannel):
+    """
+    Collects output until it is flushed, then writes it all to the stream at
+    once. This way a whole frame costs one write rather than one per row.
+    """
+
+    def __init__(self, stream: TextIO = None):
+        """
+        stream defaults to whatever stdout is when flushing
+        """
+        super().__init__()
+        self._stream = stream
+        self._parts: list[str] = []
+
+    def write(self, *args, sep: str = " ", end: str = "\n", flush: bool = False, **kwargs):
+        self._parts.append(_format_message(args, sep, end))
+        if flush:
+            self.flush()
+
+    def flush(self):
+        if len(self._parts) == 0:
+            return
+        stream = sys.stdout if self._stream is None else self._stream
+        stream.write("".join(self._parts))
+        self._parts.clear()
+        stream.flush()
+
 class Chooser:
     """
     Allows the user to choose from a list of options
@@ -119,6 +268,49 @@ class Chooser:
             
         return chosen
 
+class AsyncChooser:
+    """
+    Like Chooser, but waits for input without blocking the event loop
+    """
+
+    def __init__(self, input: AsyncInputChannel, output: OutputChannel = None):
+        """
+        output defaults to stdout
+        """
+        if output is None:
+            output = StandardOutputChannel()
+        self._input = input
+        self._output = output
+
+    async def choose(self, prompt: str, options: 'list[any]', display_options=True) -> 'any':
+        options = to_list(options)
+        chosen = options[0] # purposely fails if no options
+
+        if len(options) > 1: # only ask if user has a choice
+            self._output.write(prompt)
+            if display_options:
+                for i, option in enumerate(options):
+                    self._output.write(f'{i + 1}: {option}')
+
+            idx = -1
+            while idx < 0 or len(options) <= idx: # ask until valid
+                self._output.write(f'Enter a number [1 - {len(options)}]: ', end='', flush=True)
+                try:
+                    idx = await self._input.read_int() - 1 # move from 1-index to 0-index
+                except ValueError:
+                    pass # user entered non-number
+            chosen = options[idx]
+
+        return chosen
+
+def _format_message(args: tuple, sep: str, end: str) -> str:
+    """
+    returns the text print would write for the given arguments
+    """
+    sep = " " if sep is None else sep
+    end = "\n" if end is None else end
+    return sep.join(str(arg) for arg in args) + end
+
 def to_list(obj: any) -> 'list[any]':
     """
     converts input to a list, if it is not one already
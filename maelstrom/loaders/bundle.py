@@ -0,0 +1,243 @@
+"""
+This module caches data parsed from files, such as character templates and
+campaigns, in a single binary bundle. Later processes load the parsed objects
+from the memory-mapped bundle instead of parsing the files again, which makes
+starting up much faster.
+
+Each entry remembers the size, modification time, and SHA-256 hash of the file
+it was parsed from. If the size or modification time changes, the file is
+hashed again, and only if its contents changed is it parsed again.
+
+Loading never writes the bundle, as rewriting it after every file would take
+time quadratic in the number of files. Instead, callers save once after
+loading a batch of files, and the default bundle is also saved when the
+process exits.
+
+The bundle is laid out as
+* MAGIC
+* VERSION as an unsigned byte
+* the length of the index as a 4 byte big-endian unsigned integer
+* the pickled index, which maps each file's absolute path to an _Entry
+* each entry's pickled value, one after another
+"""
+
+import atexit
+from dataclasses import dataclass
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+import threading
+from typing import Callable, TypeVar
+
+MAGIC = b"MBDL"
+VERSION = 2
+"""
+changed whenever the format or what is stored changes, so old bundles are
+ignored
+"""
+DEFAULT_BUNDLE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "cache", "data.bundle")
+"""
+in the repository's cache folder, no matter which folder the process runs in
+"""
+
+_HEADER = struct.Struct(">4sBI")
+
+T = TypeVar("T")
+
+@dataclass(frozen=True)
+class _Entry:
+    size: int
+    mtime_ns: int
+    sha256: bytes
+
+    offset: int
+    """
+    where the pickled value starts, counting from the end of the index
+    """
+
+    length: int
+
+class DataBundle:
+    """
+    A bundle of parsed files, loaded from and saved to a file. Safe to share
+    between threads.
+    """
+
+    def __init__(self, path: str = DEFAULT_BUNDLE_PATH):
+        """
+        the bundle is stored at the given path, and is loaded now if it exists
+        """
+        self._path = path
+        self._lock = threading.RLock()
+        self._index: dict[str, _Entry] = dict()
+        self._mmap: mmap.mmap = None
+        self._view = memoryview(b"")
+        self._values = self._view
+        self._changed: dict[str, tuple[_Entry, bytes]] = dict()
+        """
+        entries which are not yet saved, along with their pickled values
+        """
+        self._open()
+
+    def load(self, source: str, parse: Callable[[str], T]) -> T:
+        """
+        Returns the value parsed from the given file, using parse to parse it
+        if the bundle has no up to date value for it. Newly parsed values are
+        kept in memory until save is called.
+        """
+        key = os.path.abspath(source)
+        with self._lock:
+            value = self._load_cached(key)
+            if value is not None:
+                return value
+
+            value = parse(source)
+            with open(source, "rb") as file:
+                sha256 = hashlib.sha256(file.read()).digest()
+            stat = os.stat(source)
+            pickled = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            self._changed[key] = (_Entry(stat.st_size, stat.st_mtime_ns, sha256, 0, len(pickled)), pickled)
+            return value
+
+    def _load_cached(self, key: str) -> any:
+        """
+        returns the cached value for the given file, or None if it is missing
+        or out of date
+        """
+        if key in self._changed:
+            return pickle.loads(self._changed[key][1])
+        entry = self._index.get(key)
+        if entry is None:
+            return None
+
+        try:
+            stat = os.stat(key)
+        except OSError:
+            return None
+        if stat.st_size != entry.size:
+            return None
+        with self._values[entry.offset:entry.offset + entry.length] as view:
+            pickled = bytes(view) if stat.st_mtime_ns != entry.mtime_ns else None
+            value = pickle.loads(view)
+
+        if pickled is not None:
+            # touched, but maybe not changed, such as by checking out a branch
+            with open(key, "rb") as file:
+                if hashlib.sha256(file.read()).digest() != entry.sha256:
+                    return None
+            # saved with the new modification time, so it need not be hashed again
+            self._changed[key] = (_Entry(stat.st_size, stat.st_mtime_ns, entry.sha256, 0, len(pickled)), pickled)
+        return value
+
+    def save(self):
+        """
+        Writes every up to date entry to the bundle file. Does nothing if
+        nothing was parsed since it was last saved, or if the file cannot be
+        written, such as on a read-only file system.
+        """
+        with self._lock:
+            if len(self._changed) == 0:
+                return
+            entries = {
+                key: (entry, bytes(self._values[entry.offset:entry.offset + entry.length]))
+                for key, entry in self._index.items()
+                if key not in self._changed
+            }
+            entries.update(self._changed)
+
+            index = dict()
+            offset = 0
+            for key, (entry, value) in entries.items():
+                index[key] = _Entry(entry.size, entry.mtime_ns, entry.sha256, offset, len(value))
+                offset += len(value)
+            pickled_index = pickle.dumps(index, protocol=pickle.HIGHEST_PROTOCOL)
+
+            temp_path = f'{self._path}.{os.getpid()}.{threading.get_ident()}.tmp'
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self._path)), exist_ok=True)
+                with open(temp_path, "wb") as file:
+                    file.write(_HEADER.pack(MAGIC, VERSION, len(pickled_index)))
+                    file.write(pickled_index)
+                    for _, value in entries.values():
+                        file.write(value)
+                self._close() # Windows cannot replace a file which is mapped
+                os.replace(temp_path, self._path)
+            except OSError:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                self._open()
+                return # keep what was parsed in memory
+            self._changed.clear()
+            self._open()
+
+    def _open(self):
+        """
+        maps the bundle file, if it exists and is valid
+        """
+        self._close()
+        try:
+            with open(self._path, "rb") as file:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError): # ValueError if the file is empty
+            return
+
+        view = memoryview(mapped)
+        try:
+            magic, version, index_length = _HEADER.unpack_from(view)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f'{self._path} is not a version {VERSION} bundle')
+            start = _HEADER.size + index_length
+            with view[_HEADER.size:start] as pickled_index:
+                index = pickle.loads(pickled_index)
+        except Exception:
+            # corrupt or outdated, so ignore it and parse everything again
+            view.release()
+            mapped.close()
+            return
+        self._mmap = mapped
+        self._view = view
+        self._values = view[start:]
+        self._index = index
+
+    def _close(self):
+        self._values.release()
+        self._view.release()
+        self._view = memoryview(b"")
+        self._values = self._view
+        self._index = dict()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+_default_bundle: DataBundle = None
+_default_bundle_lock = threading.Lock()
+
+def get_default_bundle() -> DataBundle:
+    """
+    Returns the bundle shared by the whole process, which is stored at
+    DEFAULT_BUNDLE_PATH unless another was given to set_default_bundle. It is
+    saved when the process exits.
+    """
+    global _default_bundle
+    with _default_bundle_lock:
+        if _default_bundle is None:
+            _default_bundle = DataBundle()
+            atexit.register(_save_default_bundle)
+        return _default_bundle
+
+def set_default_bundle(bundle: DataBundle):
+    """
+    Replaces the bundle shared by the whole process, such as so tests can keep
+    theirs in a temporary folder
+    """
+    global _default_bundle
+    with _default_bundle_lock:
+        if _default_bundle is None:
+            atexit.register(_save_default_bundle)
+        _default_bundle = bundle
+
+def _save_default_bundle():
+    if _default_bundle is not None:
+        _default_bundle.save()
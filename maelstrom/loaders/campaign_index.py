@@ -0,0 +1,138 @@
+"""
+This module indexes campaign JSON files, recording where each area and level is
+in the file without building them. Campaigns can then parse just the areas and
+levels which are used.
+
+The index is found by scanning the structure of the file: only the campaign,
+its areas array, each area, and each levels array are walked member by member.
+Every other value is skipped using the standard JSON decoder's raw_decode.
+"""
+
+from dataclasses import dataclass
+import json
+import re
+from typing import Callable
+
+@dataclass(frozen=True)
+class AreaIndex:
+    fields: tuple[tuple[str, int, int], ...]
+    """
+    the key of each of the area's members other than levels, along with where
+    its value begins and ends in the file's text
+    """
+
+    levels: tuple[tuple[int, int], ...]
+    """
+    where each of the area's levels begins and ends in the file's text
+    """
+
+@dataclass(frozen=True)
+class CampaignIndex:
+    name: str
+
+    length: int
+    """
+    how many characters long the indexed text is
+    """
+
+    areas: tuple[AreaIndex, ...]
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+_decoder = json.JSONDecoder()
+
+def index_campaign_file(path: str) -> CampaignIndex:
+    with open(path, mode='r') as file:
+        return index_campaign_text(file.read())
+
+def index_campaign_text(text: str) -> CampaignIndex:
+    """
+    Raises a ValueError if the text is not a campaign's JSON
+    """
+    name = None
+    areas = []
+
+    def scan_member(key: str, start: int) -> int:
+        nonlocal name
+        if key == "name":
+            name, end = _decoder.raw_decode(text, start)
+            return end
+        if key == "areas":
+            return scan_array(text, start, scan_area)
+        return skip_value(text, start)
+
+    def scan_area(start: int) -> int:
+        fields = []
+        levels = []
+
+        def scan_area_member(key: str, value_start: int) -> int:
+            if key == "levels":
+                return scan_array(text, value_start, scan_level)
+            end = skip_value(text, value_start)
+            fields.append((key, value_start, end))
+            return end
+
+        def scan_level(level_start: int) -> int:
+            end = skip_value(text, level_start)
+            levels.append((level_start, end))
+            return end
+
+        end = scan_object(text, start, scan_area_member)
+        areas.append(AreaIndex(tuple(fields), tuple(levels)))
+        return end
+
+    scan_object(text, _skip_whitespace(text, 0), scan_member)
+    if not isinstance(name, str):
+        raise ValueError("campaign has no name")
+    return CampaignIndex(name, len(text), tuple(areas))
+
+def scan_object(text: str, start: int, scan_member: Callable[[str, int], int]) -> int:
+    """
+    Calls scan_member with the key of each member of the JSON object starting
+    at the given index and where its value begins. scan_member returns where
+    the value ends. Returns where the object ends.
+    """
+    i = _expect(text, start, "{")
+    if text.startswith("}", i):
+        return i + 1
+    while True:
+        key, i = _decoder.raw_decode(text, i)
+        if not isinstance(key, str):
+            raise ValueError(f'expected a key before {i}')
+        i = _expect(text, _skip_whitespace(text, i), ":")
+        i = _skip_whitespace(text, scan_member(key, i))
+        if text.startswith("}", i):
+            return i + 1
+        i = _expect(text, i, ",")
+
+def scan_array(text: str, start: int, scan_item: Callable[[int], int]) -> int:
+    """
+    Calls scan_item with where each item of the JSON array starting at the
+    given index begins. scan_item returns where the item ends. Returns where
+    the array ends.
+    """
+    i = _expect(text, start, "[")
+    if text.startswith("]", i):
+        return i + 1
+    while True:
+        i = _skip_whitespace(text, scan_item(i))
+        if text.startswith("]", i):
+            return i + 1
+        i = _expect(text, i, ",")
+
+def skip_value(text: str, start: int) -> int:
+    """
+    Returns where the JSON value starting at the given index ends
+    """
+    return _decoder.raw_decode(text, start)[1]
+
+def _skip_whitespace(text: str, i: int) -> int:
+    return _WHITESPACE.match(text, i).end()
+
+def _expect(text: str, i: int, expected: str) -> int:
+    """
+    returns where the next token after the expected one begins
+    """
+    if not text.startswith(expected, i):
+        raise ValueError(f'expected "{expected}" at {i}')
+    return _skip_whitespace(text, i + 1)
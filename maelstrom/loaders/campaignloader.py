@@ -4,6 +4,9 @@ from genericpath import isfile
 from maelstrom.campaign.area import Area
 from maelstrom.campaign.campaign import Campaign
 from maelstrom.campaign.level import Level
+from maelstrom.loaders.bundle import DataBundle, get_default_bundle
+from maelstrom.loaders.campaign_index import AreaIndex, index_campaign_file, index_campaign_text
+from maelstrom.util.collections import LazySequence
 from os import listdir
 from os.path import join
 
@@ -23,6 +26,11 @@ class AbstractCampaignLoader(ABC):
         """returns all available Campaigns"""
         pass
 
+    @abstractmethod
+    def get_names(self) -> list[str]:
+        """returns the names of all available Campaigns"""
+        pass
+
 class InMemoryCampaignLoader(AbstractCampaignLoader):
     """Stores Campaigns in-memeory."""
 
@@ -35,41 +43,75 @@ class InMemoryCampaignLoader(AbstractCampaignLoader):
     
     def get_all(self) -> 'list[Campaign]':
         return list(self._campaigns.values())
+
+    def get_names(self) -> list[str]:
+        return list(self._campaigns.keys())
     
 class JsonFolderCampaignLoader(AbstractCampaignLoader):
-    """Loads campaigns from a folder containing JSON files"""
+    """
+    Loads campaigns from a folder containing JSON files.
+
+    Each file is indexed to find its campaign's name and where its areas and
+    levels are, and the index is kept in a data bundle so later runs needn't
+    scan the file again. Areas and levels are only parsed once accessed.
+    """
+
+    def __init__(self, bundle: DataBundle = None, folder: str = "data/campaigns"):
+        """
+        campaign indexes are cached in the given bundle, which defaults to the
+        default data bundle
+        """
+        self._bundle = get_default_bundle() if bundle is None else bundle
+        self._folder = folder
+        self._paths: dict[str, str] = None
+        """
+        the path to each campaign's file, by campaign name
+        """
+        self._campaigns: dict[str, Campaign] = dict()
 
-    def __init__(self):
-        self._campaigns = dict()
-        self._all_loaded = False
-    
     def get(self, name: str) -> Campaign:
-        if not name in self._campaigns:
-            self._load_file(name)
-        return self._campaigns.get(name)
+        campaign = self._campaigns.get(name)
+        if campaign is None:
+            path = self._get_paths().get(name)
+            if path is None:
+                return None
+            campaign = self._load_campaign(path)
+            self._campaigns[name] = campaign
+        return campaign
     
     def get_all(self) -> 'list[Campaign]':
-        if not self._all_loaded:
-            self._load_all_files()
-        return list(self._campaigns.values())
-    
-    def _load_file(self, name: str):
-        self._add_campaign_from_path(f'data/campaigns/{name}.json')
-    
-    def _load_all_files(self):
-        all_files = all_files_in('data/campaigns')
-        for file in all_files:
-            self._add_campaign_from_path(file)
-        self._all_loaded = True
-        
-    def _add_campaign_from_path(self, path: str):
-        as_json = read_json_file(path)
-        as_json["areas"] = [self._load_area(area) for area in as_json["areas"]]
-        campaign = Campaign(**as_json)
-        self._campaigns[campaign.name] = campaign
-
-    def _load_area(self, as_json: dict) -> Area:
-        as_json['levels'] = [self._load_level(level) for level in as_json['levels']]
+        return [self.get(name) for name in self.get_names()]
+
+    def get_names(self) -> list[str]:
+        return list(self._get_paths().keys())
+
+    def _get_paths(self) -> dict[str, str]:
+        if self._paths is None:
+            self._paths = {
+                self._bundle.load(path, index_campaign_file).name: path
+                for path in all_files_in(self._folder)
+                if path.endswith(".json")
+            }
+            self._bundle.save() # once for every file indexed
+        return self._paths
+
+    def _load_campaign(self, path: str) -> Campaign:
+        with open(path, mode='r') as file:
+            text = file.read()
+        index = self._bundle.load(path, index_campaign_file)
+        if index.length != len(text):
+            index = index_campaign_text(text) # changed since it was indexed
+
+        def load_area(i: int) -> Area:
+            return self._load_area(text, index.areas[i])
+        return Campaign(name=index.name, areas=LazySequence(len(index.areas), load_area))
+
+    def _load_area(self, text: str, index: AreaIndex) -> Area:
+        as_json = {key: json.loads(text[start:end]) for key, start, end in index.fields}
+        def load_level(i: int) -> Level:
+            start, end = index.levels[i]
+            return self._load_level(json.loads(text[start:end]))
+        as_json["levels"] = LazySequence(len(index.levels), load_level)
         return Area(**as_json)
     
     def _load_level(self, as_json: dict) -> Level:
@@ -4,42 +4,90 @@ objects in the program
 """
 
 from maelstrom.characters.specification import CharacterSpecification
-from maelstrom.dataClasses.activeAbilities import AbstractActive, createDefaultActives, getActiveAbilityList
+from maelstrom.dataClasses.activeAbilities import AbstractActive, createDefaultActives, getActive
 from maelstrom.dataClasses.character import Character
-from maelstrom.loaders.character_template_loader import CharacterTemplateLoader
-
-NAME_TO_ACTIVE = dict()
-for active in getActiveAbilityList():
-    NAME_TO_ACTIVE[active.name] = active
+from maelstrom.loaders.template_registry import ENEMIES_PATH, TemplateRegistry, get_template_registry
 
 class EnemyLoader:
     """
     loads enemies based upon templates
+
+    The first enemy loaded with each name and level is kept as a prototype,
+    and later ones are cloned from it. If pooling is enabled, enemies given to
+    release are reused by later loads rather than cloning new ones.
     """
     
-    def __init__(self):
-        self._templates = CharacterTemplateLoader()
-        self._templates.load_character_template_file("data/character-templates/enemies.csv")
+    def __init__(self, templates: TemplateRegistry = None, pool_size: int = 0):
+        """
+        templates defaults to the shared enemy templates.
+        pool_size is how many released enemies with each name and level to
+        keep for reuse. 0 disables pooling.
+        """
+        if pool_size < 0:
+            raise ValueError(f'pool_size must not be negative, so {pool_size} is not allowed')
+        self._templates = get_template_registry(ENEMIES_PATH) if templates is None else templates
+        self._pool_size = pool_size
+        self._prototypes: dict[tuple[str, int], Character] = dict()
+        self._pools: dict[tuple[str, int], list[Character]] = dict()
+        self._pooled: set[int] = set()
+        """
+        the id of each enemy in a pool, so releasing an enemy twice does not
+        pool it twice. Pooled enemies are referenced by their pool, so their
+        ids are not reused.
+        """
 
-    def load(self, name: str) -> Character:
+    def load(self, name: str, level: int = 1) -> Character:
         """
-        constructs a character with the given name, if a template for such a 
-        character exists in the repository
+        constructs a character with the given name and level, if a template
+        for such a character exists in the repository
         """
+        key = (name.lower(), level)
+        prototype = self._prototypes.get(key)
+        if prototype is None:
+            prototype = self._construct(name, level)
+            self._prototypes[key] = prototype
+
+        pool = self._pools.get(key)
+        if pool:
+            reused = pool.pop()
+            self._pooled.discard(id(reused))
+            return prototype.clone(reused)
+        return prototype.clone()
+
+    def _construct(self, name: str, level: int) -> Character:
         template = self._templates.get_character_template_by_name(name)
         if template is None:
             raise ValueError(f'invalid character name: {name}')
         constructed = Character(
             template=template,
-            specification=CharacterSpecification(name=name),
+            specification=CharacterSpecification(name=name, level=level),
             actives=createDefaultActives(template.element)
         )
-        return constructed        
+        return constructed
+
+    def release(self, enemies: list[Character]):
+        """
+        Lets the given enemies, which were loaded by this, be reused by later
+        loads once their encounter is over. Does nothing unless pooling is
+        enabled. The enemies must not be used after this. Releasing an enemy
+        which is already released does nothing.
+        """
+        if self._pool_size == 0:
+            return
+        for enemy in enemies:
+            key = (enemy.name.lower(), enemy.level)
+            if key not in self._prototypes or id(enemy) in self._pooled:
+                continue # not loaded by this, or already released
+            pool = self._pools.setdefault(key, [])
+            if len(pool) < self._pool_size:
+                pool.append(enemy)
+                self._pooled.add(id(enemy))
 
     def get_options(self) -> list[str]:
         return [option.name for option in self._templates.get_all_character_templates()]
 
 def load_active(name: str) -> AbstractActive:
-    if name not in NAME_TO_ACTIVE:
-        raise Exception(f'no active defined with name "{name}"')
-    return NAME_TO_ACTIVE[name]
+    """
+    returns the shared active with the given name
+    """
+    return getActive(name)
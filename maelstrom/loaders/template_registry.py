@@ -0,0 +1,76 @@
+"""
+This module shares character templates between every loader in the process, so
+each template file is read and parsed only once, no matter how many games,
+sessions, or loaders use it.
+
+Registries never change once built, so they are safe to share between threads.
+Loading them before starting worker processes lets forked workers inherit them
+rather than parsing the files again. Parsed templates are also kept in the
+default data bundle, so new processes needn't parse them either.
+"""
+
+import os
+import threading
+from types import MappingProxyType
+from maelstrom.characters.template import CharacterTemplate
+from maelstrom.loaders.bundle import get_default_bundle
+from maelstrom.loaders.character_template_loader import CharacterTemplateLoader
+
+STARTERS_PATH = "data/character-templates/starters.csv"
+ENEMIES_PATH = "data/character-templates/enemies.csv"
+
+class TemplateRegistry:
+    """
+    A read-only collection of character templates, indexed by lowercase name
+    and by element
+    """
+
+    def __init__(self, templates: list[CharacterTemplate]):
+        # later templates replace earlier ones with the same name
+        self._by_name = MappingProxyType({template.name.lower(): template for template in templates})
+        self._all = tuple(self._by_name.values())
+        by_element: dict[str, list[CharacterTemplate]] = dict()
+        for template in self._all:
+            by_element.setdefault(template.element.lower(), []).append(template)
+        self._by_element = MappingProxyType({element: tuple(templates) for element, templates in by_element.items()})
+
+    def get_character_template_by_name(self, name: str) -> CharacterTemplate|None:
+        return self._by_name.get(name.lower())
+
+    def get_character_templates_by_element(self, element: str) -> tuple[CharacterTemplate, ...]:
+        return self._by_element.get(element.lower(), ())
+
+    def get_all_character_templates(self) -> list[CharacterTemplate]:
+        return list(self._all)
+
+_registries: dict[str, TemplateRegistry] = dict()
+_registries_lock = threading.Lock()
+
+def get_template_registry(path: str) -> TemplateRegistry:
+    """
+    Returns the registry of templates in the given CSV file, loading it the
+    first time it is asked for
+    """
+    key = os.path.abspath(path)
+    registry = _registries.get(key)
+    if registry is None:
+        with _registries_lock:
+            registry = _registries.get(key) # another thread may have loaded it while this waited
+            if registry is None:
+                registry = TemplateRegistry(get_default_bundle().load(path, _parse_template_file))
+                _registries[key] = registry
+    return registry
+
+def _parse_template_file(path: str) -> list[CharacterTemplate]:
+    loader = CharacterTemplateLoader()
+    loader.load_character_template_file(path)
+    return loader.get_all_character_templates()
+
+def preload_template_registries():
+    """
+    Loads the starter and enemy templates, such as before forking workers,
+    then saves any which were parsed to the default bundle
+    """
+    get_template_registry(STARTERS_PATH)
+    get_template_registry(ENEMIES_PATH)
+    get_default_bundle().save()
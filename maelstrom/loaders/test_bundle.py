@@ -0,0 +1,100 @@
+import os
+import tempfile
+import unittest
+from maelstrom.loaders.bundle import DEFAULT_BUNDLE_PATH, DataBundle, get_default_bundle, set_default_bundle
+
+class CountingParser:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, path: str) -> list[str]:
+        self.calls += 1
+        with open(path) as file:
+            return file.read().split()
+
+class TestDataBundle(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self.folder.name, "source.txt")
+        self.path = os.path.join(self.folder.name, "cache", "data.bundle")
+        self._write_source("a b c")
+        self.parse = CountingParser()
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def _write_source(self, contents: str, mtime_ns: int = 1_000_000_000):
+        with open(self.source, "w") as file:
+            file.write(contents)
+        os.utime(self.source, ns=(mtime_ns, mtime_ns))
+
+    def _load_and_save(self) -> list[str]:
+        bundle = DataBundle(self.path)
+        value = bundle.load(self.source, self.parse)
+        bundle.save()
+        return value
+
+    def test_loads_from_saved_bundle(self):
+        self._load_and_save()
+
+        actual = DataBundle(self.path).load(self.source, self.parse)
+
+        self.assertEqual(["a", "b", "c"], actual)
+        self.assertEqual(1, self.parse.calls)
+
+    def test_waits_for_save(self):
+        sut = DataBundle(self.path)
+
+        sut.load(self.source, self.parse)
+        sut.load(self.source, self.parse)
+
+        self.assertFalse(os.path.exists(self.path))
+        self.assertEqual(1, self.parse.calls)
+        sut.save()
+        self.assertTrue(os.path.exists(self.path))
+
+    def test_parses_again_when_changed(self):
+        self._load_and_save()
+        self._write_source("d e f", 2_000_000_000)
+
+        actual = DataBundle(self.path).load(self.source, self.parse)
+
+        self.assertEqual(["d", "e", "f"], actual)
+        self.assertEqual(2, self.parse.calls)
+
+    def test_touched_file_uses_hash(self):
+        self._load_and_save()
+        self._write_source("a b c", 2_000_000_000)
+
+        self._load_and_save()
+        self._load_and_save()
+
+        self.assertEqual(1, self.parse.calls)
+
+    def test_ignores_corrupt_bundle(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "wb") as file:
+            file.write(b"not a bundle")
+
+        actual = self._load_and_save()
+
+        self.assertEqual(["a", "b", "c"], actual)
+        self.assertEqual(["a", "b", "c"], DataBundle(self.path).load(self.source, self.parse))
+        self.assertEqual(1, self.parse.calls)
+
+class TestDefaultBundle(unittest.TestCase):
+    def test_path_does_not_depend_on_working_directory(self):
+        self.assertTrue(os.path.isabs(DEFAULT_BUNDLE_PATH))
+
+    def test_can_be_replaced(self):
+        original = get_default_bundle()
+        with tempfile.TemporaryDirectory() as folder:
+            replacement = DataBundle(os.path.join(folder, "data.bundle"))
+            set_default_bundle(replacement)
+            try:
+                self.assertIs(replacement, get_default_bundle())
+            finally:
+                set_default_bundle(original)
+
+if __name__ == "__main__":
+    unittest.main()
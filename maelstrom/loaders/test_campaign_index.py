@@ -0,0 +1,44 @@
+import json
+import unittest
+from maelstrom.loaders.campaign_index import index_campaign_text, scan_array, skip_value
+
+CAMPAIGN = """{
+    "name": "Test",
+    "areas": [
+        {"name": "A", "description": "has [brackets] and \\"{quotes}\\"", "levels": [{"name": "1"}, {"name": "2"}]},
+        {"levels": [], "name": "B", "description": ""}
+    ]
+}"""
+
+class TestCampaignIndex(unittest.TestCase):
+    def test_index(self):
+        actual = index_campaign_text(CAMPAIGN)
+
+        self.assertEqual("Test", actual.name)
+        self.assertEqual(2, len(actual.areas))
+        start, end = actual.areas[0].levels[1]
+        self.assertEqual({"name": "2"}, json.loads(CAMPAIGN[start:end]))
+        self.assertEqual((), actual.areas[1].levels)
+        key, start, end = actual.areas[0].fields[1]
+        self.assertEqual("description", key)
+        self.assertEqual('has [brackets] and "{quotes}"', json.loads(CAMPAIGN[start:end]))
+
+    def test_scan_array(self):
+        text = '[1, {"b": "]"} , [] ]'
+        items = []
+        def scan_item(start: int) -> int:
+            end = skip_value(text, start)
+            items.append(json.loads(text[start:end]))
+            return end
+
+        self.assertEqual(len(text), scan_array(text, 0, scan_item))
+        self.assertEqual([1, {"b": "]"}, []], items)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            index_campaign_text('{"name": "Test", "areas": [}')
+        with self.assertRaises(ValueError):
+            index_campaign_text('{"areas": []}')
+
+if __name__ == "__main__":
+    unittest.main()
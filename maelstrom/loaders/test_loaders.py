@@ -1,6 +1,15 @@
+import json
+import os
+import tempfile
 import unittest
 from maelstrom.characters.template import CharacterTemplate
+from maelstrom.dataClasses.stat_classes import Boost
+from maelstrom.loaders.bundle import DataBundle
+from maelstrom.loaders.campaignloader import JsonFolderCampaignLoader
+from maelstrom.loaders.character_loader import EnemyLoader
 from maelstrom.loaders.character_template_loader import CharacterTemplateLoader
+from maelstrom.loaders.template_registry import ENEMIES_PATH, TemplateRegistry, get_template_registry
+from maelstrom.loaders.user_repository import UserRepository, is_valid_user_name
 
 class TestLoaders(unittest.TestCase):
     def test_CharacterTemplateLoader(self):
@@ -17,4 +26,116 @@ class TestLoaders(unittest.TestCase):
         sut.load_character_template_file("data/character-templates/enemies.csv")
         actual = sut.get_all_character_templates()
 
-        self.assertNotEqual(0, len(actual))
\ No newline at end of file
+        self.assertNotEqual(0, len(actual))
+
+class TestTemplateRegistry(unittest.TestCase):
+    def test_indexes(self):
+        sut = TemplateRegistry([CharacterTemplate('Foo', 'Wind'), CharacterTemplate('bar', 'wind'), CharacterTemplate('baz', 'rain')])
+        self.assertEqual('Foo', sut.get_character_template_by_name('FOO').name)
+        self.assertEqual(['Foo', 'bar'], [t.name for t in sut.get_character_templates_by_element('wind')])
+        self.assertEqual((), sut.get_character_templates_by_element('hail'))
+
+    def test_loaded_once(self):
+        first = get_template_registry(ENEMIES_PATH)
+        self.assertIs(first, get_template_registry(ENEMIES_PATH))
+        self.assertIs(first, EnemyLoader()._templates)
+        self.assertNotEqual(0, len(first.get_all_character_templates()))
+
+class TestEnemyLoader(unittest.TestCase):
+    def test_clones_are_separate(self):
+        sut = EnemyLoader()
+        name = sut.get_options()[0]
+
+        first = sut.load(name, 3)
+        second = sut.load(name, 3)
+        first.take_damage(10)
+
+        self.assertIsNot(first, second)
+        self.assertIsNot(first.stats[0], second.stats[0])
+        self.assertEqual(3, second.level)
+        self.assertEqual(100, second.remaining_hp)
+        self.assertEqual([s.get() for s in first.stats], [s.get() for s in second.stats])
+
+    def test_pool_reuses_released(self):
+        sut = EnemyLoader(pool_size=1)
+        name = sut.get_options()[0]
+        enemy = sut.load(name, 2)
+        enemy.take_damage(50)
+        enemy.stats[0].boost(Boost("control", 0.5, -1))
+
+        sut.release([enemy])
+        reused = sut.load(name, 2)
+
+        self.assertIs(enemy, reused)
+        self.assertEqual(100, reused.remaining_hp)
+        self.assertEqual([], reused.stats[0].boosts)
+        self.assertIsNot(enemy, sut.load(name, 2))
+
+    def test_double_release_pools_once(self):
+        sut = EnemyLoader(pool_size=2)
+        name = sut.get_options()[0]
+        enemy = sut.load(name, 2)
+
+        sut.release([enemy])
+        sut.release([enemy, enemy])
+        first = sut.load(name, 2)
+        second = sut.load(name, 2)
+
+        self.assertIs(enemy, first)
+        self.assertIsNot(first, second)
+
+        sut.release([first])
+        self.assertIs(enemy, sut.load(name, 2))
+
+class TestUserRepository(unittest.TestCase):
+    def test_valid_user_names(self):
+        self.assertTrue(is_valid_user_name("Some_User-2"))
+        for name in ["", "  ", "../../x", "a/b", "a\\b", "C:x", ".."]:
+            self.assertFalse(is_valid_user_name(name), name)
+
+    def test_rejects_paths_outside_folder(self):
+        with tempfile.TemporaryDirectory() as folder:
+            sut = UserRepository(os.path.join(folder, "users"))
+
+            with self.assertRaises(ValueError):
+                sut.load_user("../x")
+
+class TestJsonFolderCampaignLoader(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        campaign = {
+            "name": "Named Differently",
+            "areas": [{"name": "Area", "description": "", "levels": [
+                {"name": "Level", "description": "", "prescript": "", "postscript": "", "enemy_names": [], "enemy_level": 1}
+            ]}]
+        }
+        with open(os.path.join(self.folder.name, "campaign.json"), "w") as file:
+            json.dump(campaign, file)
+        self.sut = JsonFolderCampaignLoader(DataBundle(os.path.join(self.folder.name, "data.bundle")), self.folder.name)
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_get_by_campaign_name(self):
+        self.assertIsNone(self.sut.get("campaign"))
+        self.assertEqual(["Named Differently"], self.sut.get_names())
+        self.assertEqual("Level", self.sut.get("Named Differently").get_area(0).levels[0].name)
+
+    def test_levels_parsed_when_accessed(self):
+        sut = CountingCampaignLoader(DataBundle(os.path.join(self.folder.name, "data.bundle")), self.folder.name)
+        area = sut.get_all()[0].get_area(0)
+        self.assertEqual(0, sut.levels_loaded)
+
+        area.levels[0]
+        area.levels[0]
+
+        self.assertEqual(1, sut.levels_loaded)
+
+class CountingCampaignLoader(JsonFolderCampaignLoader):
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.levels_loaded = 0
+
+    def _load_level(self, as_json: dict):
+        self.levels_loaded += 1
+        return super()._load_level(as_json)
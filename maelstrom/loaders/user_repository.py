@@ -5,22 +5,34 @@ This module is responsible for loading and storing users.
 import json
 from os import walk
 import os
+import re
 from maelstrom.characters.specification import json_dict_to_character_specification
 from maelstrom.dataClasses.character import Character
 from maelstrom.dataClasses.team import Team
-from maelstrom.loaders.character_template_loader import CharacterTemplateLoader
+from maelstrom.loaders.template_registry import STARTERS_PATH, get_template_registry
 from maelstrom.util.user import User
 from maelstrom.loaders.character_loader import load_active
 
+_VALID_USER_NAME = re.compile(r"[A-Za-z0-9_ -]+")
+
+def is_valid_user_name(name: str) -> bool:
+    """
+    User names become file names, and may come from remote players, so only
+    letters, digits, spaces, underscores, and hyphens are allowed
+    """
+    return _VALID_USER_NAME.fullmatch(name) is not None and not name.isspace()
+
 class UserRepository:
     """
     Loads and stores users.
     """
 
-    def __init__(self):
-        self._folder = os.path.abspath("users")
-        self._character_templates = CharacterTemplateLoader()
-        self._character_templates.load_character_template_file("data/character-templates/starters.csv")
+    def __init__(self, folder: str = "users"):
+        """
+        users are stored as JSON files in the given folder
+        """
+        self._folder = os.path.abspath(folder)
+        self._character_templates = get_template_registry(STARTERS_PATH)
 
     def get_user_names(self) -> list[str]:
         """
@@ -67,5 +79,10 @@ class UserRepository:
             file.write(as_str)
 
     def _get_path_by_user_name(self, user_name: str) -> str:
+        """
+        Raises a ValueError if the name could lead outside this' folder
+        """
+        if not is_valid_user_name(user_name):
+            raise ValueError(f'invalid user name: {user_name!r}')
         file_name = user_name.replace(" ", "_") + ".json"
         return os.path.join(self._folder, file_name)
@@ -0,0 +1,65 @@
+"""
+This module hosts many games at once as tasks on a single asyncio event loop.
+
+Each game is given its own user interface and config when it is created, so
+sessions share nothing except the read-only loaders passed to them. User
+interfaces used by hosted games must await their input rather than block.
+"""
+
+import asyncio
+
+class SessionHost:
+    """
+    Runs games as asyncio tasks until they finish.
+    Games are anything with an async `run` method, such as game.Game.
+    """
+
+    def __init__(self):
+        self._sessions: dict[int, asyncio.Task] = dict()
+        self._next_id = 0
+        self.failures: list[BaseException] = []
+        """
+        exceptions raised by sessions which crashed
+        """
+
+    def open_session(self, game) -> int:
+        """
+        Starts running the given game, returning the ID of its session.
+        Must be called while the event loop is running.
+        """
+        session_id = self._next_id
+        self._next_id += 1
+        self._sessions[session_id] = asyncio.create_task(self._run(session_id, game))
+        return session_id
+
+    @property
+    def session_count(self) -> int:
+        """
+        how many sessions are still running
+        """
+        return len(self._sessions)
+
+    async def wait_closed(self):
+        """
+        Waits until every session, including any opened while waiting, has
+        finished
+        """
+        while len(self._sessions) > 0:
+            await asyncio.gather(*self._sessions.values())
+
+    def close_all(self):
+        """
+        Cancels every running session
+        """
+        for task in self._sessions.values():
+            task.cancel()
+
+    async def _run(self, session_id: int, game):
+        try:
+            await game.run()
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            self.failures.append(e)
+        finally:
+            del self._sessions[session_id]
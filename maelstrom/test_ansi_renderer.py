@@ -0,0 +1,56 @@
+import os
+import unittest
+from maelstrom.ansi_renderer import AnsiRenderer
+from maelstrom.io import ListOutputChannel
+
+class TestAnsiRenderer(unittest.TestCase):
+    def test_first_frame_clears(self):
+        output = ListOutputChannel()
+
+        AnsiRenderer(output).render(["a", "b"])
+
+        self.assertEqual("\x1b[2J\x1b[1;1Ha\x1b[K\x1b[2;1Hb\x1b[K\x1b[3;1H\x1b[J", output.messages[0])
+
+    def test_redraws_changed_rows(self):
+        output = ListOutputChannel()
+        renderer = AnsiRenderer(output)
+        renderer.render(["a", "b", "c"])
+
+        renderer.render(["a", "x"])
+
+        self.assertEqual("\x1b[2;1Hx\x1b[K\x1b[3;1H\x1b[J", output.messages[1])
+
+    def test_invalidate(self):
+        output = ListOutputChannel()
+        renderer = AnsiRenderer(output)
+        renderer.render(["a"])
+        renderer.invalidate()
+
+        renderer.render(["a"])
+
+        self.assertEqual(output.messages[0], output.messages[1])
+
+    def test_text_below_keeps_frame(self):
+        output = ListOutputChannel()
+        renderer = AnsiRenderer(output, lambda: os.terminal_size((10, 5)))
+        renderer.render(["a", "b"])
+
+        renderer.note_below("prompt: ")
+        renderer.note_below("typed\n")
+        renderer.render(["a", "x"])
+
+        self.assertEqual("\x1b[2;1Hx\x1b[K\x1b[3;1H\x1b[J", output.messages[1])
+
+    def test_scrolling_text_below_redraws(self):
+        output = ListOutputChannel()
+        renderer = AnsiRenderer(output, lambda: os.terminal_size((10, 5)))
+        renderer.render(["a", "b"])
+
+        renderer.note_below("a prompt that wraps: ")
+        renderer.note_below("typed\n")
+        renderer.render(["a", "b"])
+
+        self.assertEqual(output.messages[0], output.messages[1])
+
+if __name__ == "__main__":
+    unittest.main()
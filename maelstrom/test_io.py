@@ -1,5 +1,8 @@
+import asyncio
+import io
+import os
 from unittest import TestCase
-from maelstrom.io import Chooser, ListInputChannel, ListOutputChannel
+from maelstrom.io import AsyncChooser, BufferedOutputChannel, Chooser, ListInputChannel, ListOutputChannel, RingBufferOutputChannel, StandardAsyncInputChannel
 
 class TestIO(TestCase):
     def test_read_int(self):
@@ -29,4 +32,81 @@ class TestIO(TestCase):
         output_channel = ListOutputChannel()
         sut = Chooser(input_channel, output_channel)
         with self.assertRaises(IndexError):
-            sut.choose('prompt', ['a', 'b', 'c'])
\ No newline at end of file
+            sut.choose('prompt', ['a', 'b', 'c'])
+
+    def test_list_output_channel(self):
+        sut = ListOutputChannel()
+        sut.write('a', 1)
+        sut.write('b', 'c', sep='-', end='')
+        self.assertEqual(['a 1\n', 'b-c'], sut.messages)
+
+    def test_ring_buffer_keeps_latest(self):
+        sut = RingBufferOutputChannel(2)
+        for message in ['a', 'b', 'c']:
+            sut.write(message)
+        self.assertEqual(['b\n', 'c\n'], sut.messages)
+
+    def test_buffered_writes_once(self):
+        stream = RecordingStream()
+        sut = BufferedOutputChannel(stream)
+        sut.write('row 1')
+        sut.write('row 2')
+        self.assertEqual([], stream.writes)
+
+        sut.flush()
+
+        self.assertEqual(['row 1\nrow 2\n'], stream.writes)
+        self.assertEqual(1, stream.flushes)
+
+    def test_buffered_flush_argument(self):
+        stream = RecordingStream()
+        sut = BufferedOutputChannel(stream)
+        sut.write('prompt: ', end='', flush=True)
+        self.assertEqual(['prompt: '], stream.writes)
+
+    def test_async_chooser(self):
+        input_channel = StandardAsyncInputChannel(io.StringIO('foo\n2\n'))
+        sut = AsyncChooser(input_channel, ListOutputChannel())
+        actual = asyncio.run(sut.choose('prompt', ['a', 'b', 'c']))
+        self.assertEqual('b', actual)
+
+    def test_async_read_at_end(self):
+        sut = StandardAsyncInputChannel(io.StringIO('last\n'))
+        async def read_twice():
+            await sut.read()
+            await sut.read()
+        with self.assertRaises(EOFError):
+            asyncio.run(read_twice())
+
+    def test_async_read_does_not_block_loop(self):
+        read_end, write_end = os.pipe()
+        with os.fdopen(read_end) as stream, os.fdopen(write_end, 'w') as writer:
+            sut = StandardAsyncInputChannel(stream)
+            ticks = []
+
+            async def other_task():
+                for i in range(3):
+                    ticks.append(i)
+                    await asyncio.sleep(0.01)
+                writer.write('typed\n')
+                writer.flush()
+
+            async def main():
+                task = asyncio.create_task(other_task())
+                line = await sut.read()
+                await task
+                return line
+
+            self.assertEqual('typed', asyncio.run(main()))
+            self.assertEqual([0, 1, 2], ticks)
+
+class RecordingStream:
+    def __init__(self):
+        self.writes = []
+        self.flushes = 0
+
+    def write(self, text: str):
+        self.writes.append(text)
+
+    def flush(self):
+        self.flushes += 1
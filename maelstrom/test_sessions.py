@@ -0,0 +1,50 @@
+import asyncio
+import unittest
+from maelstrom.sessions import SessionHost
+from maelstrom.ui import Choice, Screen
+from maelstrom.ui_scripted import ScriptedUI
+
+class CountingGame:
+    def __init__(self, ui: ScriptedUI, screens: int):
+        self.ui = ui
+        self.screens = screens
+        self.choices = []
+
+    async def run(self):
+        for i in range(self.screens):
+            self.choices.append(await self.ui.display_and_choose(Screen(choice=Choice("pick", [i, i + 1]))))
+
+class FailingGame:
+    async def run(self):
+        raise ValueError("oops")
+
+class TestSessionHost(unittest.TestCase):
+    def test_runs_sessions_concurrently(self):
+        games = [CountingGame(ScriptedUI(lambda screen: screen.choice.options[-1]), 5) for _ in range(3)]
+        host = SessionHost()
+
+        async def run():
+            for game in games:
+                host.open_session(game)
+            self.assertEqual(3, host.session_count)
+            await host.wait_closed()
+        asyncio.run(run())
+
+        self.assertEqual(0, host.session_count)
+        for game in games:
+            self.assertEqual([1, 2, 3, 4, 5], game.choices)
+            self.assertEqual(4, len(game.ui.screen_latencies))
+
+    def test_records_failures(self):
+        host = SessionHost()
+
+        async def run():
+            host.open_session(FailingGame())
+            await host.wait_closed()
+        asyncio.run(run())
+
+        self.assertEqual(1, len(host.failures))
+        self.assertIsInstance(host.failures[0], ValueError)
+
+if __name__ == "__main__":
+    unittest.main()
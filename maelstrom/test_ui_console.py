@@ -0,0 +1,65 @@
+import asyncio
+import os
+import unittest
+from maelstrom.io import AsyncInputChannel, ListOutputChannel
+from maelstrom.ui import Choice, Screen
+from maelstrom.ui_console import SCREEN_COLS, ConsoleUI, _blank_row, _format_bordered_row, _format_scoreboard_rows, _wrap
+from maelstrom.util.config import Config
+
+class TestConsoleFormatting(unittest.TestCase):
+    def test_wrap_breaks_at_spaces(self):
+        actual = _wrap("aaa bbb ccc", 9)
+        self.assertEqual(("aaa bbb ", "ccc"), actual)
+
+    def test_bordered_row_is_cached(self):
+        first = _format_bordered_row("some text")
+        second = _format_bordered_row("some text")
+        self.assertIs(first, second)
+        self.assertEqual(f'# {"some text".ljust(SCREEN_COLS - 4)} #', first[0])
+
+    def test_scoreboard_pads_shorter_side(self):
+        actual = _format_scoreboard_rows("a\nb", "c")
+        self.assertEqual(2, len(actual))
+        self.assertTrue(actual[1].endswith(_blank_row(SCREEN_COLS // 2)))
+
+class ListAsyncInputChannel(AsyncInputChannel):
+    def __init__(self, inputs: list[str]):
+        self._inputs = list(inputs)
+
+    async def read(self) -> str:
+        return self._inputs.pop(0)
+
+class TestConsoleUI(unittest.TestCase):
+    def _play_twice(self, terminal_size: os.terminal_size) -> tuple[ConsoleUI, Screen, str]:
+        """
+        returns the UI, the screen it chose from twice, and what it drew after
+        the first choice
+        """
+        output = ListOutputChannel()
+        sut = ConsoleUI(Config(keep_output=False), ListAsyncInputChannel(["2", "1"]), output)
+        sut._renderer._get_terminal_size = lambda: terminal_size
+        screen = Screen(title="title", choice=Choice("pick one", ["a", "b"]))
+
+        asyncio.run(sut.display_and_choose(screen))
+        frames_before = len(output.messages)
+        screen.body_rows.append("changed")
+        asyncio.run(sut.display_and_choose(screen))
+
+        return (sut, screen, output.messages[frames_before])
+
+    def test_redraws_changed_rows_after_prompt(self):
+        sut, screen, second_frame = self._play_twice(os.terminal_size((80, 50)))
+
+        self.assertFalse(second_frame.startswith("\x1b[2J"))
+        self.assertIn(_format_bordered_row("changed")[0], second_frame)
+        self.assertNotIn(sut._format_frames(screen)[-1][0], second_frame)
+
+    def test_redraws_everything_after_scrolling(self):
+        sut, screen, second_frame = self._play_twice(os.terminal_size((80, 24)))
+
+        self.assertTrue(second_frame.startswith("\x1b[2J"))
+        for row in sut._format_frames(screen)[-1]:
+            self.assertIn(row, second_frame)
+
+if __name__ == "__main__":
+    unittest.main()
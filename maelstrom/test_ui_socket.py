@@ -0,0 +1,60 @@
+import asyncio
+import unittest
+from maelstrom.ui import Choice, Screen
+from maelstrom.ui_socket import encode_message, read_message, start_socket_server
+
+class AskingGame:
+    def __init__(self, ui):
+        self.ui = ui
+
+    async def run(self):
+        name = await self.ui.read_text("name?")
+        choice = await self.ui.display_and_choose(Screen(title=name, choice=Choice("pick", [10, 20, 30])))
+        RESULTS.append((name, choice))
+
+RESULTS = []
+
+class TestSocketUI(unittest.TestCase):
+    def test_plays_over_socket(self):
+        RESULTS.clear()
+        received = []
+
+        async def run():
+            server = await start_socket_server(AskingGame)
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            received.append(await read_message(reader))
+            writer.write(encode_message({"s": "bob"}))
+            received.append(await read_message(reader))
+            writer.write(encode_message({"c": 2}))
+            await reader.read() # wait for the host to close the connection
+            writer.close()
+            server.close()
+            await server.wait_closed()
+        asyncio.run(run())
+
+        self.assertEqual({"ask": "name?"}, received[0])
+        self.assertEqual({"t": "bob", "l": [], "r": [], "b": [], "p": "pick", "o": ["10", "20", "30"]}, received[1])
+        self.assertEqual([("bob", 30)], RESULTS)
+
+    def test_disconnects_invalid_client(self):
+        for replies in [[{"s": 5}], [{"s": "bob"}, {"c": True}]]:
+            RESULTS.clear()
+
+            async def run():
+                server = await start_socket_server(AskingGame)
+                port = server.sockets[0].getsockname()[1]
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                for reply in replies:
+                    await read_message(reader)
+                    writer.write(encode_message(reply))
+                await reader.read()
+                writer.close()
+                server.close()
+                await server.wait_closed()
+            asyncio.run(run())
+
+            self.assertEqual([], RESULTS, replies)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,26 @@
+"""
+Helpers shared by the tests and benchmarks, for building characters without
+loading any data files
+"""
+
+from maelstrom.characters.specification import CharacterSpecification
+from maelstrom.characters.template import CharacterTemplate
+from maelstrom.dataClasses.activeAbilities import createDefaultActives
+from maelstrom.dataClasses.character import Character
+
+def make_character(name: str, level: int = 1, element: str = "wind", **stats) -> Character:
+    """
+    stats are passed to the character's CharacterTemplate, such as control=3
+    """
+    return character_from_template(CharacterTemplate(name, element, **stats), level)
+
+def character_from_template(template: CharacterTemplate, level: int = 1) -> Character:
+    """
+    returns a character with the given template and its element's default
+    actives
+    """
+    return Character(
+        template=template,
+        specification=CharacterSpecification(name=template.name, level=level),
+        actives=createDefaultActives(template.element)
+    )
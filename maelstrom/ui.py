@@ -65,4 +65,12 @@ class AbstractUserInterface(ABC):
         Displays the given screen and asks the user to make a choice.
         Returns an async thing which resolves once the user makes a choice.
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def read_text(self, prompt: str) -> str:
+        """
+        Asks the user to type something in response to the given prompt.
+        Returns an async thing which resolves to what they typed.
+        """
+        pass
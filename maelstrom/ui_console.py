@@ -1,100 +1,116 @@
+from functools import lru_cache
 from itertools import zip_longest
 import math
-import re
-import subprocess
-import sys
-from maelstrom.io import Chooser, StandardOutputChannel
+from maelstrom.ansi_renderer import AnsiRenderer
+from maelstrom.io import AsyncChooser, AsyncInputChannel, BufferedOutputChannel, OutputChannel, StandardAsyncInputChannel
 from maelstrom.ui import AbstractUserInterface, Screen
 from maelstrom.util.stringUtil import lengthOfLongest
-from maelstrom.util.config import get_global_config
+from maelstrom.util.config import Config, get_global_config
 
 SCREEN_COLS = 80
 BORDER = "#"
 OPTION_ROWS = 5
 NUM_BODY_ROWS = 10
-OUTPUT = StandardOutputChannel()
+OUTPUT = BufferedOutputChannel()
+INPUT = StandardAsyncInputChannel()
 
 class ConsoleUI(AbstractUserInterface):
+    def __init__(self, config: Config = None, input: AsyncInputChannel = None, output: OutputChannel = None):
+        """
+        config defaults to the global config, input to stdin, and output to
+        stdout
+        """
+        self._config = get_global_config() if config is None else config
+        self._input = INPUT if input is None else input
+        self._output = OUTPUT if output is None else output
+        self._renderer = None if self._config.keep_output else AnsiRenderer(self._output)
+        if self._renderer is not None:
+            # so the renderer knows how far prompts and typing move the cursor
+            self._input = _EchoNotingInputChannel(self._input, self._renderer)
+            self._output = _BelowFrameOutputChannel(self._output, self._renderer)
+
+    async def read_text(self, prompt: str) -> str:
+        self._output.write(f'{prompt} ', end="", flush=True)
+        return await self._input.read()
+
     async def display_and_choose(self, screen: Screen) -> any:
+        frames = self._format_frames(screen)
+        for frame in frames[:-1]: # more pages
+            self._draw(frame)
+            await self._wait_for_enter()
+
+        # allow player to choose once we're done displaying the body
+        self._draw(frames[-1])
+        options = [] if screen.choice is None else screen.choice.options
+        if len(options) == 0:
+            await self._wait_for_enter()
+            return None
+        else:
+            chooser = AsyncChooser(self._input, self._output)
+            return await chooser.choose(screen.choice.prompt, screen.choice.options, False)
+
+    async def _wait_for_enter(self):
+        self._output.write("press enter or return to continue", end="", flush=True)
+        await self._input.read()
+
+    def _format_frames(self, screen: Screen) -> list[list[str]]:
+        """
+        Returns the rows of each page of the given screen. The last page shows
+        the screen's options, while the others show an empty options box.
+        """
         body = []
         for scoreboard_row in zip_longest(screen.left_scoreboard, screen.right_scoreboard, fillvalue=''):
-            body.extend(self._format_scoreboard_rows(scoreboard_row[0], scoreboard_row[1]))
+            body.extend(_format_scoreboard_rows(scoreboard_row[0], scoreboard_row[1]))
         for row in screen.body_rows:
             for formatted_row in _format_bordered_row(row):
                 body.append(formatted_row)
         num_pages = math.ceil(len(body) / NUM_BODY_ROWS)
         if num_pages == 0:
             num_pages = 1 # show at least 1 page
-        for page in range(num_pages):
-            self._write_body_page(screen, body, page)
-            if page != num_pages - 1: # more pages
-                self._write_options([]) # just print empty options box
-                input("press enter or return to continue")
 
-        # allow player to choose once we're done displaying the body
-        options = [] if screen.choice is None else screen.choice.options
-        self._write_options(options)
-        if len(options) == 0:
-            input("press enter or return to continue")
-            return None
+        frames = []
+        for page in range(num_pages):
+            frame = self._format_body_page(screen, body, page)
+            if page != num_pages - 1:
+                frame.extend(self._format_options([]))
+            else:
+                frame.extend(self._format_options([] if screen.choice is None else screen.choice.options))
+            frames.append(frame)
+        return frames
+
+    def _draw(self, frame: list[str]):
+        if self._renderer is None:
+            for row in frame:
+                self._output.write(row)
+            self._output.flush()
         else:
-            user_choice = Chooser().choose(screen.choice.prompt, screen.choice.options, False)
-            return user_choice
-
-    def _format_scoreboard_rows(self, left: str, right: str) -> list[str]:
-        def style_left(content: str):
-            return _format_bordered_row(content, math.floor(SCREEN_COLS / 2))
-        def style_right(content: str):
-            return _format_bordered_row(content, math.ceil(SCREEN_COLS / 2))
-        result = []
-        left_rows = style_left(left)
-        right_rows = style_right(right)
-
-        # Pair up left and right rows. Rows with no match get paired with spaces
-        num_rows = max(len(left_rows), len(right_rows))
-        for i in range(num_rows):
-            l = style_left(" ")[0] # empty row
-            r = style_right(" ")[0]
-            if len(left_rows) > i:
-                l = left_rows[i]
-            if len(right_rows) > i:
-                r = right_rows[i]
-            result.append(f'{l}{r}')
-        return result
-    
-    def _write_body_page(self, screen: Screen, body: list[str], page: int):
-        if not get_global_config().keep_output:
-            works = subprocess.call("cls", shell=True)
-            if works != 0: # is false, didn't run
-                works = subprocess.call("clear", shell=True)
-            if works != 0:
-                print("Failed to clear the console: neither cls nor clear worked", file=sys.stderr)
-        
-        # write the title
-        self._write_horizontal_line()
+            self._renderer.render(frame)
+
+    def _format_body_page(self, screen: Screen, body: list[str], page: int) -> list[str]:
+        rows = []
+
+        # the title
+        rows.append(_horizontal_line())
         centered_title_width = SCREEN_COLS - len(BORDER + " ") * 2
         centered_title = screen.title.center(centered_title_width)
-        centered_title_row = f'{BORDER} {centered_title} {BORDER}'
-        OUTPUT.write(centered_title_row)
-        self._write_horizontal_line()    
+        rows.append(f'{BORDER} {centered_title} {BORDER}')
+        rows.append(_horizontal_line())
 
-        # write this page of the body
+        # this page of the body
         curr_line_num = page * NUM_BODY_ROWS
-        self._write_horizontal_line()
+        rows.append(_horizontal_line())
         for _ in range(NUM_BODY_ROWS):
             if curr_line_num < len(body):
                 row = body[curr_line_num]
             else:
-                row = f'{BORDER} {" " * (SCREEN_COLS - 4)} {BORDER}'
-            OUTPUT.write(row)
+                row = _blank_row(SCREEN_COLS)
+            rows.append(row)
             curr_line_num += 1
-        self._write_horizontal_line()
+        rows.append(_horizontal_line())
+        return rows
 
-    def _write_horizontal_line(self):
-        OUTPUT.write(BORDER * SCREEN_COLS)
-
-    def _write_options(self, options):
-        self._write_horizontal_line()
+    def _format_options(self, options) -> list[str]:
+        rows = [_horizontal_line()]
 
         options = [str(option) for option in options]
 
@@ -123,18 +139,82 @@ class ConsoleUI(AbstractUserInterface):
                         msg += f'{BORDER} ' # separate columns with border
                     msg += f'{(i + 1):2}: {options[i].ljust(colWidths[colNum])}'
             msg = msg.ljust(SCREEN_COLS - 4)[:(SCREEN_COLS - 4)] # justify and trim it to fit exactly
-            OUTPUT.write(f'{BORDER} {msg} {BORDER}')
-
-        self._write_horizontal_line()
-
-def _format_bordered_row(content: str, width: int = SCREEN_COLS) -> list[str]:
+            rows.append(f'{BORDER} {msg} {BORDER}')
+
+        rows.append(_horizontal_line())
+        return rows
+
+class _BelowFrameOutputChannel(OutputChannel):
+    """
+    Writes prompts below the frame, telling the renderer what was written
+    """
+
+    def __init__(self, output: OutputChannel, renderer: AnsiRenderer):
+        self._output = output
+        self._renderer = renderer
+
+    def write(self, *args, sep: str = " ", end: str = "\n", **kwargs):
+        self._output.write(*args, sep=sep, end=end, **kwargs)
+        self._renderer.note_below(sep.join(str(arg) for arg in args) + end)
+
+    def flush(self):
+        self._output.flush()
+
+class _EchoNotingInputChannel(AsyncInputChannel):
+    """
+    Tells the renderer about each line the terminal echoed as it was typed
+    """
+
+    def __init__(self, input: AsyncInputChannel, renderer: AnsiRenderer):
+        self._input = input
+        self._renderer = renderer
+
+    async def read(self) -> str:
+        line = await self._input.read()
+        self._renderer.note_below(f'{line}\n')
+        return line
+
+def _horizontal_line() -> str:
+    return BORDER * SCREEN_COLS
+
+LEFT_SCOREBOARD_COLS = math.floor(SCREEN_COLS / 2)
+RIGHT_SCOREBOARD_COLS = math.ceil(SCREEN_COLS / 2)
+FORMAT_CACHE_SIZE = 1024
+"""
+how many distinct contents each formatting function remembers. Scoreboards
+and descriptions repeat across nearly every frame of an encounter, so only a
+few are ever in use at once.
+"""
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def _format_scoreboard_rows(left: str, right: str) -> tuple[str, ...]:
+    left_rows = _format_bordered_row(left, LEFT_SCOREBOARD_COLS)
+    right_rows = _format_bordered_row(right, RIGHT_SCOREBOARD_COLS)
+
+    # Pair up left and right rows. Rows with no match get paired with spaces
+    empty_left = _blank_row(LEFT_SCOREBOARD_COLS)
+    empty_right = _blank_row(RIGHT_SCOREBOARD_COLS)
+    result = []
+    for i in range(max(len(left_rows), len(right_rows))):
+        l = left_rows[i] if i < len(left_rows) else empty_left
+        r = right_rows[i] if i < len(right_rows) else empty_right
+        result.append(f'{l}{r}')
+    return tuple(result)
+
+@lru_cache(maxsize=None) # only a few widths are used
+def _blank_row(width: int) -> str:
+    return f'{BORDER} {" " * (width - 4)} {BORDER}'
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def _format_bordered_row(content: str, width: int = SCREEN_COLS) -> tuple[str, ...]:
     rows = []
     content = content.replace("\t", " " * 4)
     for line in content.split("\n"):
         rows.extend(_wrap(line, width))
-    return [f'{BORDER} {row.ljust(width - 4)} {BORDER}' for row in rows]
+    return tuple(f'{BORDER} {row.ljust(width - 4)} {BORDER}' for row in rows)
 
-def _wrap(msg: str, width: int) -> list[str]:
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def _wrap(msg: str, width: int) -> tuple[str, ...]:
     lines = []
     line = msg.replace("\t", " " * 4)
     if len(line.strip()) == 0: # catch purposely empty lines
@@ -142,8 +222,7 @@ def _wrap(msg: str, width: int) -> list[str]:
 
     while len(line.strip()) != 0:
         wordBreak = line.rfind(" ", 0, width)
-        firstNonSpace = re.search("[^ ]", line)
-        indent = 0 if not firstNonSpace else firstNonSpace.start()
+        indent = len(line) - len(line.lstrip(" "))
         take = -1
         if len(line) < width: # fits
             take = width
@@ -154,4 +233,4 @@ def _wrap(msg: str, width: int) -> list[str]:
         lines.append(line[:take])
         line = line[take:].rjust(indent)
 
-    return lines
\ No newline at end of file
+    return tuple(lines)
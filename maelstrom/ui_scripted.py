@@ -0,0 +1,48 @@
+"""
+A user interface whose choices are made by code, for tests and load testing.
+"""
+
+import asyncio
+import time
+from typing import Callable
+from maelstrom.ui import AbstractUserInterface, Screen
+
+class ScriptedUI(AbstractUserInterface):
+    """
+    Makes choices using a function instead of asking a person, and records how
+    long the game took to produce each screen after the previous choice.
+    """
+
+    def __init__(self, choose: Callable[[Screen], any], text: str = "", think_time: float = 0.0):
+        """
+        choose is called with each screen which has a choice, and returns the
+        option to choose.
+        text is what is typed whenever the game asks for text.
+        think_time is how many seconds to wait before each choice, which also
+        lets other tasks run.
+        """
+        self._choose = choose
+        self._text = text
+        self._think_time = think_time
+        self._last_choice_time = None
+        self.screen_latencies: list[float] = []
+        """
+        seconds between each choice being made and the next screen being displayed
+        """
+
+    async def display_and_choose(self, screen: Screen) -> any:
+        self._record_latency()
+        await asyncio.sleep(self._think_time)
+        choice = None if screen.choice is None else self._choose(screen)
+        self._last_choice_time = time.perf_counter()
+        return choice
+
+    async def read_text(self, prompt: str) -> str:
+        self._record_latency()
+        await asyncio.sleep(self._think_time)
+        self._last_choice_time = time.perf_counter()
+        return self._text
+
+    def _record_latency(self):
+        if self._last_choice_time is not None:
+            self.screen_latencies.append(time.perf_counter() - self._last_choice_time)
@@ -0,0 +1,114 @@
+"""
+A user interface which plays games over a socket, so one process can host many
+remote players.
+
+Messages in both directions are JSON objects, each sent as a 4 byte big-endian
+length followed by that many bytes of UTF-8. The host sends either
+* a screen: {"t": title, "l": left scoreboard, "r": right scoreboard,
+  "b": body rows, "p": prompt, "o": option names}, where "p" and "o" are only
+  present if the screen has a choice. The client replies {"c": option index},
+  or {} if there is nothing to choose.
+* a text request: {"ask": prompt}. The client replies {"s": text}.
+"""
+
+import asyncio
+import json
+import struct
+from typing import Callable
+from maelstrom.ui import AbstractUserInterface, Screen
+
+_HEADER = struct.Struct(">I")
+MAX_MESSAGE_SIZE = 1 << 20
+"""
+larger messages are refused, so clients cannot make the host run out of memory
+"""
+
+class ClientError(Exception):
+    """
+    Raised when a client sends something invalid
+    """
+    pass
+
+def encode_message(message: dict) -> bytes:
+    """
+    Returns the given message framed to be sent over a socket
+    """
+    encoded = json.dumps(message, separators=(",", ":")).encode("utf-8")
+    return _HEADER.pack(len(encoded)) + encoded
+
+async def read_message(reader: asyncio.StreamReader) -> dict:
+    """
+    Reads the next framed message. Raises asyncio.IncompleteReadError if the
+    connection closes first, or a ClientError if the message is invalid.
+    """
+    (length,) = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+    if length > MAX_MESSAGE_SIZE:
+        raise ClientError(f'message of {length} bytes is too large')
+    try:
+        message = json.loads(await reader.readexactly(length))
+    except ValueError as e: # bad JSON or UTF-8
+        raise ClientError(f'invalid message: {e}')
+    if not isinstance(message, dict):
+        raise ClientError(f'expected a JSON object, not {message}')
+    return message
+
+def screen_to_message(screen: Screen) -> dict:
+    message = {
+        "t": screen.title,
+        "l": screen.left_scoreboard,
+        "r": screen.right_scoreboard,
+        "b": screen.body_rows
+    }
+    if screen.choice is not None:
+        message["p"] = screen.choice.prompt
+        message["o"] = [str(option) for option in screen.choice.options]
+    return message
+
+class SocketUI(AbstractUserInterface):
+    """
+    Sends screens to a client over a socket, and waits for their choices
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._reader = reader
+        self._writer = writer
+
+    async def display_and_choose(self, screen: Screen) -> any:
+        reply = await self._request(screen_to_message(screen))
+        if screen.choice is None or len(screen.choice.options) == 0:
+            return None
+        options = screen.choice.options
+        index = reply.get("c")
+        if not isinstance(index, int) or isinstance(index, bool) or index < 0 or len(options) <= index:
+            raise ClientError(f'client chose invalid option {index}')
+        return options[index]
+
+    async def read_text(self, prompt: str) -> str:
+        reply = await self._request({"ask": prompt})
+        text = reply.get("s")
+        if not isinstance(text, str):
+            raise ClientError(f'client sent invalid text {text}')
+        return text
+
+    async def _request(self, message: dict) -> dict:
+        self._writer.write(encode_message(message))
+        await self._writer.drain()
+        return await read_message(self._reader)
+
+async def start_socket_server(make_game: Callable[[AbstractUserInterface], any], host: str = "127.0.0.1", port: int = 0, backlog: int = 100) -> asyncio.Server:
+    """
+    Starts accepting connections, running a game created by make_game for each
+    one. make_game is given the connection's SocketUI and returns something
+    with an async `run` method, such as game.Game. port 0 picks any free port.
+    backlog is how many connections can wait to be accepted at once.
+    """
+
+    async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            await make_game(SocketUI(reader, writer)).run()
+        except (asyncio.IncompleteReadError, ConnectionError, ClientError):
+            pass # the client left or misbehaved, so end their session
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle_connection, host, port, backlog=backlog)
@@ -1,3 +1,8 @@
+from collections.abc import Sequence
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
 
 def list_extend(my_list: list[any], *args):
     """
@@ -6,3 +11,28 @@ def list_extend(my_list: list[any], *args):
     result = list(my_list)
     result.extend(args)
     return result
+
+class LazySequence(Sequence[T]):
+    """
+    A read-only sequence whose items are only created once they are accessed
+    """
+
+    def __init__(self, length: int, make_item: Callable[[int], T]):
+        """
+        make_item is called with an item's index the first time it is accessed
+        """
+        self._items: list[T|None] = [None] * length
+        self._make_item = make_item
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._items)))]
+        index = range(len(self._items))[index] # raises IndexError, and handles negative indices
+        item = self._items[index]
+        if item is None:
+            item = self._make_item(index)
+            self._items[index] = item
+        return item
@@ -1,11 +1,109 @@
+"""
+This module contains utilities for random numbers.
+
+Functions which roll random numbers accept an `rng` argument, which can be
+anything with the same `random`, `randint`, and `choice` methods as Python's
+random module. It defaults to the random module itself, while simulations and
+replays pass a RandomStream so their results can be reproduced.
+"""
+
+import hashlib
 import random
+import struct
+
+_FLOATS_PER_53_BITS = 1.0 / (1 << 53)
+
+class RandomStream:
+    """
+    A reproducible stream of random numbers, identified by a key such as
+    (seed, encounter index). Streams with different keys are independent, so
+    many encounters can be simulated in parallel.
+
+    Numbers are generated in blocks by hashing the key together with a block
+    counter, using SHAKE-128 as a counter-based generator. This means any
+    block of any stream can be recreated from its key and counter alone, and
+    that each roll only costs an index into the current block.
+    """
+
+    __slots__ = ("key", "_prefix", "_counter", "_block", "_next", "_format", "_block_bytes")
+
+    def __init__(self, *key: int, block_size: int = 256):
+        self.key = key
+        self._prefix = ":".join(str(part) for part in key).encode() + b"#"
+        self._counter = 0
+        self._block = []
+        self._next = 0
+        self._format = f'<{block_size}Q' # the struct module caches compiled formats
+        self._block_bytes = 8 * block_size
+
+    def random(self) -> float:
+        """
+        Returns a number in the range [0.0, 1.0)
+        """
+        if self._next == len(self._block):
+            self._block = self._generate_block()
+            self._next = 0
+        number = self._block[self._next]
+        self._next += 1
+        return number
+
+    def random_block(self, count: int) -> list[float]:
+        """
+        Returns the next count numbers from this stream at once
+        """
+        numbers = self._block[self._next:self._next + count]
+        self._next += len(numbers)
+        while len(numbers) < count:
+            self._block = self._generate_block()
+            self._next = min(count - len(numbers), len(self._block))
+            numbers.extend(self._block[:self._next])
+        return numbers
+
+    @property
+    def block_size(self) -> int:
+        return self._block_bytes // 8
+
+    @property
+    def position(self) -> int:
+        """
+        how many numbers have been drawn from this stream so far
+        """
+        if self._counter == 0:
+            return 0
+        return (self._counter - 1) * self.block_size + self._next
+
+    def seek(self, position: int):
+        """
+        Moves this stream so the next number drawn is the one at the given
+        position, as if that many numbers had already been drawn
+        """
+        self._counter = position // self.block_size
+        self._block = self._generate_block()
+        self._next = position % self.block_size
+
+    def randint(self, a: int, b: int) -> int:
+        """
+        Returns an integer between a and b, inclusive
+        """
+        return a + int(self.random() * (b - a + 1))
+
+    def choice(self, options):
+        """
+        Returns a random element of the given non-empty sequence
+        """
+        return options[int(self.random() * len(options))]
+
+    def _generate_block(self) -> list[float]:
+        digest = hashlib.shake_128(self._prefix + str(self._counter).encode()).digest(self._block_bytes)
+        self._counter += 1
+        return [(bits >> 11) * _FLOATS_PER_53_BITS for bits in struct.unpack(self._format, digest)]
 
-def rollPercentage(base = 0):
+def rollPercentage(base = 0, rng = random):
     """
     Chooses a random number
     between base and 100,
     use
-    rollPercentage(self.get_stat_value("luck"))
+    rollPercentage(self.get_stat(LUCK))
     """
     ret = 100
     base = int(base)
@@ -13,6 +111,6 @@ def rollPercentage(base = 0):
     if base > 100 or 0 > base:
         raise ValueError(f'base must be between 0 and 100, so {base} is not allowed')
     else:
-        ret = random.randint(base, 100)
+        ret = rng.randint(base, 100)
 
     return ret
@@ -0,0 +1,47 @@
+import unittest
+from maelstrom.util.random import RandomStream, rollPercentage
+
+class TestRandomStream(unittest.TestCase):
+    def test_same_key_same_numbers(self):
+        a = RandomStream(42, 7)
+        b = RandomStream(42, 7)
+        self.assertEqual([a.random() for _ in range(600)], [b.random() for _ in range(600)])
+
+    def test_different_keys_differ(self):
+        a = RandomStream(42, 7)
+        b = RandomStream(42, 8)
+        self.assertNotEqual([a.random() for _ in range(10)], [b.random() for _ in range(10)])
+
+    def test_random_block_matches_single_draws(self):
+        a = RandomStream(1, block_size=16)
+        b = RandomStream(1, block_size=16)
+        a.random()
+        b.random()
+        self.assertEqual([a.random() for _ in range(40)], b.random_block(40))
+        self.assertEqual(a.random(), b.random())
+
+    def test_seek_continues_where_drawn_to(self):
+        a = RandomStream(9, block_size=16)
+        a.random_block(37)
+        position = a.position
+        b = RandomStream(9, block_size=16)
+
+        b.seek(position)
+
+        self.assertEqual(37, position)
+        self.assertEqual([a.random() for _ in range(20)], [b.random() for _ in range(20)])
+        self.assertEqual(a.position, b.position)
+
+    def test_randint_bounds(self):
+        sut = RandomStream(3)
+        rolls = [sut.randint(20, 100) for _ in range(2000)]
+        self.assertEqual(20, min(rolls))
+        self.assertEqual(100, max(rolls))
+
+    def test_rollPercentage_uses_rng(self):
+        a = RandomStream(5)
+        b = RandomStream(5)
+        self.assertEqual(b.randint(30, 100), rollPercentage(30, a))
+
+if __name__ == "__main__":
+    unittest.main()
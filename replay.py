@@ -0,0 +1,33 @@
+"""
+Replays recorded encounters and checks they end the way they were recorded.
+
+Run using `python replay.py <replay file> ...`.
+See maelstrom.gameplay.replay for how to record encounters.
+"""
+
+import argparse
+import sys
+from maelstrom.gameplay.replay import ReplayMismatchError, read_replay, replay
+
+def main():
+    parser = argparse.ArgumentParser(description="replay recorded encounters")
+    parser.add_argument("files", help="replay files to check", nargs="+")
+    parser.add_argument("-v", "--verbose", help="print the result of every replay", action="store_true")
+    args = parser.parse_args()
+
+    mismatches = 0
+    for file in args.files:
+        try:
+            result = replay(read_replay(file))
+            if args.verbose:
+                print(f'{file}: OK, {result.winner or "nobody"} won after {result.turns} turns')
+        except ReplayMismatchError as e:
+            mismatches += 1
+            print(f'{file}: MISMATCH, {e}')
+
+    print(f'{len(args.files) - mismatches} of {len(args.files)} replays matched')
+    if mismatches != 0:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
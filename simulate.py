@@ -0,0 +1,30 @@
+"""
+Estimates how often a user's team beats a level.
+
+Run using `python simulate.py <user name> <level name>`.
+Use `python simulate.py -h` to view command line options.
+"""
+
+import argparse
+from maelstrom.gameplay.simulation import simulate
+
+def main():
+    parser = argparse.ArgumentParser(description="estimate a user's win rate against a level")
+    parser.add_argument("user", help="name of the user whose team will play")
+    parser.add_argument("level", help="name of the level to play")
+    parser.add_argument("-c", "--campaign", help="name of the campaign containing the level", default="Maelstrom")
+    parser.add_argument("-n", "--encounters", help="how many encounters to play", type=int, default=10000)
+    parser.add_argument("-w", "--workers", help="how many processes to use, defaults to the number of CPUs", type=int)
+    parser.add_argument("-s", "--seed", help="seed to reproduce a previous simulation", type=int)
+    args = parser.parse_args()
+
+    try:
+        summary = simulate(args.user, args.campaign, args.level, args.encounters, args.workers, seed=args.seed)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f'{summary.encounters} encounters, {summary.unfinished} unfinished, seed {summary.seed}')
+    print(f'win rate:   {summary.win_rate:.3f} (95% CI {summary.win_rate_interval[0]:.3f} - {summary.win_rate_interval[1]:.3f})')
+    print(f'mean turns: {summary.mean_turns:.2f} (95% CI {summary.mean_turns_interval[0]:.2f} - {summary.mean_turns_interval[1]:.2f})')
+
+if __name__ == "__main__":
+    main()